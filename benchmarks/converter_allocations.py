@@ -0,0 +1,95 @@
+"""Compare the memory blocks and time taken by making a new RGB to HSL converter for
+each conversion against sharing a single converter.
+
+The "fresh instance" conversion is the one the color factories and the color names
+storage used before: `RGBToHSLConverter().convert(rgb)`. The "shared instance"
+conversion uses the same converter for every color.
+
+Usage: python -m benchmarks.converter_allocations [AMOUNT_OF_COLORS]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+from harmony import convertions, core
+
+DEFAULT_AMOUNT_OF_COLORS = 100_000
+AMOUNT_OF_KEPT_CONVERTERS = 10_000
+MAXIMUM_RGB_VALUE = 255
+
+
+def generate_colors(amount_of_colors: int) -> List[core.RGB]:
+    """Return random RGB colors"""
+    randomizer = random.Random(0)
+
+    return [
+        core.RGB(
+            red=randomizer.randint(0, MAXIMUM_RGB_VALUE),
+            green=randomizer.randint(0, MAXIMUM_RGB_VALUE),
+            blue=randomizer.randint(0, MAXIMUM_RGB_VALUE),
+        )
+        for _ in range(amount_of_colors)
+    ]
+
+
+def measure_blocks_per_converter() -> float:
+    """Return the memory blocks still allocated by each converter kept alive"""
+    tracemalloc.start()
+    blocks_before = sum(
+        stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+    )
+    converters = [
+        convertions.RGBToHSLConverter() for _ in range(AMOUNT_OF_KEPT_CONVERTERS)
+    ]
+    blocks_after = sum(
+        stat.count for stat in tracemalloc.take_snapshot().statistics("filename")
+    )
+    tracemalloc.stop()
+    del converters
+
+    return (blocks_after - blocks_before) / AMOUNT_OF_KEPT_CONVERTERS
+
+
+def convert_with_fresh_instance(rgb: core.RGB) -> core.HSL:
+    return convertions.RGBToHSLConverter().convert(rgb)
+
+
+def measure_conversion(
+    colors: List[core.RGB], convert: Callable[[core.RGB], core.HSL]
+) -> str:
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    for rgb in colors:
+        convert(rgb)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (
+        f"{elapsed / len(colors) * 1_000_000:.2f} µs/conversion, "
+        + f"{peak:,} bytes peak"
+    )
+
+
+def main() -> None:
+    amount_of_colors = (
+        int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_AMOUNT_OF_COLORS
+    )
+    colors = generate_colors(amount_of_colors)
+
+    print(f"blocks kept per converter: {measure_blocks_per_converter():.1f}")
+
+    for conversion_name, convert in (
+        ("fresh instance", convert_with_fresh_instance),
+        ("shared instance", convertions.RGBToHSLConverter().convert),
+    ):
+        print(f"{conversion_name}: {measure_conversion(colors, convert)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Compare the colors per second of the HSL to RGB converters.
+
+The "scalar" converter is the `HSLToRGBConverter`, which converts the colors one by
+one, as the color factories do. The "vectorized" converter is the
+`HSLArrayToRGBConverter`, which converts all of them in a single pass.
+
+Usage: python -m benchmarks.hsl_to_rgb_conversion [AMOUNT_OF_COLORS]
+"""
+
+import random
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from harmony import convertions, core
+
+DEFAULT_AMOUNT_OF_COLORS = 1_000_000
+MAXIMUM_PERCENTAGE = 100
+
+
+def generate_hsls(amount_of_colors: int) -> List[core.HSL]:
+    """Return random HSLs with the precision of the ones read from the text files"""
+    randomizer = random.Random(0)
+
+    return [
+        core.HSL(
+            randomizer.randrange(core.MAXIMUM_HUE_VALUE),
+            randomizer.randint(0, MAXIMUM_PERCENTAGE) / MAXIMUM_PERCENTAGE,
+            randomizer.randint(0, MAXIMUM_PERCENTAGE) / MAXIMUM_PERCENTAGE,
+        )
+        for _ in range(amount_of_colors)
+    ]
+
+
+def measure_scalar_colors_per_second(hsls: List[core.HSL]) -> float:
+    start = time.perf_counter()
+
+    for hsl in hsls:
+        convertions.HSL_TO_RGB_CONVERTER.convert(hsl)
+
+    return len(hsls) / (time.perf_counter() - start)
+
+
+def measure_vectorized_colors_per_second(hsls: List[core.HSL]) -> float:
+    hsl_arrays = convertions.HSLArrays(
+        np.array([hsl.hue for hsl in hsls]),
+        np.array([hsl.saturation for hsl in hsls]),
+        np.array([hsl.luminosity for hsl in hsls]),
+    )
+    start = time.perf_counter()
+    convertions.HSLArrayToRGBConverter().convert(hsl_arrays)
+
+    return len(hsls) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    amount_of_colors = (
+        int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_AMOUNT_OF_COLORS
+    )
+    hsls = generate_hsls(amount_of_colors)
+
+    print(f"scalar: {measure_scalar_colors_per_second(hsls):,.0f} colors/s")
+    print(f"vectorized: {measure_vectorized_colors_per_second(hsls):,.0f} colors/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compare the lines per second of the plain text line readers.
+
+The "strategies" reader is the one `PlainTextFileReading` used before: each reading
+strategy is asked whether it matches the line and the first one that does reads it.
+The "single pass" reader is the `PlainTextLineParser`.
+
+Usage: python -m benchmarks.plain_text_parsing [AMOUNT_OF_LINES]
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Type
+
+from harmony import core, core_services
+from harmony.core import exceptions, interfaces
+
+DEFAULT_AMOUNT_OF_LINES = 1_000_000
+MAXIMUM_RGB_VALUE = 255
+
+
+def generate_lines(amount_of_lines: int) -> Iterator[str]:
+    """Yield random lines in every format supported by the text files"""
+    randomizer = random.Random(0)
+
+    for line_number in range(amount_of_lines):
+        red, green, blue = (randomizer.randint(0, MAXIMUM_RGB_VALUE) for _ in range(3))
+        line_format = line_number % 3
+
+        if line_format == 0:
+            yield f"#{red:02x}{green:02x}{blue:02x} Color {line_number}\n"
+        elif line_format == 1:
+            yield f"rgb({red}, {green}, {blue}) Color {line_number}\n"
+        else:
+            yield f"hsl({red}, {green % 101}%, {blue % 101}%) Color {line_number}\n"
+
+
+def get_reading_strategies() -> Iterator[Type[interfaces.StringReadingStrategy]]:
+    yield core_services.HexcodeTextReading
+    yield core_services.RGBTextReading
+    yield core_services.HSLTextReading
+
+
+def read_with_strategies(line: str) -> core.Color:
+    for strategy in get_reading_strategies():
+        if strategy.match_pattern(line):
+            return strategy().read(line)
+
+    raise exceptions.InvalidColorException(line + " does not match any valid format")
+
+
+def measure_lines_per_second(
+    file_path: Path, read_line: Callable[[str], core.Color]
+) -> float:
+    start = time.perf_counter()
+
+    with file_path.open("r") as colors_file:
+        amount_of_lines = sum(
+            1 for _ in map(read_line, (line.replace("\n", "") for line in colors_file))
+        )
+
+    return amount_of_lines / (time.perf_counter() - start)
+
+
+def main() -> None:
+    amount_of_lines = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_AMOUNT_OF_LINES
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = Path(directory).joinpath("colors.txt")
+
+        with file_path.open("w", encoding="utf8") as colors_file:
+            colors_file.writelines(generate_lines(amount_of_lines))
+
+        for reader_name, read_line in (
+            ("strategies", read_with_strategies),
+            ("single pass", core_services.PlainTextLineParser().parse),
+        ):
+            print(
+                f"{reader_name}: "
+                + f"{measure_lines_per_second(file_path, read_line):,.0f} lines/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+from typing import List
+
+import numpy as np
+
 from harmony import convertions, core, data_access
 
 
@@ -18,8 +22,8 @@ class ColorFactory:
         )
 
     def __get_description_from_hexcode(self, hexcode: str) -> str:
-        return data_access.ColorNamesStorage().get_color_name_by_hsl(
-            self.__get_hsl_from_hexcode(hexcode)
+        return data_access.ColorNamesStorage().get_color_name_by_rgb(
+            core.RGBUtils.get_rgb_from_hexcode(hexcode)
         )
 
     def make_from_hexcode(self, hexcode: str, description: str) -> core.Color:
@@ -41,7 +45,7 @@ class ColorFactory:
         )
 
     def __get_hsl_from_hexcode(self, hexcode: str) -> core.HSL:
-        return convertions.RGBToHSLConverter().convert(
+        return convertions.convert_rgb_to_hsl(
             core.RGBUtils.get_rgb_from_hexcode(hexcode)
         )
 
@@ -57,8 +61,44 @@ class ColorFactory:
         return self.make_from_rgb(rgb, self.__get_description_from_rgb(rgb))
 
     def __get_description_from_rgb(self, rgb: core.RGB) -> str:
-        return data_access.ColorNamesStorage().get_color_name_by_hsl(
-            convertions.RGBToHSLConverter().convert(rgb)
+        return data_access.ColorNamesStorage().get_color_name_by_rgb(rgb)
+
+    def make_many_from_rgb_array_with_auto_label(
+        self, rgb_array: np.ndarray
+    ) -> List[core.Color]:
+        """Make many `Color` objects from an array of RGB values with self-generated
+        descriptions, converting them in a single vectorized pass when there are many
+
+        Args:
+            rgb_array (np.ndarray): (N, 3) array with the red, green and blue components
+
+        Returns:
+            List[core.Color]: the resulting colors, in the same order
+        """
+        rgbs = [core.RGB(*components) for components in rgb_array.tolist()]
+
+        if not convertions.must_convert_in_batch(rgbs):
+            return [self.make_from_rgb_with_auto_label(rgb) for rgb in rgbs]
+
+        hsl = convertions.RGBArrayToHSLConverter().convert(rgb_array)
+
+        return [
+            self.__make_from_rgb_and_hsl(rgb, core.HSL(hue, saturation, luminosity))
+            for rgb, hue, saturation, luminosity in zip(
+                rgbs,
+                hsl.hue.tolist(),
+                hsl.saturation.tolist(),
+                hsl.luminosity.tolist(),
+            )
+        ]
+
+    def __make_from_rgb_and_hsl(self, rgb: core.RGB, hsl: core.HSL) -> core.Color:
+        return core.Color(
+            rgb=rgb,
+            hsl=hsl,
+            hexcode=core.HexcodeUtils.get_hexcode_from_rgb(rgb),
+            original_format=core.ColorFormat.RGB,
+            description=self.__get_description_from_rgb(rgb),
         )
 
     def make_from_rgb(self, rgb: core.RGB, description: str) -> core.Color:
@@ -73,7 +113,7 @@ class ColorFactory:
         """
         return core.Color(
             rgb=rgb,
-            hsl=convertions.RGBToHSLConverter().convert(rgb),
+            hsl=convertions.convert_rgb_to_hsl(rgb),
             hexcode=core.HexcodeUtils.get_hexcode_from_rgb(rgb),
             original_format=core.ColorFormat.RGB,
             description=description,
@@ -102,15 +142,12 @@ class ColorFactory:
         Returns:
             core.Color: the resulting color
         """
+        rgb = convertions.HSL_TO_RGB_CONVERTER.convert(hsl)
+
         return core.Color(
-            rgb=convertions.HSLToRGBConverter().convert(hsl),
+            rgb=rgb,
             hsl=hsl,
-            hexcode=self.__get_hexcode_from_hsl(hsl),
+            hexcode=core.HexcodeUtils.get_hexcode_from_rgb(rgb),
             original_format=core.ColorFormat.HSL,
             description=description,
         )
-
-    def __get_hexcode_from_hsl(self, hsl: core.HSL) -> str:
-        return core.HexcodeUtils.get_hexcode_from_rgb(
-            convertions.HSLToRGBConverter().convert(hsl)
-        )
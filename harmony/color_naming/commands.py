@@ -0,0 +1,85 @@
+from typing import List
+
+import rich
+import typer
+from rich.progress import Progress
+
+from harmony import core, data_access
+from harmony.color_naming.constants import NameTableCommandArguments
+from harmony.color_naming.services import LookupTableVerification
+
+
+def nametable(
+    rebuild: bool = NameTableCommandArguments.rebuild,
+    verify: bool = NameTableCommandArguments.verify,
+    sample: int = NameTableCommandArguments.sample,
+) -> None:
+    """Build the lookup table with the name of every RGB color, which makes naming
+    colors a single memory access"""
+    _build_lookup_table_if_needed(rebuild)
+
+    if verify:
+        _verify_lookup_table(sample)
+
+
+def _build_lookup_table_if_needed(rebuild: bool) -> None:
+    must_build = rebuild or data_access.get_color_names_lookup_table() is None
+
+    if must_build:
+        _build_lookup_table()
+
+
+def _build_lookup_table() -> None:
+    with Progress() as progress:
+        task = progress.add_task(
+            "Naming colors", total=data_access.ColorNamesLookupTable.COLORS_COUNT
+        )
+        try:
+            path = data_access.ColorNamesStorage().build_lookup_table(
+                lambda advance: progress.advance(task, advance)
+            )
+
+        except OSError as exception:
+            rich.print(
+                "[bright_red] ERROR: unable to save the color names lookup table: "
+                + str(exception)
+            )
+            raise typer.Exit(code=1) from exception
+
+    rich.print(f"[green]Color names lookup table saved to {path}")
+
+
+def _verify_lookup_table(sample: int) -> None:
+    lookup_table = _get_built_lookup_table()
+
+    with Progress() as progress:
+        task = progress.add_task(
+            "Verifying colors",
+            total=sample or data_access.ColorNamesLookupTable.COLORS_COUNT,
+        )
+        mismatches = LookupTableVerification(
+            lookup_table, lambda advance: progress.advance(task, advance)
+        ).verify(sample)
+
+    _report_mismatches(mismatches)
+
+
+def _get_built_lookup_table() -> data_access.ColorNamesLookupTable:
+    lookup_table = data_access.get_color_names_lookup_table()
+
+    if lookup_table is None:
+        rich.print("[bright_red] ERROR: the color names lookup table is not built")
+        raise typer.Exit(code=1)
+
+    return lookup_table
+
+
+def _report_mismatches(mismatches: List[core.RGB]) -> None:
+    if mismatches:
+        rich.print(
+            f"[bright_red] ERROR: {len(mismatches)} colors have a wrong name, "
+            + f"e.g. {mismatches[0]}"
+        )
+        raise typer.Exit(code=1)
+
+    rich.print("[green]All the verified colors have the right name")
@@ -0,0 +1,26 @@
+# pylint: disable=too-few-public-methods
+
+import typer
+
+
+class NameTableCommandArguments:
+    """Store the "nametable" command arguments"""
+
+    rebuild: bool = typer.Option(
+        False,
+        "--rebuild",
+        help="Build the lookup table again even if it is up to date",
+    )
+    verify: bool = typer.Option(
+        False,
+        "--verify",
+        help="Check that every name in the lookup table matches the name found "
+        + "searching the color names",
+    )
+    sample: int = typer.Option(
+        100000,
+        "--sample",
+        min=0,
+        help="Amount of random colors checked by --verify. With 0 the whole RGB cube "
+        + "is checked, which takes more than half an hour",
+    )
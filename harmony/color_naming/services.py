@@ -0,0 +1,75 @@
+import itertools
+import random
+from typing import Callable, Iterable, Iterator, List
+
+from harmony import convertions, core, data_access
+
+VERIFICATION_SEED = 0
+VERIFICATION_BATCH_SIZE = 1000
+
+
+class LookupTableVerification:
+    """Compare the names in the lookup table with the ones found searching the color
+    names index"""
+
+    def __init__(
+        self,
+        lookup_table: data_access.ColorNamesLookupTable,
+        on_progress: Callable[[int], None] = lambda advance: None,
+    ) -> None:
+        self._lookup_table = lookup_table
+        self._on_progress = on_progress
+        self._storage = data_access.ColorNamesStorage()
+
+    def verify(self, sample: int) -> List[core.RGB]:
+        """Verify the colors of the lookup table
+
+        Args:
+            sample (int): amount of random colors to check, or 0 for checking the
+            whole RGB cube
+
+        Returns:
+            List[RGB]: colors whose name in the lookup table is different
+        """
+        return [
+            rgb
+            for colors in self._iterate_batches(sample)
+            for rgb in self._verify_batch(colors)
+        ]
+
+    def _verify_batch(self, colors: List[core.RGB]) -> List[core.RGB]:
+        mismatches = [rgb for rgb in colors if not self._is_name_correct(rgb)]
+        self._on_progress(len(colors))
+
+        return mismatches
+
+    def _is_name_correct(self, rgb: core.RGB) -> bool:
+        return data_access.get_color_names_index().get_name(
+            self._lookup_table.get_name_index(rgb)
+        ) == self._storage.get_color_name_by_hsl(
+            convertions.RGB_TO_HSL_CONVERTER.convert(rgb)
+        )
+
+    @classmethod
+    def _iterate_batches(cls, sample: int) -> Iterator[List[core.RGB]]:
+        """Yield the colors to check in lists of `VERIFICATION_BATCH_SIZE`"""
+        colors = iter(cls._yield_colors(sample))
+
+        return iter(lambda: list(itertools.islice(colors, VERIFICATION_BATCH_SIZE)), [])
+
+    @staticmethod
+    def _yield_colors(sample: int) -> Iterable[core.RGB]:
+        positions: Iterable[int] = (
+            range(data_access.ColorNamesLookupTable.COLORS_COUNT)
+            if sample == 0
+            else random.Random(VERIFICATION_SEED).sample(
+                range(data_access.ColorNamesLookupTable.COLORS_COUNT), sample
+            )
+        )
+
+        return (
+            core.RGB(
+                red=position >> 16, green=(position >> 8) & 0xFF, blue=position & 0xFF
+            )
+            for position in positions
+        )
@@ -12,6 +12,7 @@ from harmony.color_sorting.service_layer.services import (
 
 
 def sort(
+    *,
     file_path: Path = SortCommandArguments.file_path,
     sorting_algorithm: core.SortingStrategyName = (
         SortCommandArguments.sorting_algorithm
@@ -20,13 +21,15 @@ def sort(
     color_format: core.ColorFormat = core.CommonArguments.color_format,
     suffix: str = core.CommonArguments.suffix,
     generate_names: bool = core.CommonArguments.generate_names,
+    deduplication_key: core.DeduplicationKey = core.CommonArguments.deduplication_key,
+    workers: int = core.CommonArguments.workers,
 ) -> None:
     """Entry point for generating a file with the sorted colors"""
     colors = core_services.FileColorReader(
-        core_services.PlainTextFileReading(generate_names)
+        core_services.PlainTextFileReading(generate_names, deduplication_key, workers)
     ).extract_colors(file_path)
     sorted_colors = ColorSorter(make_sorting_strategy(sorting_algorithm)).sort(
-        set(colors), direction
+        colors, direction
     )
 
     final_file_path = core_services.PathGenerator(suffix).get_sorted_file_path(
@@ -1,8 +1,13 @@
 from functools import reduce
 from math import ceil, log
-from typing import List, Tuple, Union
+from typing import ClassVar, Dict, List, Tuple, Union
+
+import numpy as np
 
 from harmony import core
+from harmony.color_sorting.service_layer.hillbert_state_machines import (
+    HillbertStateMachine,
+)
 
 
 class HillbertIndexCalculator:
@@ -10,6 +15,11 @@ class HillbertIndexCalculator:
 
     # pylint: disable=too-many-locals,too-many-arguments,too-many-branches
 
+    # 255 * 255 is the biggest coordinate of a valid RGB, which fits in 16 bits
+    BITS_PER_COORDINATE = 16
+    NUMBER_OF_COORDINATES = 3
+    _state_machines: ClassVar[Dict[int, HillbertStateMachine]] = {}
+
     def calculate(self, rgb: core.RGB) -> int:
         """Calculate the Hillbert Curve index for the color passed
 
@@ -28,6 +38,75 @@ class HillbertIndexCalculator:
             [x_coodinate, y_coordinate, z_coordinate]
         )
 
+    def calculate_many(self, rgb_array: np.ndarray) -> np.ndarray:
+        """Calculate the Hillbert Curve index of many colors at once.
+
+        Every color is calculated with the same bit depth, 16 bits unless some
+        component is bigger than 255, walking a precomputed state machine with
+        vectorized integer operations. Leading zero chunks do not change the index, so
+        it is the same got with `calculate`
+
+        Args:
+            rgb_array (np.ndarray): (N, 3) array with the red, green and blue integer
+            components
+
+        Returns:
+            np.ndarray: Hillbert Curve index of each color
+        """
+        coordinates = np.asarray(rgb_array, dtype=np.int64) * core.MAXIMUM_RGB_VALUE
+
+        return self._get_state_machine(
+            self._get_bit_depth(coordinates)
+        ).calculate_indices(coordinates)
+
+    def _get_bit_depth(self, coordinates: np.ndarray) -> int:
+        if coordinates.size == 0:
+            return self.BITS_PER_COORDINATE
+
+        return max(self.BITS_PER_COORDINATE, int(coordinates.max()).bit_length())
+
+    def _get_state_machine(self, bits: int) -> HillbertStateMachine:
+        if bits not in self._state_machines:
+            self._state_machines[bits] = self._make_state_machine(bits)
+
+        return self._state_machines[bits]
+
+    def _make_state_machine(self, bits: int) -> HillbertStateMachine:
+        mask: int = 2**self.NUMBER_OF_COORDINATES - 1
+        states: Dict[Tuple[int, int], int] = {}
+        pending = [self._get_start_and_end_indices(bits, self.NUMBER_OF_COORDINATES)]
+        transitions: List[List[Tuple[int, Tuple[int, int]]]] = []
+
+        while pending:
+            start, end = pending.pop()
+
+            if (start, end) in states:
+                continue
+
+            states[(start, end)] = len(transitions)
+            transitions.append([])
+
+            for chunk in range(mask + 1):
+                gray_bit = self._get_gray_decoded(start, mask, chunk)
+                child = self._get_child_start_and_end_indices(
+                    start, end, mask, gray_bit
+                )
+                transitions[-1].append((gray_bit, child))
+                pending.append(child)
+
+        return HillbertStateMachine(
+            bits,
+            0,
+            np.array(
+                [[gray_bit for gray_bit, _ in row] for row in transitions],
+                dtype=np.int64,
+            ),
+            np.array(
+                [[states[child] for _, child in row] for row in transitions],
+                dtype=np.int64,
+            ),
+        )
+
     def _get_int_from_hillbert_coordinates(
         self, coordinates: List[Union[int, float]]
     ) -> int:
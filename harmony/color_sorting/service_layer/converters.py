@@ -27,14 +27,14 @@ class RGBtoHSVConverter(interfaces.ColorFormatConverter[core.RGB, core.HSV]):
 
     @staticmethod
     def _calculate_hue_from_rgb(rgb: core.RGB) -> float:
-        return convertions.HueCalculator().calculate(core.HueData.from_rgb(rgb))
+        return convertions.HUE_CALCULATOR.calculate(core.HueData.from_rgb(rgb))
 
     def _calculate_saturation_from_rgb(self, rgb: core.RGB) -> float:
         return self._calculate_saturation_from_hue_data(core.HueData.from_rgb(rgb))
 
     @staticmethod
     def _calculate_saturation_from_hue_data(hue_data: core.HueData) -> float:
-        return convertions.SaturationCalculator().calculate(
+        return convertions.SATURATION_CALCULATOR.calculate(
             core.SaturationData.from_hue_data(hue_data)
         )
 
@@ -84,6 +84,10 @@ class RGBToLuminosityConverter(
         return 0.068 * blue
 
 
+RGB_TO_HSV_CONVERTER = RGBtoHSVConverter()
+RGB_TO_LUMINOSITY_CONVERTER = RGBToLuminosityConverter()
+
+
 class RGBToSteppedHueValueAndSteppedLuminosity(
     interfaces.ColorFormatConverter[core.RGB, core.SteppedHueValuePerceivedLuminosity]
 ):
@@ -96,7 +100,7 @@ class RGBToSteppedHueValueAndSteppedLuminosity(
     def convert(
         self, original_format: core.RGB
     ) -> core.SteppedHueValuePerceivedLuminosity:
-        luminosity = RGBToLuminosityConverter().convert(original_format).value
+        luminosity = RGB_TO_LUMINOSITY_CONVERTER.convert(original_format).value
         stepped_value = self._get_stepped_value(original_format)
 
         if self._is_stepped_hue_odd(original_format):
@@ -114,7 +118,7 @@ class RGBToSteppedHueValueAndSteppedLuminosity(
         return round(self._get_hue_as_decimal_times_steps(self._get_hue(rgb)))
 
     def _get_hue(self, rgb: core.RGB) -> float:
-        return convertions.HueCalculator().calculate(core.HueData.from_rgb(rgb))
+        return convertions.HUE_CALCULATOR.calculate(core.HueData.from_rgb(rgb))
 
     def _get_hue_as_decimal_times_steps(self, hue) -> float:
         return core.division_between(hue, core.MAXIMUM_HUE_VALUE) * self._steps
@@ -123,4 +127,4 @@ class RGBToSteppedHueValueAndSteppedLuminosity(
         return round(self._get_value_times_steps(rgb))
 
     def _get_value_times_steps(self, rgb: core.RGB) -> float:
-        return RGBtoHSVConverter().calculate_value_from_rgb(rgb) * self._steps
+        return RGBtoHSVConverter.calculate_value_from_rgb(rgb) * self._steps
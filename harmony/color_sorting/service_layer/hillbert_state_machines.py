@@ -0,0 +1,55 @@
+from typing import Iterator, NamedTuple
+
+import numpy as np
+
+
+class HillbertStateMachine(NamedTuple):
+    """Transitions of the Hillbert Curve index calculation for 3 coordinates of
+    `bits` bits.
+
+    Each state is a pair of start and end corners of the current sub-cube, so the
+    Gray-decoded value of a chunk and the state for the next chunk only depend on the
+    current state and on the chunk
+    """
+
+    bits: int
+    initial_state: int
+    gray_decoded: np.ndarray
+    next_states: np.ndarray
+
+    def calculate_indices(self, coordinates: np.ndarray) -> np.ndarray:
+        """Walk the transitions with the chunks of every row of coordinates at once
+
+        Args:
+            coordinates (np.ndarray): (N, 3) array with integer coordinates of at
+            most `bits` bits
+
+        Returns:
+            np.ndarray: Hillbert Curve index of each row
+        """
+        states = np.full(len(coordinates), self.initial_state)
+        indices = np.zeros(len(coordinates), dtype=np.int64)
+
+        for chunks in self._iterate_chunks(coordinates):
+            indices = (indices << coordinates.shape[1]) | (
+                self.gray_decoded[states, chunks]
+            )
+            states = self.next_states[states, chunks]
+
+        return indices
+
+    def _iterate_chunks(self, coordinates: np.ndarray) -> Iterator[np.ndarray]:
+        """Yield the chunks of the coordinates, from the most significant bit"""
+        return (
+            self._get_chunks_for_bit(coordinates, bit)
+            for bit in range(self.bits - 1, -1, -1)
+        )
+
+    @staticmethod
+    def _get_chunks_for_bit(coordinates: np.ndarray, bit: int) -> np.ndarray:
+        chunks = np.zeros(len(coordinates), dtype=np.int64)
+
+        for coordinate_index in range(coordinates.shape[1]):
+            chunks = (chunks << 1) | ((coordinates[:, coordinate_index] >> bit) & 1)
+
+        return chunks
@@ -1,4 +1,4 @@
-from typing import Dict, List, Set, Tuple, Type
+from typing import Dict, Iterable, List, Tuple, Type
 
 from harmony import core
 from harmony.color_sorting.constants import Directions
@@ -24,7 +24,7 @@ class ColorSorter:
         self.strategy = strategy
 
     def sort(
-        self, colors_to_sort: Set[core.Color], direction: Directions
+        self, colors_to_sort: Iterable[core.Color], direction: Directions
     ) -> Tuple[core.Color, ...]:
         """Sort a list of colors
 
@@ -40,7 +40,7 @@ class ColorSorter:
         }[direction]()
 
     def _sort_backwards(
-        self, colors_to_sort: Set[core.Color]
+        self, colors_to_sort: Iterable[core.Color]
     ) -> Tuple[core.Color, ...]:
         colors_sorted_backwards: List[core.Color] = []
 
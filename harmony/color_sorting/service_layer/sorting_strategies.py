@@ -1,21 +1,17 @@
 from abc import ABC, abstractmethod
-from typing import Any, Set, Tuple
+from typing import Callable, Iterable, Tuple
+
+import numpy as np
 
 from harmony import convertions, core
 from harmony.color_sorting.service_layer.calculators import HillbertIndexCalculator
-from harmony.color_sorting.service_layer.converters import (
-    RGBtoHSVConverter,
-    RGBToLuminosityConverter,
-    RGBToSteppedHueValueAndSteppedLuminosity,
-)
-from harmony.typing import Number
 
 
 class SortingStrategy(ABC):
     """Interface for sorting strategies"""
 
     @abstractmethod
-    def sort(self, colors_to_sort: Set[core.Color]) -> Tuple[core.Color, ...]:
+    def sort(self, colors_to_sort: Iterable[core.Color]) -> Tuple[core.Color, ...]:
         """Sort a list of colors
 
         Args:
@@ -26,178 +22,147 @@ class SortingStrategy(ABC):
         """
 
 
-class RGBSorting(SortingStrategy):
-    """Sorting strategy based on RGB values"""
+KeyArraysMaker = Callable[[np.ndarray], Tuple[np.ndarray, ...]]
 
-    def sort(self, colors_to_sort: Set[core.Color]) -> Tuple[core.Color, ...]:
-        """Sort a list of colors based on their RGB
 
-        Args:
-            colors_to_sort (List[Color]): the colors to be sorted
+def sort_by_key_arrays(
+    colors_to_sort: Iterable[core.Color], make_key_arrays: KeyArraysMaker
+) -> Tuple[core.Color, ...]:
+    """Sort the colors by keys calculated for all of them in a single batch pass, one
+    array per key, with a stable `lexsort`
 
-        Returns:
-            Tuple[Color, ...]: sorted set of colors
-        """
-        colors_list = list(colors_to_sort)
-        colors_list.sort(key=lambda color: self._get_rgb_values(color.rgb))
-        return tuple(colors_list)
+    Args:
+        colors_to_sort (Iterable[Color]): the colors to be sorted
+        make_key_arrays (KeyArraysMaker): returns the sorting keys of the RGB array
+        passed, the most significant first
+
+    Returns:
+        Tuple[Color, ...]: sorted set of colors
+    """
+    colors_list = list(colors_to_sort)
+    key_arrays = make_key_arrays(
+        convertions.make_rgb_array([color.rgb for color in colors_list])
+    )
+
+    return tuple(colors_list[index] for index in np.lexsort(key_arrays[::-1]).tolist())
+
+
+def _get_float_as_int(values: np.ndarray) -> np.ndarray:
+    """Return the float values the way `ColorFormatModel` compares them"""
+    return np.trunc(values * 100).astype(np.int64)
+
+
+def _round_to_int(values: np.ndarray) -> np.ndarray:
+    """Round the values half to even, like the builtin `round`"""
+    return np.rint(values).astype(np.int64)
+
+
+class RGBSorting(SortingStrategy):
+    """Sorting strategy based on RGB values"""
+
+    def sort(self, colors_to_sort: Iterable[core.Color]) -> Tuple[core.Color, ...]:
+        return sort_by_key_arrays(colors_to_sort, self._make_key_arrays)
 
-    def _get_rgb_values(self, rgb: core.RGB) -> Tuple[int, int, int]:
-        return (rgb.red, rgb.green, rgb.blue)
+    def _make_key_arrays(self, rgb_array: np.ndarray) -> Tuple[np.ndarray, ...]:
+        return rgb_array[:, 0], rgb_array[:, 1], rgb_array[:, 2]
 
 
 class HSVSorting(SortingStrategy):
     """Sorting strategy based on HSV"""
 
-    def sort(self, colors_to_sort: Set[core.Color]) -> Tuple[core.Color, ...]:
-        """Sort a list of colors based on their HSV
+    def sort(self, colors_to_sort: Iterable[core.Color]) -> Tuple[core.Color, ...]:
+        return sort_by_key_arrays(colors_to_sort, self._make_key_arrays)
 
-        Args:
-            colors_to_sort (List[Color]): the colors to be sorted
+    def _make_key_arrays(self, rgb_array: np.ndarray) -> Tuple[np.ndarray, ...]:
+        hsv = convertions.RGBArrayConverter().convert(rgb_array).hsv
 
-        Returns:
-            Tuple[Color, ...]: sorted set of colors
-        """
-        colors_list = list(colors_to_sort)
-        colors_list.sort(key=lambda color: self._get_hsv_values(color.rgb))
-        return tuple(colors_list)
-
-    def _get_hsv_values(self, rgb: core.RGB):
-        return RGBtoHSVConverter().convert(rgb)
+        return (
+            hsv.hue,
+            _get_float_as_int(hsv.saturation),
+            _get_float_as_int(hsv.value),
+        )
 
 
 class HSLSorting(SortingStrategy):
     """Sorting strategy based on HSL"""
 
-    def sort(self, colors_to_sort: Set[core.Color]) -> Tuple[core.Color, ...]:
-        """Sort a list of colors based on their HSL
-
-        Args:
-            colors_to_sort (List[Color]): the colors to be sorted
+    def sort(self, colors_to_sort: Iterable[core.Color]) -> Tuple[core.Color, ...]:
+        return sort_by_key_arrays(colors_to_sort, self._make_key_arrays)
 
-        Returns:
-            Tuple[Color, ...]: sorted set of colors
-        """
-        colors_list = list(colors_to_sort)
-        colors_list.sort(key=lambda color: self._get_hsl_values(color.rgb))
-        return tuple(colors_list)
+    def _make_key_arrays(self, rgb_array: np.ndarray) -> Tuple[np.ndarray, ...]:
+        hsl = convertions.RGBArrayConverter().convert(rgb_array).hsl
 
-    def _get_hsl_values(self, rgb: core.RGB) -> core.ColorFormatModel:
-        return convertions.RGBToHSLConverter().convert(rgb)
+        return (
+            hsl.hue,
+            _get_float_as_int(hsl.saturation),
+            _get_float_as_int(hsl.luminosity),
+        )
 
 
 class LuminositySorting(SortingStrategy):
     """Sorting strategy based on perceived luminosity"""
 
-    def sort(self, colors_to_sort: Set[core.Color]) -> Tuple[core.Color, ...]:
-        """Sort a list of colors based on their perceived luminosity
-
-        Args:
-            colors_to_sort (List[Color]): the colors to be sorted
-
-        Returns:
-            Tuple[Color, ...]: sorted set of colors
-        """
-        colors_list = list(colors_to_sort)
-        colors_list.sort(key=lambda color: self._get_luminosity(color.rgb))
-        return tuple(colors_list)
-
-    def _get_luminosity(self, rgb: core.RGB) -> float:
-        return self._get_perceived_luminosity_from_rgb(rgb).value
+    def sort(self, colors_to_sort: Iterable[core.Color]) -> Tuple[core.Color, ...]:
+        return sort_by_key_arrays(colors_to_sort, self._make_key_arrays)
 
-    def _get_perceived_luminosity_from_rgb(
-        self, rgb: core.RGB
-    ) -> core.PerceivedLuminosity:
-        return RGBToLuminosityConverter().convert(rgb)
+    def _make_key_arrays(self, rgb_array: np.ndarray) -> Tuple[np.ndarray, ...]:
+        return (convertions.RGBArrayConverter().convert(rgb_array).luminosity,)
 
 
 class StepSorting(SortingStrategy):
-    """Step sorting strategy"""
+    """Step sorting strategy, based on the HSV and the perceived luminosity but
+    splitting the colors by steps"""
 
     STEPS = 8
 
-    def sort(self, colors_to_sort: Set[core.Color]) -> Tuple[core.Color, ...]:
-        """Sort a list of colors based on their HSL and luminosity but splitting them by
-        steps
-
-        Args:
-            colors_to_sort (List[Color]): the colors to be sorted
-
-        Returns:
-            Tuple[Color, ...]: sorted set of colors
-        """
-        colors_list = list(colors_to_sort)
-        colors_list.sort(
-            key=lambda color: self._get_stepped_hsv_and_luminosity_values(color.rgb)
-        )
-        return tuple(colors_list)
+    def sort(self, colors_to_sort: Iterable[core.Color]) -> Tuple[core.Color, ...]:
+        return sort_by_key_arrays(colors_to_sort, self._make_key_arrays)
 
-    def _get_stepped_hsv_and_luminosity_values(
-        self, rgb: core.RGB
-    ) -> Tuple[Number, ...]:
-        hsv = RGBtoHSVConverter().convert(rgb)
+    def _make_key_arrays(self, rgb_array: np.ndarray) -> Tuple[np.ndarray, ...]:
+        color_arrays = convertions.RGBArrayConverter().convert(rgb_array)
 
         return (
-            round(core.division_between(hsv.hue, core.MAXIMUM_HUE_VALUE) * self.STEPS),
-            self._get_perceived_luminosity_value_from_rgb(rgb),
-            round(hsv.value * self.STEPS),
+            _round_to_int(color_arrays.hsv.hue / core.MAXIMUM_HUE_VALUE * self.STEPS),
+            color_arrays.luminosity,
+            _round_to_int(color_arrays.hsv.value * self.STEPS),
         )
 
-    @staticmethod
-    def _get_perceived_luminosity_value_from_rgb(rgb: core.RGB) -> float:
-        return core.PerceivedLuminosity.from_color_format_model(
-            RGBToLuminosityConverter().convert(rgb)
-        ).value
-
-    @staticmethod
-    def _is_hsv(value: Any) -> bool:
-        return isinstance(value, core.HSV)
-
 
 class AlternatedStepSorting(SortingStrategy):
-    """Alternated step sorting strategy"""
+    """Alternated step sorting strategy, which reverses the value and the luminosity of
+    every other hue step"""
 
     STEPS = 8
 
-    def sort(self, colors_to_sort: Set[core.Color]) -> Tuple[core.Color, ...]:
-        """Sort a list of colors based on their HSL and luminosity but splitting them by
-        steps
+    def sort(self, colors_to_sort: Iterable[core.Color]) -> Tuple[core.Color, ...]:
+        return sort_by_key_arrays(colors_to_sort, self._make_key_arrays)
 
-        Args:
-            colors_to_sort (List[Color]): the colors to be sorted
+    def _make_key_arrays(self, rgb_array: np.ndarray) -> Tuple[np.ndarray, ...]:
+        color_arrays = convertions.RGBArrayConverter().convert(rgb_array)
+        stepped_hue = _round_to_int(
+            color_arrays.hue / core.MAXIMUM_HUE_VALUE * self.STEPS
+        )
+        is_stepped_hue_odd = stepped_hue % 2 == 1
 
-        Returns:
-            Tuple[Color, ...]: sorted set of colors
-        """
-        colors_list = list(colors_to_sort)
-        colors_list.sort(
-            key=lambda color: self._get_stepped_alternatively_hsv_and_luminosity_values(
-                color.rgb
-            )
+        return (
+            stepped_hue,
+            self._reverse_where(
+                is_stepped_hue_odd, _round_to_int(color_arrays.hsv.value * self.STEPS)
+            ),
+            _get_float_as_int(
+                self._reverse_where(is_stepped_hue_odd, color_arrays.luminosity)
+            ),
         )
-        return tuple(colors_list)
 
-    def _get_stepped_alternatively_hsv_and_luminosity_values(
-        self, rgb: core.RGB
-    ) -> core.ColorFormatModel:
-        return RGBToSteppedHueValueAndSteppedLuminosity(self.STEPS).convert(rgb)
+    def _reverse_where(self, condition: np.ndarray, values: np.ndarray) -> np.ndarray:
+        return np.where(condition, self.STEPS - values, values)
 
 
 class HillbertSorting(SortingStrategy):
     """Hillbert Curve sorting strategy"""
 
-    def sort(self, colors_to_sort: Set[core.Color]) -> Tuple[core.Color, ...]:
-        """Sort a list of colors using the Hillbert Curve algorithm
-
-        Args:
-            colors_to_sort (List[Color]): the colors to be sorted
-
-        Returns:
-            Tuple[Color, ...]: sorted set of colors
-        """
-        colors_list = list(colors_to_sort)
-        colors_list.sort(key=lambda color: self._get_hillbert_index(color.rgb))
-        return tuple(colors_list)
+    def sort(self, colors_to_sort: Iterable[core.Color]) -> Tuple[core.Color, ...]:
+        return sort_by_key_arrays(colors_to_sort, self._make_key_arrays)
 
-    def _get_hillbert_index(self, rgb: core.RGB):
-        return HillbertIndexCalculator().calculate(rgb)
+    def _make_key_arrays(self, rgb_array: np.ndarray) -> Tuple[np.ndarray, ...]:
+        return (HillbertIndexCalculator().calculate_many(rgb_array),)
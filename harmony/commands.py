@@ -1,5 +1,5 @@
 import pathlib
-from typing import Tuple
+from typing import Optional, Tuple
 
 import rich
 
@@ -23,6 +23,8 @@ class FromTxtCommandUtils:
     def convert_from_txt_file(
         self,
         file_path: pathlib.Path,
+        deduplication_key: core.DeduplicationKey = core.DeduplicationKey.COLOR,
+        workers: int = 1,
     ) -> None:
         """Convert the text file using the passed writing strategy
 
@@ -30,9 +32,13 @@ class FromTxtCommandUtils:
             file_path (Path): file to be converted
             writing_strategy (WritingStrategy): strategy to use when writing the new
             file
+            deduplication_key (DeduplicationKey): what makes two colors duplicated
+            workers (int): amount of processes parsing the chunks of the file
         """
-        core_services.ColorWriter(self.__writing_strategy).write(
-            self._get_colors_tuple_for_convertion(file_path),
+        core_services.ColorWriter(self.__writing_strategy).write_chunks(
+            core_services.PlainTextFileReading(
+                self.__must_generate_color_names, deduplication_key, workers
+            ).iterate_chunks(file_path),
             core_services.PathGenerator(self.__suffix).get_path_with_extension(
                 file_path, self.__writing_strategy.EXTENSION
             ),
@@ -45,15 +51,6 @@ class FromTxtCommandUtils:
             )
         )
 
-    def _get_colors_tuple_for_convertion(
-        self, colors_file: pathlib.Path
-    ) -> Tuple[core.Color, ...]:
-        return tuple(
-            core_services.FileColorReader(
-                core_services.PlainTextFileReading(self.__must_generate_color_names)
-            ).extract_colors(colors_file)
-        )
-
 
 class ToTxtCommandUtils:
     """Helping methods for entrypoints that convert some file to a Harmony file"""
@@ -68,10 +65,22 @@ class ToTxtCommandUtils:
         self.__color_format = color_format
         self.__recursively = recursively
 
-    def convert_to_txt_file(self, path: pathlib.Path) -> None:
-        """Convert some file to a Harmony file"""
+    def convert_to_txt_file(
+        self,
+        path: pathlib.Path,
+        reading_options: core_services.DirectoryReadingOptions = (
+            core_services.DEFAULT_DIRECTORY_READING_OPTIONS
+        ),
+    ) -> None:
+        """Convert some file to a Harmony file
+
+        Args:
+            path (Path): file, or directory with the files, to be converted
+            reading_options (DirectoryReadingOptions): how the files of a directory
+            are read
+        """
         colors: Tuple[core.Color, ...] = core_services.extract_colors_from_path(
-            path, self.__reading_strategy, self.__recursively
+            path, self.__reading_strategy, self.__recursively, reading_options
         )
         final_file_path = core_services.PathGenerator("").get_path_with_extension(
             path, core_services.PlainTextWriting.EXTENSION
@@ -80,3 +89,21 @@ class ToTxtCommandUtils:
             core_services.PlainTextWriting(self.__color_format)
         ).write(colors, final_file_path)
         rich.print(f"[green]Colors extracted and saved to {final_file_path}")
+
+
+def make_extraction_cache(
+    use_cache: bool, hash_contents: bool
+) -> Optional[core_services.ExtractionCache]:
+    """Make the extraction cache kept in the cache directory, if it must be used
+
+    Args:
+        use_cache (bool): whether the colors extracted are cached
+        hash_contents (bool): whether the contents of the files are hashed
+
+    Returns:
+        Optional[ExtractionCache]: the cache, or `None` when it must not be used
+    """
+    if not use_cache:
+        return None
+
+    return core_services.ExtractionCache.from_cache_directory(hash_contents)
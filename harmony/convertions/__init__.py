@@ -1,3 +1,35 @@
-from harmony.convertions.calculators import HueCalculator, SaturationCalculator
-from harmony.convertions.hsl_to_rgb_converter import HSLToRGBConverter
-from harmony.convertions.rgb_to_hsl_converter import RGBToHSLConverter
+from harmony.convertions.array_converters import (
+    ColorArrays,
+    HSLArrays,
+    HSLArrayToRGBConverter,
+    HSVArrays,
+    RGBArrayConverter,
+    RGBArrayToHSLConverter,
+    iterate_rgb_cube_slices,
+    make_rgb_array,
+    make_rgb_cube_slice,
+    must_convert_in_batch,
+)
+from harmony.convertions.calculators import (
+    HUE_CALCULATOR,
+    SATURATION_CALCULATOR,
+    HueCalculator,
+    SaturationCalculator,
+)
+from harmony.convertions.conversion_cache import (
+    DEFAULT_CONVERSION_CACHE_MODE,
+    CachedRGBToHSLConverter,
+    ConversionCacheStatistics,
+    convert_rgb_to_hsl,
+    get_rgb_to_hsl_converter,
+    set_conversion_cache_mode,
+)
+from harmony.convertions.hsl_lookup_table import RGBToHSLLookupTable
+from harmony.convertions.hsl_to_rgb_converter import (
+    HSL_TO_RGB_CONVERTER,
+    HSLToRGBConverter,
+)
+from harmony.convertions.rgb_to_hsl_converter import (
+    RGB_TO_HSL_CONVERTER,
+    RGBToHSLConverter,
+)
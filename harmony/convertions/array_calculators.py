@@ -0,0 +1,85 @@
+import functools
+from typing import NamedTuple, Tuple
+
+import numpy as np
+
+from harmony import core
+
+# red, green and blue components of many colors, between 0 and 1
+Percentages = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class ComponentsRange(NamedTuple):
+    """Store the biggest and the smallest RGB component of many colors, and the
+    difference between them"""
+
+    biggest: np.ndarray
+    smallest: np.ndarray
+    difference: np.ndarray
+
+    @classmethod
+    def from_percentages(cls, percentages: Percentages) -> "ComponentsRange":
+        """Find the range of the components of the passed colors"""
+        biggest = functools.reduce(np.maximum, percentages)
+        smallest = functools.reduce(np.minimum, percentages)
+
+        return cls(biggest, smallest, biggest - smallest)
+
+
+def get_components_as_percentage(components: np.ndarray) -> Percentages:
+    """Return the red, green and blue of the (N, 3) array of components passed, between
+    0 and 1"""
+    percentages = components / core.MAXIMUM_RGB_VALUE
+    return percentages[:, 0], percentages[:, 1], percentages[:, 2]
+
+
+def calculate_hue(
+    percentages: Percentages, components_range: ComponentsRange
+) -> np.ndarray:
+    """Calculate the hue of many colors the same way `HueCalculator` does, returning
+    it as a float"""
+    return np.where(
+        _is_almost_zero(components_range.difference),
+        0.0,
+        _calculate_hue_sector_position(percentages, components_range) * 60,
+    )
+
+
+def _calculate_hue_sector_position(
+    percentages: Percentages, components_range: ComponentsRange
+) -> np.ndarray:
+    red, green, blue = percentages
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            _is_almost_zero(red - components_range.biggest),
+            np.mod((green - blue) / components_range.difference, 6),
+            np.where(
+                _is_almost_zero(green - components_range.biggest),
+                (blue - red) / components_range.difference + 2,
+                (red - green) / components_range.difference + 4,
+            ),
+        )
+
+
+def calculate_saturation(components_range: ComponentsRange) -> np.ndarray:
+    """Calculate the saturation of many colors the same way `SaturationCalculator`
+    does"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(
+            _is_almost_zero(components_range.biggest),
+            0.0,
+            components_range.difference / components_range.biggest,
+        )
+
+
+def calculate_perceived_luminosity(components: np.ndarray) -> np.ndarray:
+    """Calculate the perceived luminosity of many colors the same way
+    `RGBToLuminosityConverter` does"""
+    return np.sqrt(
+        0.241 * components[:, 0] + 0.691 * components[:, 1] + 0.068 * components[:, 2]
+    )
+
+
+def _is_almost_zero(values: np.ndarray) -> np.ndarray:
+    return np.abs(values) < core.FloatComparisonTolerance.SEVEN_DECIMAL_PLACES.value
@@ -0,0 +1,195 @@
+from typing import Iterator, NamedTuple, Sequence, Sized
+
+import numpy as np
+
+from harmony import core
+from harmony.convertions.array_calculators import (
+    ComponentsRange,
+    calculate_hue,
+    calculate_perceived_luminosity,
+    calculate_saturation,
+    get_components_as_percentage,
+)
+from harmony.convertions.hsl_to_rgb_converter import (
+    HUE_SECTOR_COMPONENTS,
+    HUE_SECTOR_SIZE,
+)
+from harmony.core import exceptions
+
+MINIMUM_COLORS_FOR_BATCH_CONVERSION = 16
+
+
+class HSLArrays(NamedTuple):
+    """Store the HSL components of many colors, one array per component"""
+
+    hue: np.ndarray
+    saturation: np.ndarray
+    luminosity: np.ndarray
+
+
+class HSVArrays(NamedTuple):
+    """Store the HSV components of many colors, one array per component"""
+
+    hue: np.ndarray
+    saturation: np.ndarray
+    value: np.ndarray
+
+
+class ColorArrays(NamedTuple):
+    """Store the HSL, HSV and perceived luminosity of many colors, along with their
+    hue before it is truncated or rounded"""
+
+    hue: np.ndarray
+    hsl: HSLArrays
+    hsv: HSVArrays
+    luminosity: np.ndarray
+
+
+class RGBArrayConverter:
+    """Converts an array of RGB values into HSL, HSV and perceived luminosity arrays in
+    a single vectorized pass.
+
+    The operations are the same done by the scalar converters, in the same order, so
+    the results are identical to converting the colors one by one, including the
+    truncation of the HSL hue and the rounding of the HSV hue
+    """
+
+    def convert(self, rgb_array: np.ndarray) -> ColorArrays:
+        """Convert the RGB values passed
+
+        Args:
+            rgb_array (np.ndarray): (N, 3) array with the red, green and blue components
+
+        Returns:
+            ColorArrays: hue, HSL, HSV and perceived luminosity of each color
+        """
+        components = np.asarray(rgb_array, dtype=np.float64)
+        percentages = get_components_as_percentage(components)
+        components_range = ComponentsRange.from_percentages(percentages)
+
+        return self._make_color_arrays(
+            calculate_hue(percentages, components_range),
+            components_range,
+            calculate_perceived_luminosity(components),
+        )
+
+    @staticmethod
+    def _make_color_arrays(
+        hue: np.ndarray, components_range: ComponentsRange, luminosity: np.ndarray
+    ) -> ColorArrays:
+        saturation = calculate_saturation(components_range)
+
+        return ColorArrays(
+            hue,
+            HSLArrays(
+                np.trunc(hue).astype(np.int64),
+                saturation,
+                (components_range.biggest + components_range.smallest) / 2,
+            ),
+            HSVArrays(
+                np.rint(hue).astype(np.int64), saturation, components_range.biggest
+            ),
+            luminosity,
+        )
+
+
+class RGBArrayToHSLConverter:
+    """Converts an array of RGB values into HSL arrays in a single vectorized pass.
+
+    The operations are the same done by `RGBToHSLConverter`, in the same order, so the
+    results are identical to converting the colors one by one
+    """
+
+    def convert(self, rgb_array: np.ndarray) -> HSLArrays:
+        """Convert the RGB values passed to HSL
+
+        Args:
+            rgb_array (np.ndarray): (N, 3) array with the red, green and blue components
+
+        Returns:
+            HSLArrays: integer hue, saturation and luminosity of each color
+        """
+        return RGBArrayConverter().convert(rgb_array).hsl
+
+
+class HSLArrayToRGBConverter:
+    """Converts HSL arrays into an array of RGB values in a single vectorized pass.
+
+    The operations are the same done by `HSLToRGBConverter`, in the same order and
+    with the same rounding half to even, so the results are identical to converting
+    the colors one by one
+    """
+
+    def convert(self, hsl: HSLArrays) -> np.ndarray:
+        """Convert the HSL values passed to RGB
+
+        Args:
+            hsl (HSLArrays): hue, saturation and luminosity of each color
+
+        Raises:
+            InvalidColorFormatException: if any hue is not between 0 and 360
+
+        Returns:
+            np.ndarray: (N, 3) integer array with the red, green and blue components
+        """
+        hue = np.asarray(hsl.hue)
+
+        if not np.all((hue >= 0) & (hue < core.MAXIMUM_HUE_VALUE)):
+            raise exceptions.InvalidColorFormatException(
+                "Hue must be between 0 and 360"
+            )
+
+        components = _calculate_rgb_components(hsl)
+        sectors = (hue // HUE_SECTOR_SIZE).astype(np.intp)
+
+        return np.take_along_axis(
+            components, np.array(HUE_SECTOR_COMPONENTS, dtype=np.intp)[sectors], axis=1
+        )
+
+
+def _calculate_rgb_components(hsl: HSLArrays) -> np.ndarray:
+    luminosity = np.asarray(hsl.luminosity, dtype=np.float64)
+    variable_b = (1 - np.abs(luminosity * 2 - 1)) * hsl.saturation
+    variable_c = luminosity - variable_b / 2
+    variable_a = variable_b * (1 - np.abs(np.mod(hsl.hue / HUE_SECTOR_SIZE, 2) - 1))
+
+    return np.rint(
+        np.stack((variable_a + variable_c, variable_b + variable_c, variable_c), axis=1)
+        * core.MAXIMUM_RGB_VALUE
+    ).astype(np.int64)
+
+
+def make_rgb_array(rgbs: Sequence[core.RGB]) -> np.ndarray:
+    """Return an (N, 3) array with the components of the passed RGBs"""
+    return np.array(
+        [(rgb.red, rgb.green, rgb.blue) for rgb in rgbs], dtype=np.float64
+    ).reshape(-1, 3)
+
+
+def make_rgb_cube_slice(first_red: int, last_red: int) -> np.ndarray:
+    """Return an (N, 3) array with all the colors with red between `first_red` and
+    `last_red` (exclusive), in the order they are indexed in the lookup tables, by
+    `red << 16 | green << 8 | blue`"""
+    red, green, blue = np.meshgrid(
+        np.arange(first_red, last_red),
+        np.arange(core.MAXIMUM_RGB_VALUE + 1),
+        np.arange(core.MAXIMUM_RGB_VALUE + 1),
+        indexing="ij",
+    )
+
+    return np.stack((red.ravel(), green.ravel(), blue.ravel()), axis=1).astype(np.uint8)
+
+
+def iterate_rgb_cube_slices(reds_per_slice: int) -> Iterator[np.ndarray]:
+    """Yield the slices of the RGB cube with `reds_per_slice` reds each, which together
+    hold all the colors in the order they are indexed in the lookup tables"""
+    return (
+        make_rgb_cube_slice(first_red, first_red + reds_per_slice)
+        for first_red in range(0, core.MAXIMUM_RGB_VALUE + 1, reds_per_slice)
+    )
+
+
+def must_convert_in_batch(colors: Sized) -> bool:
+    """Return `True` when there are enough colors for the vectorized converters to be
+    faster than converting them one by one"""
+    return len(colors) >= MINIMUM_COLORS_FOR_BATCH_CONVERSION
@@ -6,8 +6,7 @@ from harmony import core
 class HueCalculator:
     """Provide method calculating the hue"""
 
-    def __init__(self):
-        self._logger = logging.getLogger(self.__class__.__name__)
+    _logger = logging.getLogger("HueCalculator")
 
     def calculate(self, data: core.HueData) -> float:
         """Calculate the hue for a color from the data passed
@@ -96,3 +95,8 @@ class SaturationCalculator:
             return data.difference_between_biggest_and_smallest / data.biggest_value
 
         return 0.0
+
+
+# the calculators hold no state, so the converters share these instances
+HUE_CALCULATOR = HueCalculator()
+SATURATION_CALCULATOR = SaturationCalculator()
@@ -0,0 +1,186 @@
+import functools
+import logging
+import os
+from typing import NamedTuple, Optional
+
+from harmony import core
+from harmony.convertions.hsl_lookup_table import RGBToHSLLookupTable
+from harmony.convertions.rgb_to_hsl_converter import RGB_TO_HSL_CONVERTER
+from harmony.core import interfaces
+from harmony.core.constants import CONVERSION_CACHE_ENVIRONMENT_VARIABLE
+
+DEFAULT_CONVERSION_CACHE_MODE = core.ConversionCacheMode.LRU
+
+
+class ConversionCacheStatistics(NamedTuple):
+    """Store how many conversions were found in the cache and how many were not"""
+
+    hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the fraction of the conversions found in the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class CachedRGBToHSLConverter(interfaces.ColorFormatConverter[core.RGB, core.HSL]):
+    """Converter to convert RGB to HSL that does not convert the same color twice.
+
+    In the "lru" mode, the last conversions are kept by the color packed as
+    `red << 16 | green << 8 | blue`. In the "table" mode, they are kept in the same
+    LRU cache, but the colors not in it are looked up in the memory-mapped
+    `RGBToHSLLookupTable`, which is built on the first use, instead of converted. In
+    the "off" mode, every color is converted again. The HSL returned is the
+    same `RGBToHSLConverter` returns in every mode
+    """
+
+    DEFAULT_MAXIMUM_SIZE = 1 << 16
+
+    def __init__(
+        self,
+        mode: core.ConversionCacheMode = DEFAULT_CONVERSION_CACHE_MODE,
+        maximum_size: int = DEFAULT_MAXIMUM_SIZE,
+        lookup_table: Optional[RGBToHSLLookupTable] = None,
+    ) -> None:
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._table_hits = 0
+        self._misses = 0
+        self._lookup_table = self._open_lookup_table(mode, lookup_table)
+        self._mode = (
+            core.ConversionCacheMode.LRU
+            if mode == core.ConversionCacheMode.TABLE and self._lookup_table is None
+            else mode
+        )
+        self._convert_packed_rgb = functools.lru_cache(maxsize=maximum_size)(
+            self._convert_unpacked_rgb
+        )
+
+    @property
+    def mode(self) -> core.ConversionCacheMode:
+        """Return the mode in use, which is "lru" when the table could not be used"""
+        return self._mode
+
+    def _open_lookup_table(
+        self,
+        mode: core.ConversionCacheMode,
+        lookup_table: Optional[RGBToHSLLookupTable],
+    ) -> Optional[RGBToHSLLookupTable]:
+        if mode != core.ConversionCacheMode.TABLE:
+            return None
+
+        return self._open_or_build_lookup_table(
+            lookup_table or RGBToHSLLookupTable.from_cache_directory()
+        )
+
+    def _open_or_build_lookup_table(
+        self, lookup_table: RGBToHSLLookupTable
+    ) -> Optional[RGBToHSLLookupTable]:
+        try:
+            is_opened = self._build_lookup_table_if_missing(lookup_table)
+
+        except OSError as exception:
+            self._logger.warning(
+                "Unable to build the RGB to HSL lookup table, using the LRU cache "
+                + "instead: %(exception)s",
+                {"exception": exception},
+            )
+            return None
+
+        return lookup_table if is_opened else None
+
+    def _build_lookup_table_if_missing(self, lookup_table: RGBToHSLLookupTable) -> bool:
+        """Open the table, building it first when it cannot be opened, and return
+        whether it is opened"""
+        if lookup_table.open():
+            return True
+
+        self._logger.info("Building the RGB to HSL lookup table")
+        lookup_table.build()
+        return lookup_table.open()
+
+    def convert(self, original_format: core.RGB) -> core.HSL:
+        if not self._must_cache(original_format):
+            self._misses += 1
+            return RGB_TO_HSL_CONVERTER.convert(original_format)
+
+        return self._convert_packed_rgb(
+            (original_format.red << 16)
+            | (original_format.green << 8)
+            | original_format.blue
+        )
+
+    def _must_cache(self, rgb: core.RGB) -> bool:
+        return self._mode != core.ConversionCacheMode.OFF and self._is_packable(rgb)
+
+    @staticmethod
+    def _is_packable(rgb: core.RGB) -> bool:
+        return all(
+            isinstance(component, int) and 0 <= component <= core.MAXIMUM_RGB_VALUE
+            for component in (rgb.red, rgb.green, rgb.blue)
+        )
+
+    def _convert_unpacked_rgb(self, packed_rgb: int) -> core.HSL:
+        rgb = core.RGB(packed_rgb >> 16, (packed_rgb >> 8) & 0xFF, packed_rgb & 0xFF)
+
+        if self._lookup_table is None:
+            return RGB_TO_HSL_CONVERTER.convert(rgb)
+
+        # the colors looked up in the table are not converted again either
+        self._table_hits += 1
+        return self._lookup_table.get_hsl(rgb)
+
+    def get_statistics(self) -> ConversionCacheStatistics:
+        """Return how many conversions were found in the cache so far
+
+        Returns:
+            ConversionCacheStatistics: hits and misses of the cache
+        """
+        cache_info = self._convert_packed_rgb.cache_info()
+
+        return ConversionCacheStatistics(
+            cache_info.hits + self._table_hits,
+            self._misses + cache_info.misses - self._table_hits,
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_rgb_to_hsl_converter() -> CachedRGBToHSLConverter:
+    """Return the process-wide cached RGB to HSL converter.
+
+    Its mode is read from the `HARMONY_CONVERSION_CACHE` environment variable, so the
+    worker processes use the same mode of the command
+
+    Returns:
+        CachedRGBToHSLConverter: converter shared by the color factories
+    """
+    mode_name = os.environ.get(
+        CONVERSION_CACHE_ENVIRONMENT_VARIABLE, DEFAULT_CONVERSION_CACHE_MODE.value
+    )
+
+    try:
+        return CachedRGBToHSLConverter(core.ConversionCacheMode(mode_name))
+
+    except ValueError:
+        logging.getLogger(__name__).warning(
+            "Unknown conversion cache mode '%(mode)s', using the LRU cache instead",
+            {"mode": mode_name},
+        )
+        return CachedRGBToHSLConverter()
+
+
+def set_conversion_cache_mode(mode: core.ConversionCacheMode) -> None:
+    """Make the process-wide RGB to HSL converter, and the one of the worker processes
+    started afterwards, cache the conversions in the passed mode
+
+    Args:
+        mode (ConversionCacheMode): how the conversions are cached
+    """
+    os.environ[CONVERSION_CACHE_ENVIRONMENT_VARIABLE] = mode.value
+    get_rgb_to_hsl_converter.cache_clear()
+
+
+def convert_rgb_to_hsl(rgb: core.RGB) -> core.HSL:
+    """Convert the passed RGB to HSL through the process-wide conversion cache"""
+    return get_rgb_to_hsl_converter().convert(rgb)
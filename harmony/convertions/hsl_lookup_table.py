@@ -0,0 +1,144 @@
+import logging
+import struct
+from pathlib import Path
+from typing import BinaryIO, NamedTuple, Optional
+
+import numpy as np
+
+from harmony import core
+from harmony.convertions.array_converters import (
+    RGBArrayToHSLConverter,
+    iterate_rgb_cube_slices,
+)
+
+
+class _HSLTables(NamedTuple):
+    """Memory-mapped tables of an opened `RGBToHSLLookupTable`"""
+
+    hues: memoryview
+    saturations: "memoryview[float]"
+    luminosities: "memoryview[float]"
+
+
+class RGBToHSLLookupTable:
+    """Dense tables with the HSL of each of the 2^24 RGB colors.
+
+    The file has a header with a magic and the format version, followed by one 16 bit
+    unsigned integer per color with its hue, indexed by `red << 16 | green << 8 |
+    blue`. The saturation and the luminosity only depend on the biggest and the
+    smallest components, so they follow as two tables of 64 bit floats indexed by
+    `biggest << 8 | smallest`. It is memory-mapped when opened, so converting a color
+    is three array accesses
+    """
+
+    MAGIC = b"HARMONYH"
+    # bump it whenever the layout or the RGB to HSL conversion change
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct("<8sI4x")
+    COLORS_COUNT = 1 << 24
+    COMPONENTS_PAIRS_COUNT = 1 << 16
+    HUE_TYPE = np.dtype("<u2")
+    COMPONENT_TYPE = np.dtype("<f8")
+    REDS_PER_STEP = 16
+
+    def __init__(self, path: Path) -> None:
+        self._table_file = core.LookupTableFile(
+            path,
+            self.COLORS_COUNT * self.HUE_TYPE.itemsize
+            + 2 * self.COMPONENTS_PAIRS_COUNT * self.COMPONENT_TYPE.itemsize,
+        )
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._tables: Optional[_HSLTables] = None
+
+    @property
+    def path(self) -> Path:
+        """Return the path to the table file"""
+        return self._table_file.path
+
+    @classmethod
+    def from_cache_directory(cls) -> "RGBToHSLLookupTable":
+        """Make the table kept in the cache directory"""
+        return cls(
+            core.CacheUtils.get_cache_directory().joinpath(
+                f"rgb-to-hsl-v{cls.FORMAT_VERSION}.lut"
+            )
+        )
+
+    def open(self) -> bool:
+        """Memory-map the table file
+
+        Returns:
+            bool: `False` when the file is missing, corrupted or from other version
+        """
+        try:
+            tables = self._table_file.open(self._make_header())
+
+        except (OSError, ValueError) as exception:
+            self._logger.debug(
+                "Unable to open the RGB to HSL lookup table: %(exception)s",
+                {"exception": exception},
+            )
+            return False
+
+        self._tables = None if tables is None else self._split_tables(tables)
+        return self._tables is not None
+
+    def _make_header(self) -> bytes:
+        return self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION)
+
+    def _split_tables(self, tables: memoryview) -> _HSLTables:
+        saturations_start = self.COLORS_COUNT * self.HUE_TYPE.itemsize
+        luminosities_start = (
+            saturations_start
+            + self.COMPONENTS_PAIRS_COUNT * self.COMPONENT_TYPE.itemsize
+        )
+
+        return _HSLTables(
+            tables[:saturations_start].cast("H"),
+            tables[saturations_start:luminosities_start].cast("d"),
+            tables[luminosities_start:].cast("d"),
+        )
+
+    def get_hsl(self, rgb: core.RGB) -> core.HSL:
+        """Return the HSL of the passed RGB, the same `RGBToHSLConverter` returns"""
+        if self._tables is None:
+            raise core.exceptions.InvalidFileException(
+                "The RGB to HSL lookup table is not opened"
+            )
+
+        components_pair = (max(rgb.red, rgb.green, rgb.blue) << 8) | min(
+            rgb.red, rgb.green, rgb.blue
+        )
+
+        return core.HSL(
+            self._tables.hues[(rgb.red << 16) | (rgb.green << 8) | rgb.blue],
+            self._tables.saturations[components_pair],
+            self._tables.luminosities[components_pair],
+        )
+
+    def build(self) -> None:
+        """Build the table file, converting every RGB color"""
+        self._table_file.build(self._make_header(), self._write_tables)
+
+    def _write_tables(self, table_file: BinaryIO) -> None:
+        self._write_hues(table_file)
+        self._write_saturations_and_luminosities(table_file)
+
+    def _write_hues(self, table_file: BinaryIO) -> None:
+        table_file.writelines(
+            RGBArrayToHSLConverter()
+            .convert(rgb_array)
+            .hue.astype(self.HUE_TYPE)
+            .tobytes()
+            for rgb_array in iterate_rgb_cube_slices(self.REDS_PER_STEP)
+        )
+
+    def _write_saturations_and_luminosities(self, table_file: BinaryIO) -> None:
+        # the pairs with the smallest bigger than the biggest are never looked up
+        biggest, smallest = np.divmod(np.arange(self.COMPONENTS_PAIRS_COUNT), 256)
+        hsl = RGBArrayToHSLConverter().convert(
+            np.stack((biggest, smallest, smallest), axis=1)
+        )
+
+        table_file.write(hsl.saturation.astype(self.COMPONENT_TYPE).tobytes())
+        table_file.write(hsl.luminosity.astype(self.COMPONENT_TYPE).tobytes())
@@ -2,41 +2,43 @@ import logging
 from typing import Any, Dict
 
 from harmony import core
-from harmony.convertions.calculators import HueCalculator, SaturationCalculator
+from harmony.convertions.calculators import HUE_CALCULATOR, SATURATION_CALCULATOR
 from harmony.core import interfaces
 
 
 class RGBToHSLConverter(interfaces.ColorFormatConverter[core.RGB, core.HSL]):
     """Converter to convert RGB to HSL"""
 
-    def __init__(self):
-        self._logger = logging.getLogger(self.__class__.__name__)
-        self.make_hsl_from_rgb = core.deprecate(self.convert)
+    _logger = logging.getLogger("RGBToHSLConverter")
 
     def convert(self, original_format: core.RGB) -> core.HSL:
-        self._logger.info(
+        core.log_lazily(
+            self._logger,
+            logging.INFO,
             self._get_converted_log_message(),
-            self._get_converted_log_data(original_format),
+            lambda: self._get_converted_log_data(original_format),
         )
 
         return core.HSL(
             self._get_hue_from_rgb_as_integer(original_format),
-            SaturationCalculator().calculate(
+            SATURATION_CALCULATOR.calculate(
                 core.SaturationData.from_rgb(original_format)
             ),
             self.calculate_luminosity(original_format),
         )
 
+    make_hsl_from_rgb = core.deprecate(convert)
+
     def _get_hue_from_rgb_as_integer(self, rgb: core.RGB) -> int:
         return int(self._get_hue_from_rgb(rgb))
 
     @staticmethod
     def _get_hue_from_rgb(rgb: core.RGB) -> float:
-        return HueCalculator().calculate(core.HueData.from_rgb(rgb))
+        return HUE_CALCULATOR.calculate(core.HueData.from_rgb(rgb))
 
     @staticmethod
     def _get_saturation_from_rgb(rgb: core.RGB) -> float:
-        return SaturationCalculator().calculate(core.SaturationData.from_rgb(rgb))
+        return SATURATION_CALCULATOR.calculate(core.SaturationData.from_rgb(rgb))
 
     @staticmethod
     def _get_converted_log_message() -> str:
@@ -50,8 +52,8 @@ class RGBToHSLConverter(interfaces.ColorFormatConverter[core.RGB, core.HSL]):
             "red": rgb.red,
             "green": rgb.green,
             "blue": rgb.blue,
-            "hue": HueCalculator().calculate(core.HueData.from_rgb(rgb)),
-            "saturation": SaturationCalculator().calculate(
+            "hue": HUE_CALCULATOR.calculate(core.HueData.from_rgb(rgb)),
+            "saturation": SATURATION_CALCULATOR.calculate(
                 core.SaturationData.from_rgb(rgb)
             ),
             "luminosity": self.calculate_luminosity(rgb),
@@ -84,3 +86,7 @@ class RGBToHSLConverter(interfaces.ColorFormatConverter[core.RGB, core.HSL]):
             rgb.green_as_percentage,
             rgb.blue_as_percentage,
         )
+
+
+# the conversion cache and the color naming convert through this instance
+RGB_TO_HSL_CONVERTER = RGBToHSLConverter()
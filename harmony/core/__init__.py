@@ -1,12 +1,17 @@
 from harmony.core.calculation_models import HueData, SaturationData
+from harmony.core.color_models import Color, ColorData
+from harmony.core.concurrency_utils import map_in_order
 from harmony.core.constants import (
     MAXIMUM_8_BIT_SIGNED_INTEGER_VALUE,
     MAXIMUM_8_BIT_UNSIGNED_INTEGER_VALUE,
     MAXIMUM_HUE_VALUE,
+    MAXIMUM_RGB_VALUE,
     MINIMUM_8_BIT_SIGNED_INTEGER_VALUE,
     ByteOrder,
     ColorFormat,
     CommonArguments,
+    ConversionCacheMode,
+    DeduplicationKey,
     DefaultParameters,
     FloatComparisonTolerance,
     ImageModesForPIL,
@@ -16,6 +21,13 @@ from harmony.core.constants import (
 )
 from harmony.core.core_utils import deprecate
 from harmony.core.db_models import HSL, ColorName
+from harmony.core.deduplication_utils import (
+    extract_unique_colors,
+    extract_unique_values_from_iterable,
+    iterate_unique_colors,
+    iterate_unique_values,
+)
+from harmony.core.lookup_table_files import LookupTableFile, TablesWriter
 from harmony.core.math_utils import (
     absolute_difference_between,
     are_almost_equal,
@@ -26,19 +38,20 @@ from harmony.core.math_utils import (
 from harmony.core.models import (
     HSV,
     RGB,
-    Color,
     ColorFormatModel,
     PerceivedLuminosity,
     SteppedHueValuePerceivedLuminosity,
 )
+from harmony.core.tracing import enable_tracing, log_lazily
 from harmony.core.utils import (
     BytesUtils,
+    CacheUtils,
     HexcodeUtils,
     RegexHelper,
     ResourceUtils,
     RGBUtils,
     does_file_name_have_extension,
     extract_extension_from_file_path,
-    extract_unique_values_from_iterable,
     get_extension_from_file_path,
+    read_file_header,
 )
@@ -0,0 +1,104 @@
+import dataclasses
+from typing import Any, Dict, Mapping
+
+import pydantic
+
+from harmony.core import constants
+from harmony.core.models import HSL, RGB
+
+
+@dataclasses.dataclass(eq=False)
+class Color:
+    """Model for the color.
+
+    It is a plain slotted record, so making colors in the pipelines does not pay any
+    validation. Use `Color.parse_obj` for making colors from untrusted data
+    """
+
+    __slots__ = ("description", "hexcode", "hsl", "original_format", "rgb")
+
+    rgb: RGB
+    hsl: HSL
+    hexcode: str
+    original_format: constants.ColorFormat
+    description: str
+
+    @classmethod
+    def parse_obj(cls, data: Mapping[str, Any]) -> "Color":
+        """Make a color from untrusted data, validating it
+
+        Args:
+            data (Mapping[str, Any]): values of the color fields
+
+        Raises:
+            pydantic.ValidationError: when some value is not valid
+
+        Returns:
+            Color: the color made
+        """
+        return ColorData.parse_obj(data).make_color()
+
+    def dict(self) -> Dict[str, Any]:
+        """Return the fields of the color"""
+        return {
+            field.name: getattr(self, field.name) for field in dataclasses.fields(self)
+        }
+
+    @property
+    def rgb_red(self) -> int:
+        """Return the value of red from the RGB of the color"""
+        return self.rgb.red
+
+    @property
+    def rgb_green(self) -> int:
+        """Return the value of green from the RGB of the color"""
+        return self.rgb.green
+
+    @property
+    def rgb_blue(self) -> int:
+        """Return the value of blue from the RGB of the color"""
+        return self.rgb.blue
+
+    @property
+    def hsl_hue(self) -> int:
+        """Return the value of hue from the HSL of the color"""
+        return self.hsl.hue
+
+    @property
+    def hsl_saturation(self) -> float:
+        """Return the value of saturation from the HSL of the color"""
+        return self.hsl.saturation
+
+    @property
+    def hsl_luminosity(self) -> float:
+        """Return the value of luminosity from the HSL of the color"""
+        return self.hsl.luminosity
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, self.__class__):
+            return self.rgb == other.rgb and self.hsl == other.hsl
+
+        raise TypeError(f"'==' not supported between {type(other)} and {type(self)}")
+
+    def __hash__(self) -> int:
+        return hash((self.rgb_red, self.rgb_green, self.rgb_blue))
+
+
+class ColorData(pydantic.BaseModel):  # pylint: disable=no-member
+    """Validation model for the data of a color coming from untrusted input"""
+
+    rgb: RGB
+    hsl: HSL
+    hexcode: str
+    original_format: constants.ColorFormat
+    description: str
+
+    def make_color(self) -> Color:
+        """Make the color with the validated data"""
+        return Color(
+            rgb=self.rgb,
+            hsl=self.hsl,
+            hexcode=self.hexcode,
+            original_format=self.original_format,
+            description=self.description,
+        )
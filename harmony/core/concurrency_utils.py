@@ -0,0 +1,36 @@
+import collections
+import itertools
+from concurrent import futures
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from harmony.typing import T
+
+R = TypeVar("R")
+
+
+def map_in_order(
+    executor: futures.Executor,
+    function: Callable[[T], R],
+    items: Iterable[T],
+    maximum_pending: int,
+) -> Iterator[R]:
+    """Lazily yield the results of `function` over the items, in the order of the
+    items, running it in the executor.
+
+    Up to `maximum_pending` items are submitted ahead of the result being yielded, so
+    the items are consumed, and the results are kept, only as fast as they are used
+    """
+    return _yield_in_order(
+        (executor.submit(function, item) for item in items), maximum_pending
+    )
+
+
+def _yield_in_order(
+    submitted: Iterator["futures.Future[R]"], maximum_pending: int
+) -> Iterator[R]:
+    # the items are only submitted when `submitted` is advanced
+    pending = collections.deque(itertools.islice(submitted, maximum_pending))
+
+    while pending:
+        yield pending.popleft().result()
+        pending.extend(itertools.islice(submitted, 1))
@@ -12,12 +12,15 @@ MAXIMUM_HUE_VALUE = 360
 MAXIMUM_8_BIT_UNSIGNED_INTEGER_VALUE = 255
 MAXIMUM_8_BIT_SIGNED_INTEGER_VALUE = 127
 MINIMUM_8_BIT_SIGNED_INTEGER_VALUE = -MAXIMUM_8_BIT_SIGNED_INTEGER_VALUE
+CACHE_DIRECTORY_ENVIRONMENT_VARIABLE = "HARMONY_CACHE_DIR"
+CONVERSION_CACHE_ENVIRONMENT_VARIABLE = "HARMONY_CONVERSION_CACHE"
 
 
 class Resources:
     """Constants for the package resources"""
 
     COLOR_NAMES_JSON = "color-names.json"
+    COLOR_NAMES_DATABASE = "color-names.bin"
 
 
 class DefaultParameters:
@@ -35,6 +38,23 @@ class ColorFormat(str, Enum):
     HSL = "hsl"
 
 
+class DeduplicationKey(str, Enum):
+    """Constants for what makes two colors duplicated"""
+
+    COLOR = "color"
+    RGB = "rgb"
+    RGB_DESCRIPTION = "rgb-description"
+    EXACT = "exact"
+
+
+class ConversionCacheMode(str, Enum):
+    """Constants for how the RGB to HSL convertions are cached"""
+
+    OFF = "off"
+    LRU = "lru"
+    TABLE = "table"
+
+
 class ByteOrder(str, Enum):
     """Constants for the byte orders"""
 
@@ -112,6 +132,50 @@ class CommonArguments:
         "-s",
         help="Suffix to add to the name of the output file",
     )
+    deduplication_key: DeduplicationKey = typer.Option(
+        DeduplicationKey.COLOR.value,
+        "--dedup-key",
+        case_sensitive=False,
+        help="What makes two colors duplicated: the same RGB and HSL (color), the "
+        + "same RGB (rgb), the same RGB and description (rgb-description) or every "
+        + "field equal (exact). Only the first of the duplicated colors is kept",
+    )
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Amount of processes reading the colors. With more than one, big text "
+        + "files are split into chunks of lines that are parsed in parallel, and the "
+        + "files of a directory are read in parallel",
+    )
+    chunk_size: int = typer.Option(
+        1,
+        "--chunk-size",
+        min=1,
+        help="Amount of files of a directory each process reads at a time, when "
+        + "reading them with more than one worker",
+    )
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        min=1,
+        help="Amount of threads checking the files of a directory and reading them, "
+        + "when reading them with a single worker",
+    )
+    use_cache: bool = typer.Option(
+        True,
+        "--no-cache",
+        help="Disables the cache of the colors extracted from the files of a "
+        + "directory, so every file is read again",
+    )
+    hash_contents: bool = typer.Option(
+        False,
+        "--hash-contents",
+        help="Compare the SHA-256 of the files of a directory with the cached ones "
+        + "when their modification time changed, so files only touched are not read "
+        + "again",
+    )
     recursively: bool = typer.Option(
         False,
         "--recursively",
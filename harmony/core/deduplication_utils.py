@@ -0,0 +1,98 @@
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Set
+
+from harmony.core.color_models import Color
+from harmony.core.constants import DeduplicationKey
+from harmony.typing import T
+
+
+def extract_unique_values_from_iterable(
+    iterable: Iterable[T], key: Optional[Callable[[T], Hashable]] = None
+) -> List[T]:
+    """Returns the unique values from the passed iterable without losing its order.
+
+    The first occurrence of each value is kept. When `key` is passed, two values are
+    the same when their keys are equal
+    """
+    if key is None:
+        return list(dict.fromkeys(iterable))
+
+    return list(_keep_first_by_key(iterable, key).values())
+
+
+def _keep_first_by_key(
+    iterable: Iterable[T], key: Callable[[T], Hashable]
+) -> Dict[Hashable, T]:
+    uniques: Dict[Hashable, T] = {}
+
+    for value in iterable:
+        uniques.setdefault(key(value), value)
+
+    return uniques
+
+
+def iterate_unique_values(
+    iterable: Iterable[T], key: Callable[[T], Hashable]
+) -> Iterator[T]:
+    """Lazily yield the first occurrence of each value of the passed iterable.
+
+    Only the keys of the values already yielded are kept, so the memory used grows with
+    the amount of unique values instead of the size of the iterable
+    """
+    seen_keys: Set[Hashable] = set()
+
+    return (value for value in iterable if _add_unseen_key(seen_keys, key(value)))
+
+
+def _add_unseen_key(seen_keys: Set[Hashable], value_key: Hashable) -> bool:
+    is_unseen = value_key not in seen_keys
+    seen_keys.add(value_key)
+
+    return is_unseen
+
+
+DEDUPLICATION_KEYS: Dict[DeduplicationKey, Callable[[Color], Hashable]] = {
+    DeduplicationKey.COLOR: lambda color: (color.rgb, color.hsl),
+    DeduplicationKey.RGB: lambda color: color.rgb,
+    DeduplicationKey.RGB_DESCRIPTION: lambda color: (color.rgb, color.description),
+    DeduplicationKey.EXACT: lambda color: (
+        color.rgb,
+        color.hsl,
+        color.hexcode,
+        color.original_format,
+        color.description,
+    ),
+}
+
+
+def extract_unique_colors(
+    colors: Iterable[Color], deduplication_key: DeduplicationKey
+) -> List[Color]:
+    """Returns the unique colors without losing their order, keeping the first of the
+    duplicated ones
+
+    Args:
+        colors (Iterable[Color]): colors to deduplicate
+        deduplication_key (DeduplicationKey): what makes two colors duplicated
+
+    Returns:
+        List[Color]: the unique colors
+    """
+    return extract_unique_values_from_iterable(
+        colors, DEDUPLICATION_KEYS[deduplication_key]
+    )
+
+
+def iterate_unique_colors(
+    colors: Iterable[Color], deduplication_key: DeduplicationKey
+) -> Iterator[Color]:
+    """Lazily yield the unique colors, in the same order `extract_unique_colors`
+    returns them
+
+    Args:
+        colors (Iterable[Color]): colors to deduplicate
+        deduplication_key (DeduplicationKey): what makes two colors duplicated
+
+    Returns:
+        Iterator[Color]: the unique colors
+    """
+    return iterate_unique_values(colors, DEDUPLICATION_KEYS[deduplication_key])
@@ -1,9 +1,11 @@
+import itertools
 import logging
 from abc import ABC, ABCMeta, abstractmethod
 from pathlib import Path
-from typing import Generic, Tuple, TypeVar
+from typing import Generic, Iterable, Sequence, Tuple, TypeVar
 
-from harmony.core.models import Color, ColorFormatModel
+from harmony.core.color_models import Color
+from harmony.core.models import ColorFormatModel
 
 
 class ColorReader(ABC):
@@ -28,6 +30,18 @@ class WritingStrategy(ABC):
             final_file_path (str): path to the new file
         """
 
+    def write_chunks(self, chunks: Iterable[Sequence[Color]], final_file_path: str):
+        """Write the colors to a new file as they arrive, chunk by chunk.
+
+        Override it on formats that can be written incrementally. By default, the
+        chunks are joined and the colors are written at once
+
+        Args:
+            chunks (Iterable[Sequence[Color]]): colors to be written, in chunks
+            final_file_path (str): path to the new file
+        """
+        self.write(tuple(itertools.chain.from_iterable(chunks)), final_file_path)
+
 
 T = TypeVar("T", bound=ColorFormatModel)
 K = TypeVar("K", bound=ColorFormatModel)
@@ -52,10 +66,35 @@ del T, K
 class FileReadingStrategy(ABC):
     """Interface for a object that extract a set of colors from a file"""
 
+    # bump it whenever the colors read from the same file change
+    READER_VERSION = 1
+
     @abstractmethod
     def read(self, file_path: Path) -> Tuple[Color, ...]:
         """Extract a set of colors from a given file"""
 
+    def can_read(self, file_path: Path) -> bool:
+        """Tell whether the file looks like one the strategy reads, by its extension or
+        its first bytes, without reading it whole. By default, every file is tried
+
+        Args:
+            file_path (Path): file to be checked
+
+        Returns:
+            bool: `False` when the file is surely not readable by the strategy
+        """
+        del file_path
+        return True
+
+    def get_cache_key(self) -> str:
+        """Return what tells the colors read by the strategy apart from the ones read
+        by other strategies, or by the same one with other options or versions
+
+        Returns:
+            str: key of the strategy for the extraction cache
+        """
+        return f"{self.__class__.__qualname__}:{self.READER_VERSION}"
+
 
 class StringReadingStrategy(ABC):
     """Interface for strategies that extract a color from a given string"""
@@ -81,12 +120,17 @@ class StringReadingStrategy(ABC):
     @classmethod
     def match_pattern(cls, property_value: str) -> bool:
         """Return True if the passed string can be processed by this strategy"""
-        if cls.do_match_pattern(property_value):
-            cls._get_logger().info("Value '%s' does match the pattern", property_value)
-            return True
+        does_match = cls.do_match_pattern(property_value)
+        logger = cls._get_logger()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Value '%s' does %smatch the pattern",
+                property_value,
+                "" if does_match else "not ",
+            )
 
-        cls._get_logger().info("Value '%s' does not match the pattern", property_value)
-        return False
+        return does_match
 
     @classmethod
     @abstractmethod
@@ -0,0 +1,72 @@
+import mmap
+import os
+import sys
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional
+
+TablesWriter = Callable[[BinaryIO], None]
+
+
+class LookupTableFile:
+    """File of a lookup table, with a header followed by the tables in little-endian
+    order.
+
+    The tables are memory-mapped when opened. The file is built in a temporary file
+    that replaces it at the end, so it is never read half written
+    """
+
+    def __init__(self, path: Path, tables_size: int) -> None:
+        self._path = path
+        self._tables_size = tables_size
+
+    @property
+    def path(self) -> Path:
+        """Return the path to the table file"""
+        return self._path
+
+    def open(self, header: bytes) -> Optional[memoryview]:
+        """Memory-map the table file
+
+        Args:
+            header (bytes): header the file must start with
+
+        Raises:
+            OSError: when the file cannot be opened or mapped
+            ValueError: when the file is empty
+
+        Returns:
+            Optional[memoryview]: the tables after the header, or `None` when the
+            file has other header or size
+        """
+        with self._path.open("rb") as table_file:
+            table_map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if not self._is_valid(table_map, header):
+            table_map.close()
+            return None
+
+        return memoryview(table_map)[len(header) :]
+
+    def _is_valid(self, table_map: mmap.mmap, header: bytes) -> bool:
+        return (
+            len(table_map) == len(header) + self._tables_size
+            and table_map[: len(header)] == header
+            and sys.byteorder == "little"
+        )
+
+    def build(self, header: bytes, write_tables: TablesWriter) -> None:
+        """Write the table file, creating the cache directory when it is missing
+
+        Args:
+            header (bytes): header written at the start of the file
+            write_tables (TablesWriter): writes the tables after the header
+        """
+        # the process id tells apart the files of workers building it at once
+        temporary_path = self._path.with_suffix(f".{os.getpid()}.tmp")
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+
+        with temporary_path.open("wb") as table_file:
+            table_file.write(header)
+            write_tables(table_file)
+
+        os.replace(temporary_path, self._path)
@@ -1,7 +1,17 @@
 import dataclasses
+import functools
 from abc import ABC
-from functools import total_ordering
-from typing import Any, Dict, List, Tuple, no_type_check
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    no_type_check,
+)
 
 import pydantic
 
@@ -9,61 +19,75 @@ from harmony.core import constants
 from harmony.typing import Number, T
 
 
-@total_ordering
+@functools.total_ordering
 class ColorFormatModel(ABC):
-    """Interface for the color format models"""
+    """Interface for the color format models.
+
+    The models are frozen and slotted, and the tuple used for comparing and hashing
+    them is built once, when they are made
+    """
+
+    __slots__ = ("_comparison_key",)
+    _comparison_key: Tuple[Number, ...]
+    # set by `dataclasses.dataclass` on each model, with its fields in order
+    __dataclass_fields__: ClassVar[Dict[str, "dataclasses.Field[Any]"]]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_comparison_key", self._make_comparison_key())
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (self.__class__, self._get_values())
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], Any]]:
+        # pydantic can not validate slotted dataclasses, so the values that are not
+        # models yet are validated with a pydantic model with the same fields
+        yield cls._validate_type
+
+    @classmethod
+    def _validate_type(cls, value: Any) -> Any:
+        if isinstance(value, cls):
+            return value
+
+        return cls(**_make_validation_model(cls).parse_obj(value).dict())
 
     def __hash__(self) -> int:
-        return hash(self.get_field_values())
+        return hash(self._comparison_key)
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, self.__class__):
-            return self.get_field_values() == other.get_field_values()
+            return self._comparison_key == other._comparison_key
 
         raise TypeError(f"'==' not supported between {type(other)} and {type(self)}")
 
     def __lt__(self, other: object) -> bool:
         if isinstance(other, self.__class__):
-            return self.get_field_values() < other.get_field_values()
+            return self._comparison_key < other._comparison_key
 
         raise TypeError(f"'<' not supported between {type(other)} and {type(self)}")
 
     def get_field_values(self) -> Tuple[Number, ...]:
         """Return all values from all numeric field in the model"""
-        field_values: List[Number] = self._get_integer_fields()
-        field_values.extend(self._get_float_fields())
+        return self._comparison_key
+
+    def _make_comparison_key(self) -> Tuple[Number, ...]:
+        values = self._get_values()
+        field_values: List[Number] = [
+            value for value in values if isinstance(value, int)
+        ]
+        field_values.extend(
+            self._get_decimal_as_int(value)
+            for value in values
+            if isinstance(value, float)
+        )
         return tuple(field_values)
 
-    def _get_integer_fields(self) -> List[Number]:
-        field_values: List[Number] = []
-
-        for field in filter(
-            self._is_field_integer,
-            vars(self.__class__)["__dataclass_fields__"].keys(),
-        ):
-            field_values.append(getattr(self, field))
+    def _get_values(self) -> Tuple[Any, ...]:
+        return tuple(map(self.__getattribute__, self.__dataclass_fields__))
 
-        return field_values
-
-    def _get_float_fields(self) -> List[Number]:
-        field_values: List[Number] = []
-
-        for field in filter(
-            self._is_field_float,
-            vars(self.__class__)["__dataclass_fields__"].keys(),
-        ):
-            field_values.append(self._get_decimal_field_as_int(field))
-
-        return field_values
-
-    def _is_field_integer(self, field: Any) -> bool:
-        return isinstance(getattr(self, field), int)
-
-    def _is_field_float(self, field: Any) -> bool:
-        return isinstance(getattr(self, field), float)
-
-    def _get_decimal_field_as_int(self, field: str) -> int:
-        return int(getattr(self, field) * 100)
+    @staticmethod
+    def _get_decimal_as_int(value: float) -> int:
+        return int(value * 100)
 
     @no_type_check
     @classmethod
@@ -86,10 +110,26 @@ class ColorFormatModel(ABC):
         raise TypeError(f"Unable to convert {type(value)} to {cls.__name__}")
 
 
-@dataclasses.dataclass(eq=False)
+@functools.lru_cache
+def _make_validation_model(
+    model_class: Type[ColorFormatModel],
+) -> Type[pydantic.BaseModel]:  # pylint: disable=no-member
+    field_definitions: Dict[str, Any] = {
+        field.name: (field.type, ...)
+        for field in dataclasses.fields(model_class)  # type: ignore[arg-type]
+    }
+
+    return pydantic.create_model(  # pylint: disable=no-member
+        model_class.__name__, **field_definitions
+    )
+
+
+@dataclasses.dataclass(eq=False, frozen=True)
 class SteppedHueValuePerceivedLuminosity(ColorFormatModel):
     """Model for the stepped hue, perceived luminosity and stepped value"""
 
+    __slots__ = ("perceived_luminosity", "stepped_hue", "stepped_value")
+
     stepped_hue: int
     perceived_luminosity: float
     stepped_value: int
@@ -98,26 +138,32 @@ class SteppedHueValuePerceivedLuminosity(ColorFormatModel):
         return hash((self.stepped_hue, self.perceived_luminosity, self.stepped_value))
 
 
-@dataclasses.dataclass(eq=False)
+@dataclasses.dataclass(eq=False, frozen=True)
 class HSV(ColorFormatModel):
     """Model for the HSV values of a color"""
 
+    __slots__ = ("hue", "saturation", "value")
+
     hue: int
     saturation: float
     value: float
 
 
-@dataclasses.dataclass(eq=False)
+@dataclasses.dataclass(eq=False, frozen=True)
 class PerceivedLuminosity(ColorFormatModel):
     """Model for the perceived luminosity of the color"""
 
+    __slots__ = ("value",)
+
     value: float
 
 
-@dataclasses.dataclass(eq=False)
+@dataclasses.dataclass(eq=False, frozen=True)
 class RGB(ColorFormatModel):
     """Model for the RGB format of color"""
 
+    __slots__ = ("blue", "green", "red")
+
     red: int
     green: int
     blue: int
@@ -141,64 +187,17 @@ class RGB(ColorFormatModel):
         return self.blue / constants.MAXIMUM_RGB_VALUE
 
 
-@dataclasses.dataclass(eq=False)
+@dataclasses.dataclass(eq=False, frozen=True)
 class HSL(ColorFormatModel):
     """Store the data of the HSL of a color"""
 
+    __slots__ = ("hue", "luminosity", "saturation")
+
     hue: int
     saturation: float
     luminosity: float
 
 
-class Color(pydantic.BaseModel):  # pylint: disable=no-member
-    """Model for the color"""
-
-    rgb: RGB
-    hsl: HSL
-    hexcode: str
-    original_format: constants.ColorFormat
-    description: str
-
-    @property
-    def rgb_red(self) -> int:
-        """Return the value of red from the RGB of the color"""
-        return self.rgb.red
-
-    @property
-    def rgb_green(self) -> int:
-        """Return the value of green from the RGB of the color"""
-        return self.rgb.green
-
-    @property
-    def rgb_blue(self) -> int:
-        """Return the value of blue from the RGB of the color"""
-        return self.rgb.blue
-
-    @property
-    def hsl_hue(self) -> int:
-        """Return the value of hue from the HSL of the color"""
-        return self.hsl.hue
-
-    @property
-    def hsl_saturation(self) -> float:
-        """Return the value of saturation from the HSL of the color"""
-        return self.hsl.saturation
-
-    @property
-    def hsl_luminosity(self) -> float:
-        """Return the value of luminosity from the HSL of the color"""
-        return self.hsl.luminosity
-
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, self.__class__):
-            return self.rgb == other.rgb and self.hsl == other.hsl
-
-        raise TypeError(f"'==' not supported between {type(other)} and {type(self)}")
-
-    def __hash__(self) -> int:
-        return hash((self.rgb_red, self.rgb_green, self.rgb_blue))
-
-
 @dataclasses.dataclass
 class InsertQueryData:
     """Store the data needed to form a INSERT SQL query"""
@@ -0,0 +1,29 @@
+import logging
+from typing import Any, Callable, Mapping
+
+TRACE_FORMAT = "%(relativeCreated)d ms %(levelname)s %(name)s: %(message)s"
+
+
+def log_lazily(
+    logger: logging.Logger,
+    level: int,
+    message: str,
+    get_data: Callable[[], Mapping[str, Any]],
+) -> None:
+    """Log the message with the data returned by `get_data` only when the logger is
+    enabled for the level, so the data is not calculated in the hot paths otherwise
+
+    Args:
+        logger (Logger): logger of the message
+        level (int): level of the message
+        message (str): message, formatted with the data as a mapping
+        get_data (Callable[[], Mapping[str, Any]]): function returning the data
+    """
+    if logger.isEnabledFor(level):
+        logger.log(level, message, get_data())
+
+
+def enable_tracing() -> None:
+    """Show every message logged by Harmony, including the ones of the hot paths, in
+    the standard error"""
+    logging.basicConfig(level=logging.DEBUG, format=TRACE_FORMAT, force=True)
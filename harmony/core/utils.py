@@ -1,12 +1,12 @@
 import os
 import re
 import struct
-from typing import Dict, Iterable, List, Optional, no_type_check
+from pathlib import Path
+from typing import Dict, Optional, no_type_check
 
-from harmony.core.constants import ByteOrder
+from harmony.core.constants import CACHE_DIRECTORY_ENVIRONMENT_VARIABLE, ByteOrder
 from harmony.core.exceptions import InvalidRegexException, NoExtensionFoundException
 from harmony.core.models import RGB
-from harmony.typing import T
 
 
 class ResourceUtils:
@@ -37,6 +37,30 @@ class ResourceUtils:
         return os.path.join(os.path.dirname(__file__), "..")
 
 
+class CacheUtils:
+    """Methods for managing the cache directory"""
+
+    @staticmethod
+    def get_cache_directory() -> Path:
+        """Return the directory where Harmony keeps its caches, without creating it,
+        so reading the caches never writes to the disk. Create it before writing a
+        cache in it.
+
+        The directory can be set with the `HARMONY_CACHE_DIR` environment variable,
+        otherwise it is the "harmony" directory inside the user cache directory
+
+        Returns:
+            Path: path to the cache directory
+        """
+        if os.environ.get(CACHE_DIRECTORY_ENVIRONMENT_VARIABLE):
+            return Path(os.environ[CACHE_DIRECTORY_ENVIRONMENT_VARIABLE])
+
+        return (
+            Path(os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache"))
+            / "harmony"
+        )
+
+
 class RGBUtils:
     """Methods for manipulating RGB"""
 
@@ -130,6 +154,12 @@ def does_file_name_have_extension(file_path: str) -> bool:
     return get_index_for_the_file_extension(file_path) >= 0
 
 
+def read_file_header(file_path: Path, size: int) -> bytes:
+    """Return up to the first `size` bytes of the file"""
+    with file_path.open("rb") as file:
+        return file.read(size)
+
+
 def get_extension_from_file_path(file_path: str) -> str:
     """Get extension from path-like string
 
@@ -166,16 +196,6 @@ def extract_extension_from_file_path(file_path: str) -> str:
     raise NoExtensionFoundException(f"The file path '{file_path}' has no extension")
 
 
-def extract_unique_values_from_iterable(iterable: Iterable[T]) -> Iterable[T]:
-    """Returns the unique values from the passed iterable without losing its order"""
-    uniques: List[T] = []
-
-    for value in filter(lambda value: value not in uniques, iterable):
-        uniques.append(value)
-
-    return uniques
-
-
 class RegexHelper:
     """Helps with regular expression operations"""
 
@@ -1,13 +1,32 @@
+from harmony.core_services.cached_readers import CachedFilesReader
 from harmony.core_services.color_readers import (
     DirectoryColorReader,
     FileColorReader,
     extract_colors_from_path,
 )
 from harmony.core_services.css_readers import HSLCSSFunctionReader, RGBCSSFunctionReader
-from harmony.core_services.file_readings import PlainTextFileReading
+from harmony.core_services.extraction_cache import ExtractionCache
+from harmony.core_services.extraction_records import (
+    DirectoryScan,
+    EncodedColor,
+    FileSignature,
+    decode_colors,
+    encode_colors,
+)
+from harmony.core_services.file_readings import (
+    PlainTextFileReading,
+    TextChunk,
+    split_text_file_into_chunks,
+)
+from harmony.core_services.parallel_readers import (
+    DEFAULT_DIRECTORY_READING_OPTIONS,
+    DirectoryReadingOptions,
+    ParallelFilesReader,
+)
 from harmony.core_services.plain_text_readings import (
     HexcodeTextReading,
     HSLTextReading,
+    PlainTextLineParser,
     RGBTextReading,
 )
 from harmony.core_services.services import ColorWriter, PathGenerator
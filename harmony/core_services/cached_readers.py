@@ -0,0 +1,92 @@
+from concurrent import futures
+from typing import Dict, List, Optional, Tuple
+
+from harmony import core
+from harmony.core_services.extraction_cache import ExtractionCache
+from harmony.core_services.extraction_records import DirectoryScan, FileSignature
+from harmony.core_services.parallel_readers import ParallelFilesReader
+
+
+class CachedFilesReader:
+    """Reads only the files of a directory scan which changed since their colors were
+    cached, or since the color names resource changed, and prunes the entries of the
+    files no longer found"""
+
+    def __init__(
+        self,
+        files_reader: ParallelFilesReader,
+        extraction_cache: ExtractionCache,
+        scan: DirectoryScan,
+    ) -> None:
+        self._files_reader = files_reader
+        self._extraction_cache = extraction_cache
+        self._scan = scan
+        self._reader_key = files_reader.get_cache_key()
+
+    def read(
+        self, thread_executor: futures.Executor, paths: List[str]
+    ) -> Dict[str, Tuple[core.Color, ...]]:
+        """Read the colors of the files, loading the ones of the unchanged files
+
+        Args:
+            thread_executor (Executor): pool of threads of the directory reading
+            paths (List[str]): paths to the files, from the scan
+
+        Returns:
+            Dict[str, Tuple[Color, ...]]: colors of the files that could be read, by
+            their paths
+        """
+        signatures = self._get_signatures(thread_executor, paths)
+        colors_by_path = self._extraction_cache.load(self._reader_key, signatures)
+        colors_by_path.update(
+            self._read_and_store(
+                thread_executor,
+                [path for path in paths if path not in colors_by_path],
+                signatures,
+            )
+        )
+        self._extraction_cache.prune(self._reader_key, self._scan)
+
+        return colors_by_path
+
+    def _get_signatures(
+        self, thread_executor: futures.Executor, paths: List[str]
+    ) -> Dict[str, FileSignature]:
+        return {
+            path: signature
+            for path, signature in zip(
+                paths,
+                self._files_reader.map_in_threads(
+                    thread_executor, self._try_to_get_signature, paths
+                ),
+            )
+            if signature is not None
+        }
+
+    @staticmethod
+    def _try_to_get_signature(path: str) -> Optional[FileSignature]:
+        try:
+            return FileSignature.from_path(path)
+
+        except OSError:
+            return None
+
+    def _read_and_store(
+        self,
+        thread_executor: futures.Executor,
+        paths: List[str],
+        signatures: Dict[str, FileSignature],
+    ) -> Dict[str, Tuple[core.Color, ...]]:
+        colors_by_path = self._files_reader.read(thread_executor, paths)
+        # the files whose signature could not be taken are read but not cached
+        self._extraction_cache.store(
+            self._reader_key,
+            signatures,
+            {
+                path: colors
+                for path, colors in colors_by_path.items()
+                if path in signatures
+            },
+        )
+
+        return colors_by_path
@@ -1,10 +1,19 @@
+import itertools
 import logging
 import os
+from concurrent import futures
 from pathlib import Path
-from typing import List, Sized, Tuple
+from typing import Dict, Iterator, List, Sequence, Sized, Tuple
 
 from harmony import core
 from harmony.core import exceptions, interfaces
+from harmony.core_services.cached_readers import CachedFilesReader
+from harmony.core_services.extraction_records import DirectoryScan
+from harmony.core_services.parallel_readers import (
+    DEFAULT_DIRECTORY_READING_OPTIONS,
+    DirectoryReadingOptions,
+    ParallelFilesReader,
+)
 
 
 class FileColorReader(interfaces.ColorReader):
@@ -26,14 +35,32 @@ class FileColorReader(interfaces.ColorReader):
 
 
 class DirectoryColorReader(interfaces.ColorReader):
-    """Service for reading colors from files in a directory"""
+    """Service for reading colors from files in a directory.
+
+    The entries of each directory are visited by name and the files the strategy
+    surely cannot read, by their extension or first bytes, are skipped before reading
+    them. When more than one job is used, those checks, and the reading if there is a
+    single worker, run in a pool of threads, which suits the I/O of opening the files.
+    When more than one worker is used, a single pool of processes is started for the
+    whole scan, recursive or not, and the files are read in it in tasks of
+    `chunk_size` files, which suits the CPU heavy decoding. Either way, the colors are
+    returned in the order the files are found.
+
+    When an extraction cache is passed, only the files that changed since they were
+    last read, or since the color names resource changed, are read again
+    """
 
     def __init__(
-        self, strategy: interfaces.FileReadingStrategy, should_be_recursively: bool
+        self,
+        strategy: interfaces.FileReadingStrategy,
+        should_be_recursively: bool,
+        options: DirectoryReadingOptions = DEFAULT_DIRECTORY_READING_OPTIONS,
     ) -> None:
         self._strategy = strategy
         self._logger = logging.getLogger(self.__class__.__name__)
         self._should_be_recursively = should_be_recursively
+        self._options = options
+        self._files_reader = ParallelFilesReader(strategy, options)
 
     def extract_colors(self, path: Path) -> Tuple[core.Color, ...]:
         """Extracts a list of colors from the files of the passed directory
@@ -44,44 +71,74 @@ class DirectoryColorReader(interfaces.ColorReader):
         Returns:
             Tuple[Color, ...]: tuple of colors extracted
         """
-        colors: List[core.Color] = []
-
-        for entry in os.scandir(path):
-            colors.extend(self._read_if_file(entry))
-            colors.extend(self._read_if_directory(entry))
+        directory = os.path.abspath(path)
+
+        with futures.ThreadPoolExecutor(self._options.jobs) as thread_executor:
+            colors = self._read_directory(
+                thread_executor,
+                DirectoryScan(
+                    directory,
+                    self._should_be_recursively,
+                    list(self._iterate_file_paths(Path(directory))),
+                ),
+            )
 
         self._check_if_colors_were_found(colors)
 
         return tuple(colors)
 
-    def _read_if_file(self, entry: os.DirEntry) -> Tuple[core.Color, ...]:
-        if entry.is_file():
-            return self._try_to_read_from_path_string(entry.path)
+    def _read_directory(
+        self, thread_executor: futures.Executor, scan: DirectoryScan
+    ) -> List[core.Color]:
+        paths = self._filter_readable_paths(thread_executor, scan.file_paths)
+        colors_by_path = self._read_files(thread_executor, paths, scan)
 
-        return ()
+        return [color for path in paths for color in colors_by_path.get(path, ())]
 
-    def _read_if_directory(self, entry: os.DirEntry) -> Tuple[core.Color, ...]:
-        if self._should_read_recursively(entry):
-            return self.extract_colors(Path(entry.path))
+    def _read_files(
+        self, thread_executor: futures.Executor, paths: List[str], scan: DirectoryScan
+    ) -> Dict[str, Tuple[core.Color, ...]]:
+        if self._options.extraction_cache is None:
+            return self._files_reader.read(thread_executor, paths)
+
+        return CachedFilesReader(
+            self._files_reader, self._options.extraction_cache, scan
+        ).read(thread_executor, paths)
+
+    def _filter_readable_paths(
+        self, thread_executor: futures.Executor, paths: Sequence[str]
+    ) -> List[str]:
+        are_readable = list(
+            self._files_reader.map_in_threads(thread_executor, self._can_read, paths)
+        )
 
-        return ()
+        for path in itertools.compress(
+            paths, [not is_readable for is_readable in are_readable]
+        ):
+            self._logger.debug("Skipping '%s', which cannot be read", path)
 
-    def _try_to_read_from_path_string(self, path: str) -> Tuple[core.Color, ...]:
+        return list(itertools.compress(paths, are_readable))
+
+    def _can_read(self, path: str) -> bool:
         try:
-            return self._strategy.read(Path(path))
+            return self._strategy.can_read(Path(path))
 
-        except Exception as exception:
-            log_message = (
-                "An error occurred while extracting the colors from '%(path)s': "
-                + "%(exception)s"
-            )
+        except OSError:
+            return False
 
-            self._logger.debug(
-                log_message,
-                {"path": path, "exception": exception},
-            )
+    def _iterate_file_paths(self, path: Path) -> Iterator[str]:
+        for entry in sorted(os.scandir(path), key=lambda entry: entry.name):
+            yield from self._iterate_if_file(entry)
+            yield from self._iterate_if_directory(entry)
 
-            return ()
+    @staticmethod
+    def _iterate_if_file(entry: os.DirEntry) -> Iterator[str]:
+        if entry.is_file():
+            yield entry.path
+
+    def _iterate_if_directory(self, entry: os.DirEntry) -> Iterator[str]:
+        if self._should_read_recursively(entry):
+            yield from self._iterate_file_paths(Path(entry.path))
 
     def _should_read_recursively(self, entry: os.DirEntry) -> bool:
         return self._should_be_recursively and entry.is_dir()
@@ -98,13 +155,18 @@ class DirectoryColorReader(interfaces.ColorReader):
 
 
 def extract_colors_from_path(
-    path: Path, strategy: interfaces.FileReadingStrategy, recursively: bool
+    path: Path,
+    strategy: interfaces.FileReadingStrategy,
+    recursively: bool,
+    options: DirectoryReadingOptions = DEFAULT_DIRECTORY_READING_OPTIONS,
 ) -> Tuple[core.Color, ...]:
     """Extract the colors from the given path using the given file reading strategy
 
     Args:
         path (Path): path where the file(s) to extract the colors are going to be found
         strategy (FileReadingStrategy): strategy to use on extracting the colors
+        recursively (bool): whether the subdirectories are read too
+        options (DirectoryReadingOptions): how the files of a directory are read
 
     Returns:
         Tuple[Color, ...]: the colors extracted
@@ -113,4 +175,4 @@ def extract_colors_from_path(
     if path.is_file():
         return FileColorReader(strategy).extract_colors(path)
 
-    return DirectoryColorReader(strategy, recursively).extract_colors(path)
+    return DirectoryColorReader(strategy, recursively, options).extract_colors(path)
@@ -0,0 +1,225 @@
+import contextlib
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
+
+from harmony import core
+from harmony.core_services.extraction_records import (
+    DirectoryScan,
+    FileSignature,
+    decode_colors,
+    encode_colors,
+)
+
+
+class ExtractionCache:
+    """On-disk cache of the colors extracted from each file.
+
+    The colors are kept in a SQLite database, keyed by the absolute path of the file and
+    the cache key of the reading strategy, which holds its version and its options.
+    They are used again while the size and the modification time of the file are the
+    same. When the contents are hashed, a file which was only touched, with the same
+    size and SHA-256, is not read again either, and its new modification time is kept
+    so it is not hashed again. The files whose modification time did not change are
+    never hashed.
+
+    Every scan prunes the entries of the files it would have found but are no longer
+    in the scanned directory, and the ones that were not used for `MAXIMUM_UNUSED_DAYS`
+    """
+
+    FILE_NAME = "extractions.sqlite3"
+    # bump it whenever the table or the way the colors are stored change
+    SCHEMA_VERSION = 1
+    MAXIMUM_UNUSED_DAYS = 30
+    PATHS_PER_QUERY = 500
+
+    def __init__(self, path: Path, should_hash_contents: bool = False) -> None:
+        self._path = path
+        self._should_hash_contents = should_hash_contents
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    @classmethod
+    def from_cache_directory(
+        cls, should_hash_contents: bool = False
+    ) -> "ExtractionCache":
+        """Make the cache kept in the Harmony cache directory"""
+        return cls(
+            core.CacheUtils.get_cache_directory().joinpath(cls.FILE_NAME),
+            should_hash_contents,
+        )
+
+    def load(
+        self, reader_key: str, signatures: Dict[str, FileSignature]
+    ) -> Dict[str, Tuple[core.Color, ...]]:
+        """Return the colors cached for the files which did not change
+
+        Args:
+            reader_key (str): cache key of the reading strategy
+            signatures (Dict[str, FileSignature]): current signature of each file, by
+            its absolute path
+
+        Returns:
+            Dict[str, Tuple[Color, ...]]: colors of the files found, by their paths
+        """
+        with self._connect() as connection:
+            colors_by_path = {
+                path: decode_colors(colors)
+                for path, cached_signature, colors in self._iterate_cached_files(
+                    connection, reader_key, list(signatures)
+                )
+                if self._is_unchanged(path, signatures[path], cached_signature)
+            }
+            connection.executemany(
+                "UPDATE extractions SET modification_time = ?, used_at = ? "
+                + "WHERE reader_key = ? AND path = ?",
+                (
+                    (signatures[path].modification_time, time.time(), reader_key, path)
+                    for path in colors_by_path
+                ),
+            )
+
+        self._logger.debug(
+            "%(hits)d of %(total)d files found in the extraction cache",
+            {"hits": len(colors_by_path), "total": len(signatures)},
+        )
+
+        return colors_by_path
+
+    def store(
+        self,
+        reader_key: str,
+        signatures: Dict[str, FileSignature],
+        colors_by_path: Dict[str, Tuple[core.Color, ...]],
+    ) -> None:
+        """Keep the colors extracted from the files
+
+        Args:
+            reader_key (str): cache key of the reading strategy
+            signatures (Dict[str, FileSignature]): signature of each file when it was
+            read, by its absolute path
+            colors_by_path (Dict[str, Tuple[Color, ...]]): colors of each file
+        """
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO extractions VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        path,
+                        reader_key,
+                        *self._get_stored_signature(path, signatures[path]),
+                        encode_colors(colors),
+                        time.time(),
+                    )
+                    for path, colors in colors_by_path.items()
+                ),
+            )
+
+    def prune(self, reader_key: str, scan: DirectoryScan) -> None:
+        """Remove the entries of the files deleted from the scanned directory, and the
+        ones not used for too long. The files in the subdirectories are only removed
+        when the scan was recursive
+
+        Args:
+            reader_key (str): cache key of the reading strategy
+            scan (DirectoryScan): directory scanned and the files found in it
+        """
+        with self._connect() as connection:
+            connection.executemany(
+                "DELETE FROM extractions WHERE reader_key = ? AND path = ?",
+                (
+                    (reader_key, path)
+                    for path in self._select_covered_paths(
+                        connection, reader_key, scan
+                    ).difference(scan.file_paths)
+                ),
+            )
+            connection.execute(
+                "DELETE FROM extractions WHERE used_at < ?",
+                (time.time() - self.MAXIMUM_UNUSED_DAYS * 24 * 60 * 60,),
+            )
+
+    def _is_unchanged(
+        self, path: str, signature: FileSignature, cached: FileSignature
+    ) -> bool:
+        # only the files touched since they were cached are hashed
+        return signature.is_unchanged_since(cached) or (
+            self._should_hash_contents and signature.has_contents_of(path, cached)
+        )
+
+    def _get_stored_signature(
+        self, path: str, signature: FileSignature
+    ) -> FileSignature:
+        return signature.with_digest(path) if self._should_hash_contents else signature
+
+    def _iterate_cached_files(
+        self, connection: sqlite3.Connection, reader_key: str, paths: List[str]
+    ) -> Iterator[Tuple[str, FileSignature, str]]:
+        """Yield the path, the signature and the encoded colors of the cached files,
+        querying them in batches"""
+        for start in range(0, len(paths), self.PATHS_PER_QUERY):
+            yield from self._select_cached_files(
+                connection, reader_key, paths[start : start + self.PATHS_PER_QUERY]
+            )
+
+    @staticmethod
+    def _select_cached_files(
+        connection: sqlite3.Connection, reader_key: str, paths: List[str]
+    ) -> Iterator[Tuple[str, FileSignature, str]]:
+        rows = connection.execute(
+            "SELECT path, size, modification_time, digest, colors "
+            + "FROM extractions WHERE reader_key = ? AND path IN "
+            + f"({', '.join('?' * len(paths))})",
+            (reader_key, *paths),
+        ).fetchall()
+
+        return (
+            (path, FileSignature(size, modification_time, digest), colors)
+            for path, size, modification_time, digest, colors in rows
+        )
+
+    @staticmethod
+    def _select_covered_paths(
+        connection: sqlite3.Connection, reader_key: str, scan: DirectoryScan
+    ) -> Set[str]:
+        """Return the cached paths the scan would have found"""
+        directory_prefix = os.path.join(scan.directory, "")
+
+        return {
+            path
+            for (path,) in connection.execute(
+                "SELECT path FROM extractions WHERE reader_key = ? "
+                + "AND substr(path, 1, ?) = ?",
+                (reader_key, len(directory_prefix), directory_prefix),
+            )
+            if scan.covers(path)
+        }
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self._path)
+
+        try:
+            with connection:
+                self._create_table_if_needed(connection)
+                yield connection
+
+        finally:
+            connection.close()
+
+    def _create_table_if_needed(self, connection: sqlite3.Connection) -> None:
+        (schema_version,) = connection.execute("PRAGMA user_version").fetchone()
+
+        if schema_version != self.SCHEMA_VERSION:
+            connection.execute("DROP TABLE IF EXISTS extractions")
+            connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS extractions ("
+            + "path TEXT NOT NULL, reader_key TEXT NOT NULL, size INTEGER NOT NULL, "
+            + "modification_time INTEGER NOT NULL, digest BLOB, colors TEXT NOT NULL, "
+            + "used_at REAL NOT NULL, PRIMARY KEY (path, reader_key))"
+        )
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+from harmony import core
+
+HASHING_BLOCK_SIZE = 1 << 20
+
+
+class FileSignature(NamedTuple):
+    """What tells a version of a file apart from the others"""
+
+    size: int
+    modification_time: int
+    digest: Optional[bytes] = None
+
+    @classmethod
+    def from_path(cls, path: str) -> "FileSignature":
+        """Make the signature of the current version of the file, without hashing it
+
+        Args:
+            path (str): path to the file
+
+        Returns:
+            FileSignature: size and modification time of the file
+        """
+        stat = os.stat(path)
+
+        return cls(stat.st_size, stat.st_mtime_ns)
+
+    def with_digest(self, path: str) -> "FileSignature":
+        """Return the signature with the SHA-256 of the file"""
+        return FileSignature(self.size, self.modification_time, _hash_file(path))
+
+    def is_unchanged_since(self, cached: "FileSignature") -> bool:
+        """Tell whether the file has the size and modification time it had when it was
+        cached"""
+        return (
+            self.size == cached.size
+            and self.modification_time == cached.modification_time
+        )
+
+    def has_contents_of(self, path: str, cached: "FileSignature") -> bool:
+        """Tell whether the file has the size and the SHA-256 it had when it was
+        cached, hashing it only when the sizes match and the digest was cached
+
+        Args:
+            path (str): path to the file
+            cached (FileSignature): signature of the file when it was cached
+
+        Returns:
+            bool: `True` when the contents of the file are the cached ones
+        """
+        return (
+            self.size == cached.size
+            and cached.digest is not None
+            and _hash_file(path) == cached.digest
+        )
+
+
+class DirectoryScan(NamedTuple):
+    """Files found scanning a directory, recursively or not"""
+
+    directory: str
+    recursively: bool
+    file_paths: Sequence[str]
+
+    def covers(self, path: str) -> bool:
+        """Tell whether the scan would have found the file if it still existed
+
+        Args:
+            path (str): absolute path to the file
+
+        Returns:
+            bool: `True` when the file is inside the directory, or directly inside it
+            when the scan was not recursive
+        """
+        if self.recursively:
+            return path.startswith(os.path.join(self.directory, ""))
+
+        return os.path.dirname(path) == self.directory
+
+
+class EncodedColor(NamedTuple):
+    """Fields of a color in the order they are kept in the extraction cache"""
+
+    red: int
+    green: int
+    blue: int
+    hue: int
+    saturation: float
+    luminosity: float
+    hexcode: str
+    original_format: str
+    description: str
+
+    @classmethod
+    def from_color(cls, color: core.Color) -> "EncodedColor":
+        """Take the fields of the color"""
+        return cls(
+            color.rgb.red,
+            color.rgb.green,
+            color.rgb.blue,
+            color.hsl.hue,
+            color.hsl.saturation,
+            color.hsl.luminosity,
+            color.hexcode,
+            color.original_format.value,
+            color.description,
+        )
+
+    def to_color(self) -> core.Color:
+        """Make the color with the fields"""
+        return core.Color(
+            rgb=core.RGB(self.red, self.green, self.blue),
+            hsl=core.HSL(self.hue, self.saturation, self.luminosity),
+            hexcode=self.hexcode,
+            original_format=core.ColorFormat(self.original_format),
+            description=self.description,
+        )
+
+
+def _hash_file(path: str) -> bytes:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(HASHING_BLOCK_SIZE), b""):
+            digest.update(block)
+
+    return digest.digest()
+
+
+def encode_colors(colors: Sequence[core.Color]) -> str:
+    """Return the colors as a JSON array with the fields of each one"""
+    return json.dumps([EncodedColor.from_color(color) for color in colors])
+
+
+def decode_colors(encoded_colors: str) -> Tuple[core.Color, ...]:
+    """Return the colors encoded by `encode_colors`"""
+    return tuple(
+        EncodedColor(*fields).to_color() for fields in json.loads(encoded_colors)
+    )
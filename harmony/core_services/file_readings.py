@@ -1,60 +1,171 @@
+import io
+import itertools
+import locale
+import mmap
+from concurrent import futures
 from pathlib import Path
-from typing import Iterator, List, Tuple, Type
+from typing import Iterator, List, NamedTuple, Tuple
 
-from harmony import convertions, core, data_access
-from harmony.core import exceptions, interfaces
-from harmony.core_services.plain_text_readings import (
-    HexcodeTextReading,
-    HSLTextReading,
-    RGBTextReading,
-)
+from harmony import core, data_access
+from harmony.core import interfaces
+from harmony.core_services.plain_text_readings import PlainTextLineParser
+
+
+class TextChunk(NamedTuple):
+    """Range of bytes of a text file, starting at the beginning of a line and ending
+    after a line break or at the end of the file"""
+
+    path: Path
+    start: int
+    end: int
+
+    def read_lines(self) -> io.StringIO:
+        """Return the lines of the chunk, decoded the same way `open` does"""
+        with self.path.open("rb") as file:
+            file.seek(self.start)
+            text = file.read(self.end - self.start).decode(
+                locale.getpreferredencoding(False)
+            )
+
+        return io.StringIO(text, newline=None)
+
+
+def split_text_file_into_chunks(path: Path, chunk_size: int) -> List[TextChunk]:
+    """Split the file at the first line break after every `chunk_size` bytes
+
+    Args:
+        path (Path): text file to be split
+        chunk_size (int): minimum size of the chunks, but the last one
+
+    Returns:
+        List[TextChunk]: the chunks, in the order they are in the file
+    """
+    with path.open("rb") as file:
+        if path.stat().st_size == 0:
+            return []
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as file_map:
+            return [
+                TextChunk(path, start, end)
+                for start, end in _iterate_chunks_bounds(file_map, chunk_size)
+            ]
+
+
+def _iterate_chunks_bounds(
+    file_map: mmap.mmap, chunk_size: int
+) -> Iterator[Tuple[int, int]]:
+    start = 0
+
+    while start < len(file_map):
+        line_break = file_map.find(b"\n", start + chunk_size - 1)
+        end = len(file_map) if line_break < 0 else line_break + 1
+        yield start, end
+        start = end
 
 
 class PlainTextFileReading(interfaces.FileReadingStrategy):
-    """Extract a set of colors from a plain text file"""
+    """Extract a set of colors from a plain text file.
+
+    When more than one worker is used, the file is split into chunks of lines, which
+    are parsed and named in a pool of processes. The colors are still yielded in the
+    order they are in the file and only the first of the duplicated ones is kept
+    """
+
+    DEFAULT_CHUNK_SIZE = 4096
+    PARALLEL_CHUNK_SIZE = 1 << 20
 
-    def __init__(self, must_generate_color_names: bool = True):
+    def __init__(
+        self,
+        must_generate_color_names: bool = True,
+        deduplication_key: core.DeduplicationKey = core.DeduplicationKey.COLOR,
+        workers: int = 1,
+    ):
         self._must_generate_color_names = must_generate_color_names
+        self._deduplication_key = deduplication_key
+        self._workers = workers
+        self._line_parser = PlainTextLineParser()
 
     def read(self, file_path: Path) -> Tuple[core.Color, ...]:
-        with file_path.open("r") as file:
-            return self._make_colors_tuple(file.readlines())
+        return tuple(self.iterate(file_path))
 
-    def _make_colors_tuple(self, color_strings: List[str]) -> Tuple[core.Color, ...]:
-        colors_list: List[core.Color] = []
+    def get_cache_key(self) -> str:
+        return (
+            f"{super().get_cache_key()}:{self._must_generate_color_names}:"
+            + f"{self._deduplication_key.value}"
+        )
 
-        for color_string in color_strings:
-            colors_list.append(self._make_color_from_raw_string(color_string))
+    def iterate(self, file_path: Path) -> Iterator[core.Color]:
+        """Lazily yield the unique colors of the file, reading it line by line
 
-        return tuple(core.extract_unique_values_from_iterable(colors_list))
+        Args:
+            file_path (Path): file with the colors
 
-    def _make_color_from_raw_string(self, raw_string: str) -> core.Color:
-        return self._make_color_from_string(raw_string.replace("\n", ""))
+        Returns:
+            Iterator[Color]: the colors, in the same order `read` returns them
+        """
+        return core.iterate_unique_colors(
+            self._iterate_all_colors(file_path), self._deduplication_key
+        )
 
-    def _make_color_from_string(self, color_string: str) -> core.Color:
-        for factory in filter(
-            lambda factory: factory.match_pattern(color_string),
-            self._get_color_factories(),
-        ):
-            return self._make_color(color_string, factory())
-
-        raise exceptions.InvalidColorException(
-            color_string.replace("\n", "") + " does not match any valid format"
+    def iterate_chunks(
+        self, file_path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[List[core.Color]]:
+        """Lazily yield the unique colors of the file in lists of up to `chunk_size`
+        colors
+
+        Args:
+            file_path (Path): file with the colors
+            chunk_size (int): maximum amount of colors in each chunk
+
+        Returns:
+            Iterator[List[Color]]: the chunks of colors
+        """
+        colors = self.iterate(file_path)
+        chunk = list(itertools.islice(colors, chunk_size))
+
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(colors, chunk_size))
+
+    def read_chunk(self, chunk: TextChunk) -> List[core.Color]:
+        """Read the unique colors of a chunk of a text file
+
+        Args:
+            chunk (TextChunk): chunk with the lines to be read
+
+        Returns:
+            List[Color]: the unique colors of the chunk
+        """
+        return core.extract_unique_colors(
+            map(self._make_color_from_raw_string, chunk.read_lines()),
+            self._deduplication_key,
         )
 
-    def _get_color_factories(
-        self,
-    ) -> Iterator[Type[interfaces.StringReadingStrategy]]:
-        yield HexcodeTextReading
-        yield RGBTextReading
-        yield HSLTextReading
+    def _iterate_all_colors(self, file_path: Path) -> Iterator[core.Color]:
+        if self._workers > 1:
+            return self._iterate_colors_in_parallel(file_path)
 
-    def _make_color(
-        self,
-        color_string: str,
-        strategy: interfaces.StringReadingStrategy,
-    ):
-        new_color = strategy.read(color_string)
+        return self._iterate_colors_line_by_line(file_path)
+
+    def _iterate_colors_line_by_line(self, file_path: Path) -> Iterator[core.Color]:
+        with file_path.open("r") as file:
+            yield from map(self._make_color_from_raw_string, file)
+
+    def _iterate_colors_in_parallel(self, file_path: Path) -> Iterator[core.Color]:
+        with futures.ProcessPoolExecutor(self._workers) as executor:
+            for chunk_colors in core.map_in_order(
+                executor,
+                self.read_chunk,
+                split_text_file_into_chunks(file_path, self.PARALLEL_CHUNK_SIZE),
+                self._workers * 2,
+            ):
+                yield from chunk_colors
+
+    def _make_color_from_raw_string(self, raw_string: str) -> core.Color:
+        return self._make_color_from_string(raw_string.replace("\n", ""))
+
+    def _make_color_from_string(self, color_string: str) -> core.Color:
+        new_color = self._line_parser.parse(color_string)
 
         if self._must_generate_name(new_color):
             new_color.description = self._generate_color_name(new_color.rgb)
@@ -72,11 +183,4 @@ class PlainTextFileReading(interfaces.FileReadingStrategy):
         return len(color.description) > 0
 
     def _generate_color_name(self, rgb_values: core.RGB) -> str:
-        return data_access.ColorNamesStorage().get_color_name_by_hsl(
-            self._get_hsl_from_rgb(rgb_values)
-        )
-
-    def _get_hsl_from_rgb(self, rgb_values: core.RGB) -> core.HSL:
-        return core.HSL.from_color_format_model(
-            convertions.RGBToHSLConverter().convert(rgb_values)
-        )
+        return data_access.ColorNamesStorage().get_color_name_by_rgb(rgb_values)
@@ -0,0 +1,159 @@
+import logging
+from concurrent import futures
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from harmony import core, data_access
+from harmony.core import interfaces
+from harmony.core_services.extraction_cache import ExtractionCache
+from harmony.typing import T
+
+R = TypeVar("R")
+
+
+class DirectoryReadingOptions(NamedTuple):
+    """How the files of a directory are read
+
+    Attributes:
+        workers (int): amount of processes reading the files
+        chunk_size (int): amount of files read in each task of the processes
+        jobs (int): amount of threads checking and reading the files
+        extraction_cache (Optional[ExtractionCache]): cache of the colors extracted
+        from the files
+    """
+
+    workers: int = 1
+    chunk_size: int = 1
+    jobs: int = 1
+    extraction_cache: Optional[ExtractionCache] = None
+
+
+DEFAULT_DIRECTORY_READING_OPTIONS = DirectoryReadingOptions()
+
+
+class ParallelFilesReader:
+    """Reads the colors of many files, in a pool of threads or, when more than one
+    worker is used, in a single pool of processes, in tasks of `chunk_size` files"""
+
+    def __init__(
+        self,
+        strategy: interfaces.FileReadingStrategy,
+        options: DirectoryReadingOptions = DEFAULT_DIRECTORY_READING_OPTIONS,
+    ) -> None:
+        self._strategy = strategy
+        self._options = options
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def read(
+        self, thread_executor: futures.Executor, paths: List[str]
+    ) -> Dict[str, Tuple[core.Color, ...]]:
+        """Read the colors of the files
+
+        Args:
+            thread_executor (Executor): pool of threads of the directory reading
+            paths (List[str]): paths to the files
+
+        Returns:
+            Dict[str, Tuple[Color, ...]]: colors of the files that could be read, by
+            their paths
+        """
+        paths_chunks = self._split_into_chunks(paths)
+
+        return {
+            path: colors
+            for paths_chunk, files_colors in zip(
+                paths_chunks,
+                self._iterate_colors_of_files(thread_executor, paths_chunks),
+            )
+            for path, colors in zip(paths_chunk, files_colors)
+            if colors is not None
+        }
+
+    def read_files(
+        self, paths: Sequence[str]
+    ) -> List[Optional[Tuple[core.Color, ...]]]:
+        """Read the colors of the files
+
+        Args:
+            paths (Sequence[str]): paths to the files
+
+        Returns:
+            List[Optional[Tuple[Color, ...]]]: the colors of each file, in their order,
+            or `None` for the files that could not be read
+        """
+        return [self._try_to_read_from_path_string(path) for path in paths]
+
+    def map_in_threads(
+        self,
+        thread_executor: futures.Executor,
+        function: Callable[[T], R],
+        items: Sequence[T],
+    ) -> Iterator[R]:
+        """Apply the function to the items in the pool of threads, in their order"""
+        return core.map_in_order(
+            thread_executor, function, items, self._options.jobs * 2
+        )
+
+    def get_cache_key(self) -> str:
+        """Return what tells apart the colors read with other strategies or options"""
+        # the descriptions generated depend on the color names resource
+        names_digest = data_access.ColorNamesStorage().get_resource_digest()
+
+        return f"{self._strategy.get_cache_key()}:{names_digest.hex()[:16]}"
+
+    def _iterate_colors_of_files(
+        self, thread_executor: futures.Executor, paths_chunks: List[List[str]]
+    ) -> Iterator[List[Optional[Tuple[core.Color, ...]]]]:
+        if self._must_read_in_processes(paths_chunks):
+            return self._iterate_colors_of_files_in_processes(paths_chunks)
+
+        return self.map_in_threads(thread_executor, self.read_files, paths_chunks)
+
+    def _must_read_in_processes(self, paths_chunks: List[List[str]]) -> bool:
+        return self._options.workers > 1 and len(paths_chunks) > 1
+
+    def _iterate_colors_of_files_in_processes(
+        self, paths_chunks: List[List[str]]
+    ) -> Iterator[List[Optional[Tuple[core.Color, ...]]]]:
+        with futures.ProcessPoolExecutor(self._options.workers) as process_executor:
+            yield from core.map_in_order(
+                process_executor,
+                self.read_files,
+                paths_chunks,
+                self._options.workers * 2,
+            )
+
+    def _split_into_chunks(self, paths: List[str]) -> List[List[str]]:
+        return [
+            paths[start : start + self._options.chunk_size]
+            for start in range(0, len(paths), self._options.chunk_size)
+        ]
+
+    def _try_to_read_from_path_string(
+        self, path: str
+    ) -> Optional[Tuple[core.Color, ...]]:
+        try:
+            return self._strategy.read(Path(path))
+
+        except Exception as exception:
+            log_message = (
+                "An error occurred while extracting the colors from '%(path)s': "
+                + "%(exception)s"
+            )
+
+            self._logger.debug(
+                log_message,
+                {"path": path, "exception": exception},
+            )
+
+            return None
@@ -1,71 +1,161 @@
 import re
+from typing import Callable, Tuple
 
 from harmony import color_factories, core
-from harmony.core import interfaces
-from harmony.core_services.css_readers import HSLCSSFunctionReader, RGBCSSFunctionReader
+from harmony.core import exceptions, interfaces
+
+DESCRIPTION_PATTERN = r"([\s](?P<description>.*))?"
+HEXCODE_PATTERN = r"(?P<hexcode>#([A-Za-z0-9]{3}){1,2})"
+RGB_PATTERN = (
+    r"(rgb|RGB)\([\s]*(?P<red>[0-9]{1,3})[\s]*,[\s]*(?P<green>[0-9]{1,3})[\s]*"
+    + r",[\s]*(?P<blue>[0-9]{1,3})[\s]*\)"
+)
+HSL_PATTERN = (
+    r"(hsl|HSL)\([\s]*(?P<hue>[0-9]{1,3})[\s]*,"
+    + r"[\s]*(?P<saturation>[0-9]{1,3})[\s]*%[\s]*,"
+    + r"[\s]*(?P<luminosity>[0-9]{1,3})[\s]*%[\s]*\)"
+)
+
+
+def _match_or_raise(pattern: "re.Pattern[str]", raw_string: str) -> "re.Match[str]":
+    match = pattern.match(raw_string)
+
+    if match is None:
+        raise exceptions.InvalidRegexException(
+            f"'{raw_string}' does not match with the pattern {pattern.pattern}"
+        )
+
+    return match
+
+
+def _get_description(match: "re.Match[str]") -> str:
+    return match["description"] or ""
+
+
+def _make_color_from_hexcode_match(match: "re.Match[str]") -> core.Color:
+    return color_factories.ColorFactory().make_from_hexcode(
+        match["hexcode"], _get_description(match)
+    )
+
+
+def _make_color_from_rgb_match(match: "re.Match[str]") -> core.Color:
+    return color_factories.ColorFactory().make_from_rgb(
+        core.RGB(int(match["red"]), int(match["green"]), int(match["blue"])),
+        _get_description(match),
+    )
+
+
+def _make_color_from_hsl_match(match: "re.Match[str]") -> core.Color:
+    return color_factories.ColorFactory().make_from_hsl(
+        core.HSL(
+            int(match["hue"]),
+            int(match["saturation"]) / 100,
+            int(match["luminosity"]) / 100,
+        ),
+        _get_description(match),
+    )
 
 
 class HexcodeTextReading(interfaces.StringReadingStrategy):
     """Convert a raw string the with a hexcode string into a Color object"""
 
-    STRING_PATTERN = r"(?P<hexcode>#([A-Za-z0-9]{3}){1,2})([\s](?P<description>.*))?"
+    STRING_PATTERN = HEXCODE_PATTERN + DESCRIPTION_PATTERN
+    COMPILED_PATTERN = re.compile(STRING_PATTERN)
 
     def do_read(self, property_value: str) -> core.Color:
-        return color_factories.ColorFactory().make_from_hexcode(
-            core.RegexHelper(self.__class__.STRING_PATTERN).get_raw_string_data(
-                property_value
-            )["hexcode"],
-            core.RegexHelper(self.__class__.STRING_PATTERN).get_raw_string_data(
-                property_value
-            )["description"]
-            or "",
+        return _make_color_from_hexcode_match(
+            _match_or_raise(self.COMPILED_PATTERN, property_value)
         )
 
     @classmethod
     def do_match_pattern(cls, property_value: str) -> bool:
-        return re.match(cls.STRING_PATTERN, property_value) is not None
+        return cls.COMPILED_PATTERN.match(property_value) is not None
 
 
 class RGBTextReading(interfaces.StringReadingStrategy):
     """Convert a raw string the with RGB components into a Color object"""
 
-    STRING_PATTERN = (
-        r"(rgb|RGB)\([\s]*(?P<red>[0-9]{1,3})[\s]*,[\s]*(?P<green>[0-9]{1,3})[\s]*"
-        + r",[\s]*(?P<blue>[0-9]{1,3})[\s]*\)([\s](?P<description>.*))?"
-    )
+    STRING_PATTERN = RGB_PATTERN + DESCRIPTION_PATTERN
+    COMPILED_PATTERN = re.compile(STRING_PATTERN)
 
     def do_read(self, property_value: str) -> core.Color:
-        return color_factories.ColorFactory().make_from_rgb(
-            RGBCSSFunctionReader().read(property_value),
-            core.RegexHelper(self.__class__.STRING_PATTERN).get_raw_string_data(
-                property_value
-            )["description"]
-            or "",
+        return _make_color_from_rgb_match(
+            _match_or_raise(self.COMPILED_PATTERN, property_value)
         )
 
     @classmethod
     def do_match_pattern(cls, property_value: str) -> bool:
-        return re.match(cls.STRING_PATTERN, property_value) is not None
+        return cls.COMPILED_PATTERN.match(property_value) is not None
 
 
 class HSLTextReading(interfaces.StringReadingStrategy):
     """Read css HSL() function and convert to HSL object"""
 
-    STRING_PATTERN = (
-        r"(hsl|HSL)\([\s]*(?P<hue>[0-9]{1,3})[\s]*,"
-        + r"[\s]*(?P<saturation>[0-9]{1,3})[\s]*%[\s]*,"
-        + r"[\s]*(?P<luminosity>[0-9]{1,3})[\s]*%[\s]*\)([\s](?P<description>.*))?"
-    )
+    STRING_PATTERN = HSL_PATTERN + DESCRIPTION_PATTERN
+    COMPILED_PATTERN = re.compile(STRING_PATTERN)
 
     def do_read(self, property_value: str) -> core.Color:
-        return color_factories.ColorFactory().make_from_hsl(
-            HSLCSSFunctionReader().read(property_value),
-            core.RegexHelper(self.__class__.STRING_PATTERN).get_raw_string_data(
-                property_value
-            )["description"]
-            or "",
+        return _make_color_from_hsl_match(
+            _match_or_raise(self.COMPILED_PATTERN, property_value)
         )
 
     @classmethod
     def do_match_pattern(cls, property_value: str) -> bool:
-        return re.match(cls.STRING_PATTERN, property_value) is not None
+        return cls.COMPILED_PATTERN.match(property_value) is not None
+
+
+class PlainTextLineParser:
+    """Read a line of a Harmony text file in any of the supported formats.
+
+    The formats are alternatives of a single precompiled pattern, so one match
+    identifies the format of the line and extracts its components and description. The
+    format is told by the group that matched, tried in the same order the reading
+    strategies are
+    """
+
+    LINE_PATTERN = re.compile(
+        f"(?:{HEXCODE_PATTERN}|{RGB_PATTERN}|{HSL_PATTERN}){DESCRIPTION_PATTERN}"
+    )
+    COLOR_MAKERS: Tuple[Tuple[str, Callable[["re.Match[str]"], core.Color]], ...] = (
+        ("hexcode", _make_color_from_hexcode_match),
+        ("red", _make_color_from_rgb_match),
+        ("hue", _make_color_from_hsl_match),
+    )
+
+    def parse(self, line: str) -> core.Color:
+        """Convert the line into a Color object
+
+        Args:
+            line (str): line without the line break
+
+        Raises:
+            InvalidColorException: when the line does not match any of the formats
+
+        Returns:
+            Color: the color of the line
+        """
+        match = self.LINE_PATTERN.match(line)
+
+        if match is None:
+            raise exceptions.InvalidColorException(
+                line + " does not match any valid format"
+            )
+
+        return self._get_color_maker(match)(match)
+
+    def _get_color_maker(
+        self, match: "re.Match[str]"
+    ) -> Callable[["re.Match[str]"], core.Color]:
+        color_maker = next(
+            (
+                color_maker
+                for group_name, color_maker in self.COLOR_MAKERS
+                if match[group_name] is not None
+            ),
+            None,
+        )
+
+        if color_maker is None:
+            raise exceptions.InvalidColorException("Unknown color format")
+
+        return color_maker
@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterable, Sequence, Tuple
 
 from harmony import core
 from harmony.core import interfaces
@@ -157,3 +157,14 @@ class ColorWriter:
         """
 
         self._strategy.write(colors, final_file_path)
+
+    def write_chunks(
+        self, chunks: Iterable[Sequence[core.Color]], final_file_path: str
+    ) -> None:
+        """Write colors to passed file as the chunks arrive
+
+        Args:
+            chunks (Iterable[Sequence[Color]]): colors to be written, in chunks
+            final_file_path (str): path to the file where the colors will be passed
+        """
+        self._strategy.write_chunks(chunks, final_file_path)
@@ -0,0 +1,11 @@
+from harmony.data_access.color_names_index import (
+    ColorNamesIndex,
+    calc_color_proximity,
+)
+from harmony.data_access.color_names_lookup_table import ColorNamesLookupTable
+from harmony.data_access.color_names_storage import (
+    ColorNamesStorage,
+    get_color_names_index,
+    get_color_names_lookup_table,
+)
+from harmony.data_access.nearest_color_names import NearestColorNameFinder
@@ -0,0 +1,10 @@
+"""Build the binary color names database shipped next to the JSON resource"""
+
+import rich
+
+from harmony.data_access.color_names_storage import ColorNamesStorage
+
+if __name__ == "__main__":
+    rich.print(
+        f"[green]Color names database saved to {ColorNamesStorage().build_database()}"
+    )
@@ -0,0 +1,190 @@
+import hashlib
+import logging
+import mmap
+import struct
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from harmony import core
+from harmony.data_access.database_arrays import (
+    ArraysReader,
+    DatabaseHeader,
+    NamesTable,
+    get_array_bytes,
+)
+
+
+class ColorNamesDatabase:
+    """Compact binary copy of the color names resource.
+
+    The file holds the RGB and HSL values of every color name already converted, an
+    interned table with the names and the SHA-256 of the JSON resource it was built
+    from, which is used for detecting when it is stale. The layout is:
+
+    - header: magic, format version, digest, amount of colors, amount of names and
+      size of the names blob
+    - saturations and luminosities as 64 bit floats
+    - hues as 32 bit integers
+    - red, green and blue as 8 bit integers
+    - the position of each color name in the names table as 32 bit integers
+    - the offsets of the names in the blob as 32 bit integers
+    - the names encoded as UTF-8
+    """
+
+    MAGIC = b"HARMONY\x00"
+    # bump it whenever the layout or the convertion of the colors change
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct("<8sI32sIII")
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def write(
+        self,
+        color_names: Sequence[core.ColorName],
+        rgbs: Sequence[core.RGB],
+        digest: bytes,
+    ) -> None:
+        """Write the database file
+
+        Args:
+            color_names (Sequence[ColorName]): color names, with their HSL values
+            rgbs (Sequence[RGB]): RGB of each color name
+            digest (bytes): SHA-256 of the resource the color names were read from
+        """
+        names_table = NamesTable.from_color_names(color_names)
+        self._path.write_bytes(
+            self.HEADER.pack(
+                self.MAGIC,
+                self.FORMAT_VERSION,
+                digest,
+                len(color_names),
+                len(names_table.positions),
+                names_table.offsets[-1],
+            )
+            + self._get_colors_bytes(color_names, rgbs)
+            + names_table.get_bytes(color_names)
+        )
+
+    @staticmethod
+    def _get_colors_bytes(
+        color_names: Sequence[core.ColorName], rgbs: Sequence[core.RGB]
+    ) -> bytes:
+        return b"".join(
+            (
+                get_array_bytes("d", (name.hsl.saturation for name in color_names)),
+                get_array_bytes("d", (name.hsl.luminosity for name in color_names)),
+                get_array_bytes("i", (name.hsl.hue for name in color_names)),
+                get_array_bytes(
+                    "B",
+                    (
+                        component
+                        for rgb in rgbs
+                        for component in (rgb.red, rgb.green, rgb.blue)
+                    ),
+                ),
+            )
+        )
+
+    def read(self, expected_digest: bytes) -> Optional[List[core.ColorName]]:
+        """Read the color names from the database file
+
+        Args:
+            expected_digest (bytes): SHA-256 of the current color names resource
+
+        Returns:
+            Optional[List[ColorName]]: the color names, or `None` when the file is
+            missing, corrupted or was built from another version of the resource
+        """
+        try:
+            with self._path.open("rb") as database_file, mmap.mmap(
+                database_file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as database_map:
+                return self._read_from_buffer(memoryview(database_map), expected_digest)
+
+        except (BufferError, OSError, ValueError, struct.error) as exception:
+            self._logger.debug(
+                "Unable to read the color names database: %(exception)s",
+                {"exception": exception},
+            )
+            return None
+
+    def _read_from_buffer(
+        self, buffer: memoryview, expected_digest: bytes
+    ) -> Optional[List[core.ColorName]]:
+        try:
+            return self._read_color_names(buffer, expected_digest)
+
+        finally:
+            buffer.release()
+
+    def _read_color_names(
+        self, buffer: memoryview, expected_digest: bytes
+    ) -> Optional[List[core.ColorName]]:
+        header = DatabaseHeader._make(self.HEADER.unpack_from(buffer))
+
+        if not self._is_header_valid(header, expected_digest):
+            return None
+
+        return self._read_arrays(ArraysReader(buffer, self.HEADER.size), header)
+
+    def _is_header_valid(self, header: DatabaseHeader, expected_digest: bytes) -> bool:
+        return (
+            self._is_format_known(header)
+            and self._is_up_to_date(header.digest, expected_digest)
+            and sys.byteorder == "little"
+        )
+
+    def _is_format_known(self, header: DatabaseHeader) -> bool:
+        is_known = (header.magic, header.format_version) == (
+            self.MAGIC,
+            self.FORMAT_VERSION,
+        )
+
+        if not is_known:
+            self._logger.debug("Color names database has an unknown format")
+
+        return is_known
+
+    def _is_up_to_date(self, digest: bytes, expected_digest: bytes) -> bool:
+        if digest != expected_digest:
+            self._logger.debug("Color names database is stale")
+
+        return digest == expected_digest
+
+    def _read_arrays(
+        self, reader: ArraysReader, header: DatabaseHeader
+    ) -> List[core.ColorName]:
+        hsls = self._read_hsls(reader, header.colors_count)
+
+        return [
+            core.ColorName(name, hsl)
+            for name, hsl in zip(self._read_names(reader, header), hsls)
+        ]
+
+    @staticmethod
+    def _read_hsls(reader: ArraysReader, colors_count: int) -> List[core.HSL]:
+        saturations = reader.read("d", colors_count)
+        luminosities = reader.read("d", colors_count)
+
+        return [
+            core.HSL(*values)
+            for values in zip(reader.read("i", colors_count), saturations, luminosities)
+        ]
+
+    @staticmethod
+    def _read_names(reader: ArraysReader, header: DatabaseHeader) -> List[str]:
+        reader.skip(header.colors_count * 3)  # the RGB values are not needed for naming
+        names_positions = reader.read("I", header.colors_count)
+        names_table = NamesTable.decode_names(
+            reader, header.names_count, header.blob_size
+        )
+
+        return [names_table[position] for position in names_positions]
+
+
+def calc_resource_digest(resource_path: Path) -> bytes:
+    """Return the SHA-256 of the passed resource"""
+    return hashlib.sha256(resource_path.read_bytes()).digest()
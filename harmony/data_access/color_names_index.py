@@ -0,0 +1,205 @@
+import math
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from harmony import core
+from harmony.core import exceptions
+
+HSLPoint = Tuple[float, float, float]
+
+
+def calc_color_proximity(current_hsl: HSLPoint, goal_hsl: HSLPoint) -> float:
+    """Return how far two colors are from each other.
+
+    The hue factor is weighted by 3 and normalized by the maximum hue value, while
+    saturation and luminosity are taken as absolute differences. The operations are
+    done in the same order as the original proximity calculation, so the results are
+    identical bit by bit
+
+    Args:
+        current_hsl (HSLPoint): hue, saturation and luminosity of the first color
+        goal_hsl (HSLPoint): hue, saturation and luminosity of the second color
+
+    Returns:
+        float: the proximity value, the smaller the closer
+    """
+    return (
+        (abs(goal_hsl[0] - current_hsl[0]) / core.MAXIMUM_HUE_VALUE) * 3
+        + abs(goal_hsl[1] - current_hsl[1])
+        + abs(goal_hsl[2] - current_hsl[2])
+    )
+
+
+def _calc_distance_to_range(value: float, lowest: float, biggest: float) -> float:
+    if value < lowest:
+        return lowest - value
+
+    return value - biggest if value > biggest else 0
+
+
+class _Node(NamedTuple):
+    """Node of the k-d tree, holding the bounding box of the points under it"""
+
+    lowest: HSLPoint
+    biggest: HSLPoint
+    indices: Sequence[int] = ()
+    children: Tuple["_Node", ...] = ()
+
+
+def _calc_lower_bound(node: _Node, goal: HSLPoint) -> float:
+    return (
+        (
+            _calc_distance_to_range(goal[0], node.lowest[0], node.biggest[0])
+            / core.MAXIMUM_HUE_VALUE
+        )
+        * 3
+        + _calc_distance_to_range(goal[1], node.lowest[1], node.biggest[1])
+        + _calc_distance_to_range(goal[2], node.lowest[2], node.biggest[2])
+    )
+
+
+class _NearestPointSearch:
+    """Search of the point nearest to a goal in the k-d tree, which keeps the
+    proximity and the position of the nearest point found so far"""
+
+    def __init__(self, points: Sequence[HSLPoint], goal: HSLPoint) -> None:
+        self._points = points
+        self._goal = goal
+        self.nearest: Tuple[float, int] = (math.inf, -1)
+
+    def search(self, node: _Node) -> None:
+        """Search the points of the node and of the children near enough, the
+        nearest children first"""
+        self._update_nearest(node.indices)
+
+        for lower_bound, child in sorted(
+            ((_calc_lower_bound(child, self._goal), child) for child in node.children),
+            key=lambda pair: pair[0],
+        ):
+            self._search_if_near(lower_bound, child)
+
+    def _search_if_near(self, lower_bound: float, node: _Node) -> None:
+        if lower_bound <= self.nearest[0]:
+            self.search(node)
+
+    def _update_nearest(self, indices: Sequence[int]) -> None:
+        # ties are broken by the position, as the tuples are compared in order
+        for index in indices:
+            self.nearest = min(
+                self.nearest,
+                (calc_color_proximity(self._points[index], self._goal), index),
+            )
+
+
+class ColorNamesIndex:
+    """K-d tree over the HSL values of the color names, used for finding the nearest
+    color name in logarithmic time.
+
+    The boxes are pruned with the same weighted proximity used for ranking the names,
+    and since the floating point operations are monotonic, the lower bound of a box is
+    never bigger than the proximity of any point inside it. Ties are broken by the
+    position of the name in the database, as the stable sort used to do
+    """
+
+    LEAF_SIZE = 8
+
+    def __init__(self, color_names: Sequence[core.ColorName]) -> None:
+        self._names: List[str] = [color_name.name for color_name in color_names]
+        self._points: List[HSLPoint] = [
+            self._get_point_from_hsl(color_name.hsl) for color_name in color_names
+        ]
+        self._root = self._build(list(range(len(self._points))), 0)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def get_name(self, index: int) -> str:
+        """Return the color name at the passed position of the database"""
+        return self._names[index]
+
+    def find_nearest_name(self, hsl: core.HSL) -> str:
+        """Return the name of the color nearest to the passed HSL"""
+        return self._names[self.find_nearest_index(hsl)]
+
+    def find_nearest_index(self, hsl: core.HSL) -> int:
+        """Return the database position of the color nearest to the passed HSL
+
+        Args:
+            hsl (HSL): HSL of the color to name
+
+        Returns:
+            int: position of the nearest color in the database
+        """
+        if self._root is None:
+            raise exceptions.InvalidFileException("No color names were loaded")
+
+        search = _NearestPointSearch(self._points, self._get_point_from_hsl(hsl))
+        search.search(self._root)
+
+        return search.nearest[1]
+
+    def _build(self, indices: List[int], depth: int) -> Optional[_Node]:
+        if not indices:
+            return None
+
+        return self._build_node(indices, depth)
+
+    def _build_node(self, indices: List[int], depth: int) -> _Node:
+        bounding_box = self._get_bounding_box(indices)
+
+        if len(indices) <= self.LEAF_SIZE:
+            return _Node(*bounding_box, indices=tuple(indices))
+
+        return _Node(
+            *bounding_box,
+            children=self._build_children(
+                indices, self._get_widest_axis(*bounding_box, depth), depth
+            ),
+        )
+
+    def _build_children(
+        self, indices: List[int], axis: int, depth: int
+    ) -> Tuple[_Node, ...]:
+        indices.sort(key=lambda index: (self._points[index][axis], index))
+        median = len(indices) // 2
+
+        return tuple(
+            node
+            for node in (
+                self._build(indices[:median], depth + 1),
+                self._build(indices[median:], depth + 1),
+            )
+            if node is not None
+        )
+
+    def _get_bounding_box(self, indices: Sequence[int]) -> Tuple[HSLPoint, HSLPoint]:
+        points = [self._points[index] for index in indices]
+        lowest = (
+            min(point[0] for point in points),
+            min(point[1] for point in points),
+            min(point[2] for point in points),
+        )
+        biggest = (
+            max(point[0] for point in points),
+            max(point[1] for point in points),
+            max(point[2] for point in points),
+        )
+
+        return lowest, biggest
+
+    @staticmethod
+    def _get_widest_axis(lowest: HSLPoint, biggest: HSLPoint, depth: int) -> int:
+        # the hue is weighted the same way as in the proximity calculation
+        widths = (
+            (biggest[0] - lowest[0]) / core.MAXIMUM_HUE_VALUE * 3,
+            biggest[1] - lowest[1],
+            biggest[2] - lowest[2],
+        )
+
+        if max(widths) <= 0:
+            return depth % 3
+
+        return widths.index(max(widths))
+
+    @staticmethod
+    def _get_point_from_hsl(hsl: core.HSL) -> HSLPoint:
+        return (hsl.hue, hsl.saturation, hsl.luminosity)
@@ -0,0 +1,131 @@
+import logging
+import struct
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, Sequence
+
+import numpy as np
+
+from harmony import convertions, core
+from harmony.data_access.nearest_color_names import NearestColorNameFinder
+
+ProgressCallback = Callable[[int], None]
+
+
+class ColorNamesLookupTable:
+    """Dense table with the position of the nearest color name for each of the 2^24
+    RGB colors.
+
+    The file has a header with a magic, the format version and the SHA-256 of the
+    color names resource it was built from, followed by one 16 bit unsigned integer per
+    color, indexed by `red << 16 | green << 8 | blue`. It is memory-mapped when opened,
+    so naming a color is a single array access
+    """
+
+    MAGIC = b"HARMONYT"
+    # bump it whenever the layout or the color names proximity calculation change
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct("<8sI32s")
+    COLORS_COUNT = 1 << 24
+    ITEM_TYPE = np.dtype("<u2")
+    REDS_PER_STEP = 16
+
+    def __init__(self, path: Path) -> None:
+        self._table_file = core.LookupTableFile(
+            path, self.COLORS_COUNT * self.ITEM_TYPE.itemsize
+        )
+        self._logger = logging.getLogger(self.__class__.__name__)
+        self._table: Optional[memoryview] = None
+
+    @property
+    def path(self) -> Path:
+        """Return the path to the table file"""
+        return self._table_file.path
+
+    @classmethod
+    def from_digest(cls, digest: bytes) -> "ColorNamesLookupTable":
+        """Make the table cached for the color names resource with the passed digest"""
+        return cls(
+            core.CacheUtils.get_cache_directory().joinpath(
+                f"color-names-{digest.hex()[:16]}.lut"
+            )
+        )
+
+    def open(self, expected_digest: bytes) -> bool:
+        """Memory-map the table file
+
+        Args:
+            expected_digest (bytes): SHA-256 of the current color names resource
+
+        Returns:
+            bool: `False` when the file is missing, unreadable, corrupted or stale
+        """
+        try:
+            tables = self._table_file.open(self._make_header(expected_digest))
+
+        except (OSError, ValueError) as exception:
+            self._log_unopened_table(exception)
+            return False
+
+        self._table = None if tables is None else tables.cast("H")
+        return self._table is not None
+
+    def _make_header(self, digest: bytes) -> bytes:
+        return self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION, digest)
+
+    def _log_unopened_table(self, exception: Exception) -> None:
+        # a missing table is the usual case until the nametable command builds it
+        self._logger.log(
+            (
+                logging.DEBUG
+                if isinstance(exception, FileNotFoundError)
+                else logging.WARNING
+            ),
+            "Unable to open the color names lookup table, naming the colors "
+            + "without it: %(exception)s",
+            {"exception": exception},
+        )
+
+    def get_name_index(self, rgb: core.RGB) -> int:
+        """Return the database position of the color name nearest to the passed RGB"""
+        if self._table is None:
+            raise core.exceptions.InvalidFileException(
+                "The color names lookup table is not opened"
+            )
+
+        return self._table[(rgb.red << 16) | (rgb.green << 8) | rgb.blue]
+
+    def build(
+        self,
+        color_names: Sequence[core.ColorName],
+        digest: bytes,
+        on_progress: ProgressCallback = lambda advance: None,
+    ) -> None:
+        """Build the table file, naming every RGB color
+
+        Args:
+            color_names (Sequence[ColorName]): color names, in the database order
+            digest (bytes): SHA-256 of the resource the color names were read from
+            on_progress (ProgressCallback): called with the amount of colors named
+            after each step
+        """
+        finder = NearestColorNameFinder(color_names)
+        self._table_file.build(
+            self._make_header(digest),
+            lambda table_file: self._write_indices(table_file, finder, on_progress),
+        )
+
+    def _write_indices(
+        self,
+        table_file: BinaryIO,
+        finder: NearestColorNameFinder,
+        on_progress: ProgressCallback,
+    ) -> None:
+        for rgb_array in convertions.iterate_rgb_cube_slices(self.REDS_PER_STEP):
+            table_file.write(
+                finder.find_nearest_indices(
+                    convertions.RGBArrayToHSLConverter().convert(rgb_array)
+                )
+                .astype(self.ITEM_TYPE)
+                .tobytes()
+            )
+            on_progress(len(rgb_array))
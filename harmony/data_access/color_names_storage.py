@@ -0,0 +1,173 @@
+import functools
+import json
+import logging
+from pathlib import Path
+from typing import Iterable, List, Mapping, Optional, TextIO
+
+from harmony import convertions, core
+from harmony.data_access.color_names_database import (
+    ColorNamesDatabase,
+    calc_resource_digest,
+)
+from harmony.data_access.color_names_index import ColorNamesIndex
+from harmony.data_access.color_names_lookup_table import (
+    ColorNamesLookupTable,
+    ProgressCallback,
+)
+
+
+class ColorNamesStorage:
+    """Provide methods for accessing the color names table in the database"""
+
+    def __init__(self) -> None:
+        self._logger = logging.getLogger(self.__class__.__name__)
+
+    def get_color_name_by_hsl(self, hsl: core.HSL) -> str:
+        """Get the name of the nearest color in database
+
+        Args:
+            hsl (HSL): HSL of the color to name
+
+        Returns:
+            str: name found
+        """
+        return get_color_names_index().find_nearest_name(hsl)
+
+    def get_color_name_by_rgb(self, rgb: core.RGB) -> str:
+        """Get the name of the nearest color in database.
+
+        The lookup table is used when it was built, otherwise the color is converted
+        to HSL and searched in the index. Both give the same name
+
+        Args:
+            rgb (RGB): RGB of the color to name
+
+        Returns:
+            str: name found
+        """
+        lookup_table = (
+            get_color_names_lookup_table() if self._is_in_lookup_table(rgb) else None
+        )
+
+        if lookup_table is None:
+            return self.get_color_name_by_hsl(convertions.convert_rgb_to_hsl(rgb))
+
+        return get_color_names_index().get_name(lookup_table.get_name_index(rgb))
+
+    @staticmethod
+    def _is_in_lookup_table(rgb: core.RGB) -> bool:
+        return all(
+            isinstance(component, int) and 0 <= component <= core.MAXIMUM_RGB_VALUE
+            for component in (rgb.red, rgb.green, rgb.blue)
+        )
+
+    def get_color_names(self) -> List[core.ColorName]:
+        """Return all the color names in the database, in the order they are stored.
+
+        The binary database is used when it is up to date with the JSON resource,
+        otherwise the names are read and converted from the JSON resource
+        """
+        color_names = ColorNamesDatabase(self._get_database_path()).read(
+            self.get_resource_digest()
+        )
+
+        if color_names is None:
+            self._logger.info("Reading color names from the JSON resource")
+            return self.get_color_names_from_json()
+
+        return color_names
+
+    def get_color_names_from_json(self) -> List[core.ColorName]:
+        """Return all the color names from the JSON resource, converting them to HSL"""
+        with self._get_json_path().open("r", encoding="utf8") as json_file:
+            return list(self.__yield_color_names(json_file))
+
+    def build_database(self) -> Path:
+        """Build the binary database from the JSON resource
+
+        Returns:
+            Path: path to the database built
+        """
+        color_names = self.get_color_names_from_json()
+
+        with self._get_json_path().open("r", encoding="utf8") as json_file:
+            rgbs = [
+                self.__make_rgb_from_data(color_name_data)
+                for color_name_data in json.loads(json_file.read())
+            ]
+
+        ColorNamesDatabase(self._get_database_path()).write(
+            color_names, rgbs, self.get_resource_digest()
+        )
+
+        return self._get_database_path()
+
+    def build_lookup_table(
+        self, on_progress: ProgressCallback = lambda advance: None
+    ) -> Path:
+        """Build the lookup table with the color name of every RGB color in the cache
+        directory
+
+        Args:
+            on_progress (ProgressCallback): called with the amount of colors named
+            after each step
+
+        Returns:
+            Path: path to the lookup table built
+        """
+        digest = self.get_resource_digest()
+        lookup_table = ColorNamesLookupTable.from_digest(digest)
+        lookup_table.build(self.get_color_names(), digest, on_progress)
+        get_color_names_lookup_table.cache_clear()
+
+        return lookup_table.path
+
+    def get_resource_digest(self) -> bytes:
+        """Return the SHA-256 of the color names resource"""
+        return calc_resource_digest(self._get_json_path())
+
+    @staticmethod
+    def _get_json_path() -> Path:
+        return Path(core.ResourceUtils.get_resource(core.Resources.COLOR_NAMES_JSON))
+
+    @staticmethod
+    def _get_database_path() -> Path:
+        return Path(
+            core.ResourceUtils.get_resource(core.Resources.COLOR_NAMES_DATABASE)
+        )
+
+    def __yield_color_names(self, json_file: TextIO) -> Iterable[core.ColorName]:
+        """Extract and yield the data from the json file"""
+        return map(self.__make_color_name, json.loads(json_file.read()))
+
+    def __make_color_name(self, color_name_data: Mapping[str, str]) -> core.ColorName:
+        return core.ColorName(
+            color_name_data["name"],
+            self.__make_hsl_from_data(color_name_data),
+        )
+
+    def __make_hsl_from_data(self, color_name_data: Mapping[str, str]) -> core.HSL:
+        return convertions.convert_rgb_to_hsl(
+            self.__make_rgb_from_data(color_name_data)
+        )
+
+    def __make_rgb_from_data(self, color_name_data: Mapping[str, str]) -> core.RGB:
+        return core.RGBUtils.get_rgb_from_hexcode(color_name_data["color"])
+
+
+@functools.lru_cache(maxsize=1)
+def get_color_names_index() -> ColorNamesIndex:
+    """Return the process-wide index of the color names, building it on the first
+    call"""
+    return ColorNamesIndex(ColorNamesStorage().get_color_names())
+
+
+@functools.lru_cache(maxsize=1)
+def get_color_names_lookup_table() -> Optional[ColorNamesLookupTable]:
+    """Return the process-wide lookup table of the color names, or `None` when it was
+    not built for the current color names resource or it cannot be opened, so the
+    colors are named with the index"""
+    digest = ColorNamesStorage().get_resource_digest()
+    lookup_table = ColorNamesLookupTable.from_digest(digest)
+
+    return lookup_table if lookup_table.open(digest) else None
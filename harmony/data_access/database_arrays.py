@@ -0,0 +1,95 @@
+import itertools
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence
+
+from harmony import core
+
+
+class DatabaseHeader(NamedTuple):
+    """Fields of the header of the database file"""
+
+    magic: bytes
+    format_version: int
+    digest: bytes
+    colors_count: int
+    names_count: int
+    blob_size: int
+
+
+class ArraysReader:
+    """Reads the arrays laid one after the other in a buffer"""
+
+    def __init__(self, buffer: memoryview, offset: int) -> None:
+        self._buffer = buffer
+        self._offset = offset
+
+    def read(self, type_code: str, count: int) -> List[Any]:
+        """Return the next `count` values of the passed array type code"""
+        size = struct.calcsize(type_code) * count
+        values = self.read_view(size).cast(type_code)  # type: ignore[call-overload]
+
+        return values.tolist()
+
+    def read_view(self, size: int) -> memoryview:
+        """Return a view of the next `size` bytes"""
+        self._offset += size
+        return self._buffer[self._offset - size : self._offset]
+
+    def skip(self, size: int) -> None:
+        """Move past the next `size` bytes"""
+        self._offset += size
+
+
+class NamesTable(NamedTuple):
+    """Interned table with the distinct color names encoded as UTF-8, with the offset
+    of each name in the blob they are joined in"""
+
+    encoded_names: List[bytes]
+    offsets: List[int]
+    positions: Dict[str, int]
+
+    @classmethod
+    def from_color_names(cls, color_names: Sequence[core.ColorName]) -> "NamesTable":
+        """Make the table of the distinct names, in the order they first appear"""
+        names = list(dict.fromkeys(name.name for name in color_names))
+        encoded_names = [name.encode("utf8") for name in names]
+
+        return cls(
+            encoded_names,
+            [0, *itertools.accumulate(len(name) for name in encoded_names)],
+            {name: position for position, name in enumerate(names)},
+        )
+
+    def get_bytes(self, color_names: Sequence[core.ColorName]) -> bytes:
+        """Return the position of each color name in the table, the offsets of the
+        names and the blob with the names"""
+        return (
+            get_array_bytes("I", (self.positions[name.name] for name in color_names))
+            + get_array_bytes("I", self.offsets)
+            + b"".join(self.encoded_names)
+        )
+
+    @staticmethod
+    def decode_names(
+        reader: ArraysReader, names_count: int, blob_size: int
+    ) -> List[str]:
+        """Read the offsets and the blob of the names table and decode the names"""
+        names_offsets = reader.read("I", names_count + 1)
+        blob = bytes(reader.read_view(blob_size))
+
+        return [
+            blob[names_offsets[index] : names_offsets[index + 1]].decode("utf8")
+            for index in range(names_count)
+        ]
+
+
+def get_array_bytes(type_code: str, values: Iterable[Any]) -> bytes:
+    """Return the values packed as a little-endian array of the passed type code"""
+    values_array = array(type_code, values)
+
+    if sys.byteorder != "little":
+        values_array.byteswap()
+
+    return values_array.tobytes()
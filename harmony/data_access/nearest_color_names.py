@@ -0,0 +1,108 @@
+import itertools
+from typing import Iterator, Sequence, Tuple
+
+import numpy as np
+
+from harmony import convertions, core
+
+
+class NearestColorNameFinder:
+    """Find the nearest color name of many colors at once.
+
+    The colors are grouped by hue, which is an integer, so the hue factor of the
+    proximity is the same for every color in a group. The names are visited in
+    blocks, from the lowest hue factor to the biggest, and a color stops being checked
+    when the hue factor alone is already bigger than the proximity of the nearest name
+    found for it. The proximity is calculated with the same operations as the
+    `ColorNamesIndex`, and ties are broken by the position of the name in the database
+    """
+
+    BLOCK_SIZE = 64
+
+    def __init__(self, color_names: Sequence[core.ColorName]) -> None:
+        self._names = convertions.HSLArrays(
+            np.array([name.hsl.hue for name in color_names], dtype=np.int64),
+            np.array([name.hsl.saturation for name in color_names], dtype=np.float64),
+            np.array([name.hsl.luminosity for name in color_names], dtype=np.float64),
+        )
+
+    def find_nearest_indices(self, hsl: convertions.HSLArrays) -> np.ndarray:
+        """Return the database position of the nearest color name of each color"""
+        nearest_indices = np.empty(len(hsl.hue), dtype=np.int64)
+        sorted_by_hue = np.argsort(hsl.hue, kind="stable")
+
+        for group in np.split(
+            sorted_by_hue, np.flatnonzero(np.diff(hsl.hue[sorted_by_hue])) + 1
+        ):
+            nearest_indices[group] = _HueGroupSearch(
+                self._names,
+                convertions.HSLArrays(*(component[group] for component in hsl)),
+            ).search(self.BLOCK_SIZE)
+
+        return nearest_indices
+
+
+class _HueGroupSearch:
+    """Search of the nearest color names of a group of colors with the same hue,
+    keeping the proximity and the position of the nearest name found so far for each
+    color"""
+
+    def __init__(
+        self, names: convertions.HSLArrays, colors: convertions.HSLArrays
+    ) -> None:
+        self._names = names
+        self._colors = colors
+        self._hue_factors = (
+            np.abs(int(colors.hue[0]) - names.hue) / core.MAXIMUM_HUE_VALUE
+        ) * 3
+        self._nearest_proximities = np.full(len(colors.hue), np.inf)
+        self._nearest_indices = np.full(len(colors.hue), len(names.hue))
+
+    def search(self, block_size: int) -> np.ndarray:
+        """Return the database position of the nearest color name of each color,
+        checking the names in blocks of the passed size"""
+        for active, block in itertools.takewhile(
+            lambda candidates: candidates[0].size > 0,
+            self._iterate_candidates(block_size),
+        ):
+            self._update_nearest(active, block)
+
+        return self._nearest_indices
+
+    def _iterate_candidates(
+        self, block_size: int
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        # the colors still checked are computed after the previous blocks were
+        names_order = np.lexsort((np.arange(len(self._names.hue)), self._hue_factors))
+
+        for block_start in range(0, len(names_order), block_size):
+            yield np.flatnonzero(
+                self._nearest_proximities >= self._hue_factors[names_order[block_start]]
+            ), np.sort(names_order[block_start : block_start + block_size])
+
+    def _update_nearest(self, active: np.ndarray, block: np.ndarray) -> None:
+        proximities = (
+            self._hue_factors[block][np.newaxis, :]
+            + np.abs(
+                self._colors.saturation[active, np.newaxis]
+                - self._names.saturation[block]
+            )
+        ) + np.abs(
+            self._colors.luminosity[active, np.newaxis] - self._names.luminosity[block]
+        )
+        block_nearest = np.argmin(proximities, axis=1)
+        self._keep_nearer(
+            active,
+            proximities[np.arange(active.size), block_nearest],
+            block[block_nearest],
+        )
+
+    def _keep_nearer(
+        self, active: np.ndarray, proximities: np.ndarray, indices: np.ndarray
+    ) -> None:
+        is_nearer = (proximities < self._nearest_proximities[active]) | (
+            (proximities == self._nearest_proximities[active])
+            & (indices < self._nearest_indices[active])
+        )
+        self._nearest_proximities[active[is_nearer]] = proximities[is_nearer]
+        self._nearest_indices[active[is_nearer]] = indices[is_nearer]
@@ -1,17 +1,45 @@
 # pylint: disable=too-many-arguments,too-many-locals
 from pathlib import Path
+from typing import Optional
 
-from harmony import core
-from harmony.commands import ToTxtCommandUtils
+from harmony import core, core_services
+from harmony.commands import ToTxtCommandUtils, make_extraction_cache
+from harmony.from_image_reading.constants import (
+    Image2TxtCommandArguments,
+    QuantizationAlgorithmName,
+)
+from harmony.from_image_reading.quantizations import make_color_quantization
 from harmony.from_image_reading.services import ImageFileReading
 
 
 def image2txt(
+    *,
     path: Path = core.CommonArguments.file_or_dir_path,
     color_format: core.ColorFormat = core.CommonArguments.color_format,
     recursively: bool = core.CommonArguments.recursively,
+    deduplication_key: core.DeduplicationKey = core.CommonArguments.deduplication_key,
+    sampling_resolution: Optional[int] = Image2TxtCommandArguments.sampling_resolution,
+    quantization: QuantizationAlgorithmName = Image2TxtCommandArguments.quantization,
+    colors_count: int = Image2TxtCommandArguments.colors_count,
+    workers: int = core.CommonArguments.workers,
+    chunk_size: int = core.CommonArguments.chunk_size,
+    jobs: int = core.CommonArguments.jobs,
+    use_cache: bool = core.CommonArguments.use_cache,
+    hash_contents: bool = core.CommonArguments.hash_contents,
 ) -> None:
     """Extract the colors from an image and write them into a plain text file"""
     ToTxtCommandUtils(
-        ImageFileReading(), color_format, recursively
-    ).convert_to_txt_file(path)
+        ImageFileReading(
+            deduplication_key,
+            sampling_resolution,
+            make_color_quantization(quantization),
+            colors_count,
+        ),
+        color_format,
+        recursively,
+    ).convert_to_txt_file(
+        path,
+        core_services.DirectoryReadingOptions(
+            workers, chunk_size, jobs, make_extraction_cache(use_cache, hash_contents)
+        ),
+    )
@@ -0,0 +1,43 @@
+# pylint: disable=too-few-public-methods,too-many-ancestors
+
+from enum import Enum
+from typing import Optional
+
+import typer
+
+
+class QuantizationAlgorithmName(str, Enum):
+    """Constants for the palette quantization algorithms"""
+
+    NONE = "none"
+    MEDIAN_CUT = "median-cut"
+    KMEANS = "kmeans"
+    OCTREE = "octree"
+
+
+class Image2TxtCommandArguments:
+    """Store the "image2txt" command arguments"""
+
+    sampling_resolution: Optional[int] = typer.Option(
+        None,
+        "--sampling-resolution",
+        min=0,
+        help="Side of the square grid the image is resized to before reading its "
+        + "colors, or 0 for reading it in its full resolution. By default, it is 16 "
+        + "without quantization and the full resolution with it",
+    )
+    quantization: QuantizationAlgorithmName = typer.Option(
+        QuantizationAlgorithmName.NONE.value,
+        "--quantization",
+        "-q",
+        case_sensitive=False,
+        help="Algorithm for reducing the colors of the image to its dominant ones. "
+        + "Without it, every distinct color sampled is extracted",
+    )
+    colors_count: int = typer.Option(
+        8,
+        "--colors",
+        "-k",
+        min=1,
+        help="Amount of dominant colors extracted when quantizing the image",
+    )
@@ -0,0 +1,15 @@
+from harmony.from_image_reading.quantizations.factories import (
+    QUANTIZATION_MAPPING,
+    make_color_quantization,
+)
+from harmony.from_image_reading.quantizations.histograms import (
+    ColorHistogram,
+    pack_rgb,
+)
+from harmony.from_image_reading.quantizations.kmeans import KMeansQuantization
+from harmony.from_image_reading.quantizations.median_cut import MedianCutQuantization
+from harmony.from_image_reading.quantizations.octree import OctreeQuantization
+from harmony.from_image_reading.quantizations.palettes import (
+    ColorQuantization,
+    QuantizedPalette,
+)
@@ -0,0 +1,31 @@
+from typing import Dict, Optional, Type
+
+from harmony.from_image_reading.constants import QuantizationAlgorithmName
+from harmony.from_image_reading.quantizations.kmeans import KMeansQuantization
+from harmony.from_image_reading.quantizations.median_cut import MedianCutQuantization
+from harmony.from_image_reading.quantizations.octree import OctreeQuantization
+from harmony.from_image_reading.quantizations.palettes import ColorQuantization
+
+QUANTIZATION_MAPPING: Dict[QuantizationAlgorithmName, Type[ColorQuantization]] = {
+    QuantizationAlgorithmName.MEDIAN_CUT: MedianCutQuantization,
+    QuantizationAlgorithmName.KMEANS: KMeansQuantization,
+    QuantizationAlgorithmName.OCTREE: OctreeQuantization,
+}
+
+
+def make_color_quantization(
+    algorithm_name: QuantizationAlgorithmName,
+) -> Optional[ColorQuantization]:
+    """Given an algorithm name, make the correspondent quantization
+
+    Args:
+        algorithm_name (QuantizationAlgorithmName): name of the algorithm to be made
+
+    Returns:
+        Optional[ColorQuantization]: correspondent quantization, or `None` when the
+        colors must not be quantized
+    """
+    if algorithm_name == QuantizationAlgorithmName.NONE:
+        return None
+
+    return QUANTIZATION_MAPPING[algorithm_name]()
@@ -0,0 +1,118 @@
+from typing import NamedTuple
+
+import numpy as np
+
+HISTOGRAM_BITS = 5
+DISCARDED_BITS = 8 - HISTOGRAM_BITS
+BINS_COUNT = 1 << (3 * HISTOGRAM_BITS)
+PIXELS_PER_BLOCK = 1 << 18
+
+
+class ColorHistogram(NamedTuple):
+    """Pixels of an image grouped by the 5 most significant bits of each component.
+
+    Only the non-empty bins are kept, with their coordinates, their amount of pixels
+    and the sum of the RGB of their pixels, so the quantizations work over at most
+    32768 bins, no matter the size of the image
+    """
+
+    bins: np.ndarray
+    counts: np.ndarray
+    sums: np.ndarray
+
+    @classmethod
+    def from_pixels(cls, pixels: np.ndarray) -> "ColorHistogram":
+        """Make the histogram of an (N, 3) array of 8 bit RGB pixels.
+
+        Each pixel is counted, and its RGB added up, straight in its bin, so the
+        arrays allocated only have a place per bin, and the pixels are processed in
+        blocks so the temporary arrays stay small
+
+        Args:
+            pixels (np.ndarray): RGB of the pixels
+
+        Returns:
+            ColorHistogram: histogram of the pixels
+        """
+        counts = np.zeros(BINS_COUNT, dtype=np.int64)
+        sums = np.zeros((BINS_COUNT, 3), dtype=np.float64)
+
+        for block_start in range(0, len(pixels), PIXELS_PER_BLOCK):
+            _add_to_bins(
+                pixels[block_start : block_start + PIXELS_PER_BLOCK], counts, sums
+            )
+
+        return cls._from_filled_bins(counts, sums)
+
+    @classmethod
+    def _from_filled_bins(
+        cls, counts: np.ndarray, sums: np.ndarray
+    ) -> "ColorHistogram":
+        filled_keys = np.flatnonzero(counts)
+
+        return cls(unpack_bins(filled_keys), counts[filled_keys], sums[filled_keys])
+
+    @property
+    def means(self) -> np.ndarray:
+        """Return the mean RGB of the pixels of each bin"""
+        return self.sums / self.counts[:, np.newaxis]
+
+
+def pack_rgb(pixels: np.ndarray) -> np.ndarray:
+    """Return the RGB of each pixel of an (N, 3) array as a 24 bit integer"""
+    packed = pixels[:, 0].astype(np.uint32) << 16
+    packed |= pixels[:, 1].astype(np.uint32) << 8
+    packed |= pixels[:, 2]
+
+    return packed
+
+
+def pack_bins(bins: np.ndarray) -> np.ndarray:
+    """Return the coordinates of each bin of an (N, 3) array as a single integer"""
+    bins = bins.astype(np.intp)
+    return (
+        (bins[:, 0] << (2 * HISTOGRAM_BITS))
+        | (bins[:, 1] << HISTOGRAM_BITS)
+        | bins[:, 2]
+    )
+
+
+def unpack_bins(keys: np.ndarray) -> np.ndarray:
+    """Return the coordinates of the bins packed by `pack_bins`"""
+    mask = (1 << HISTOGRAM_BITS) - 1
+
+    return np.stack(
+        (keys >> (2 * HISTOGRAM_BITS), (keys >> HISTOGRAM_BITS) & mask, keys & mask),
+        axis=1,
+    )
+
+
+def sum_by_label(
+    labels: np.ndarray, weights: np.ndarray, labels_count: int
+) -> np.ndarray:
+    """Add up the weights, or each column of them, with the same label
+
+    Args:
+        labels (np.ndarray): label of each weight, between 0 and `labels_count`
+        weights (np.ndarray): 1D or 2D array of weights
+        labels_count (int): amount of labels
+
+    Returns:
+        np.ndarray: sum of the weights of each label
+    """
+    if weights.ndim == 1:
+        return np.bincount(labels, weights=weights, minlength=labels_count)
+
+    return np.stack(
+        [
+            np.bincount(labels, weights=weights[:, column], minlength=labels_count)
+            for column in range(weights.shape[1])
+        ],
+        axis=1,
+    )
+
+
+def _add_to_bins(block: np.ndarray, counts: np.ndarray, sums: np.ndarray) -> None:
+    keys = pack_bins(block >> DISCARDED_BITS)
+    counts += np.bincount(keys, minlength=BINS_COUNT)
+    sums += sum_by_label(keys, block, BINS_COUNT)
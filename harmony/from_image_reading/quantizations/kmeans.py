@@ -0,0 +1,85 @@
+import numpy as np
+
+from harmony.from_image_reading.quantizations.histograms import (
+    ColorHistogram,
+    sum_by_label,
+)
+from harmony.from_image_reading.quantizations.median_cut import MedianCutQuantization
+from harmony.from_image_reading.quantizations.palettes import (
+    ColorQuantization,
+    QuantizedPalette,
+    make_palette,
+)
+
+
+class KMeansQuantization(ColorQuantization):
+    """K-means quantization, weighted by the amount of pixels of each bin and seeded
+    with the median cut palette, so it is deterministic"""
+
+    MAXIMUM_ITERATIONS = 20
+
+    def quantize(
+        self, histogram: ColorHistogram, colors_count: int
+    ) -> QuantizedPalette:
+        centers = (
+            MedianCutQuantization()
+            .quantize(histogram, colors_count)
+            .rgb_array.astype(np.float64)
+        )
+        clustering = _KMeansClustering(histogram, centers)
+        clustering.refine(self.MAXIMUM_ITERATIONS)
+
+        return clustering.make_palette()
+
+
+class _KMeansClustering:
+    """Bins of a histogram grouped by their nearest center"""
+
+    def __init__(self, histogram: ColorHistogram, centers: np.ndarray) -> None:
+        self._histogram = histogram
+        self._means = histogram.means
+        self._centers = centers
+        self._labels = self._get_nearest_centers()
+
+    def refine(self, maximum_iterations: int) -> None:
+        """Move the centers until the bins stay in the same clusters or the
+        iterations run out"""
+        iterations_left = maximum_iterations
+
+        while iterations_left > 0 and self._move_centers():
+            iterations_left -= 1
+
+    def make_palette(self) -> QuantizedPalette:
+        """Make the palette with the mean color of each cluster"""
+        return make_palette(
+            self._sum_by_cluster(self._histogram.counts),
+            self._sum_by_cluster(self._histogram.sums),
+        )
+
+    def _move_centers(self) -> bool:
+        """Move each center to the mean of its cluster, which keeps its place when
+        empty, and return whether any bin changed of cluster"""
+        counts = self._sum_by_cluster(self._histogram.counts)
+        self._centers = np.where(
+            counts[:, np.newaxis] > 0,
+            self._sum_by_cluster(self._histogram.sums)
+            / np.maximum(counts, 1)[:, np.newaxis],
+            self._centers,
+        )
+        labels = self._get_nearest_centers()
+        have_changed = not np.array_equal(labels, self._labels)
+        self._labels = labels
+
+        return have_changed
+
+    def _sum_by_cluster(self, weights: np.ndarray) -> np.ndarray:
+        return sum_by_label(self._labels, weights, len(self._centers))
+
+    def _get_nearest_centers(self) -> np.ndarray:
+        distances = (
+            np.sum(self._centers**2, axis=1)[np.newaxis, :]
+            - 2 * self._means @ self._centers.T
+            + np.sum(self._means**2, axis=1)[:, np.newaxis]
+        )
+
+        return np.argmin(distances, axis=1)
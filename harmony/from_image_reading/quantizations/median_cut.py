@@ -0,0 +1,95 @@
+from typing import List, Optional
+
+import numpy as np
+
+from harmony.from_image_reading.quantizations.histograms import ColorHistogram
+from harmony.from_image_reading.quantizations.palettes import (
+    ColorQuantization,
+    QuantizedPalette,
+    make_palette,
+)
+
+
+class MedianCutQuantization(ColorQuantization):
+    """Median cut quantization, which splits the box with the most pixels spread over
+    the widest range at the weighted median of its widest component until there are
+    enough boxes"""
+
+    def quantize(
+        self, histogram: ColorHistogram, colors_count: int
+    ) -> QuantizedPalette:
+        boxes = self._split_boxes(histogram, colors_count)
+
+        return make_palette(
+            np.array([histogram.counts[box].sum() for box in boxes]),
+            np.array([histogram.sums[box].sum(axis=0) for box in boxes]),
+        )
+
+    def _split_boxes(
+        self, histogram: ColorHistogram, colors_count: int
+    ) -> List[np.ndarray]:
+        boxes: List[np.ndarray] = [np.arange(len(histogram.counts))]
+        box_index = self._find_box_to_split(histogram, boxes, colors_count)
+
+        while box_index is not None:
+            boxes[box_index : box_index + 1] = self._split(histogram, boxes[box_index])
+            box_index = self._find_box_to_split(histogram, boxes, colors_count)
+
+        return boxes
+
+    def _find_box_to_split(
+        self, histogram: ColorHistogram, boxes: List[np.ndarray], colors_count: int
+    ) -> Optional[int]:
+        """Return the index of the next box to split, or `None` when there are enough
+        boxes or none of them can be split"""
+        if len(boxes) >= colors_count:
+            return None
+
+        return self._get_highest_priority_index(
+            [self._get_split_priority(histogram, box) for box in boxes]
+        )
+
+    @staticmethod
+    def _get_highest_priority_index(priorities: List[float]) -> Optional[int]:
+        box_index = int(np.argmax(priorities))
+
+        return box_index if priorities[box_index] > 0 else None
+
+    @staticmethod
+    def _get_split_priority(histogram: ColorHistogram, box: np.ndarray) -> float:
+        if len(box) < 2:
+            return 0
+
+        return float(
+            histogram.counts[box].sum() * np.ptp(histogram.bins[box], axis=0).max()
+        )
+
+    def _split(self, histogram: ColorHistogram, box: np.ndarray) -> List[np.ndarray]:
+        ordered_box = self._order_by_widest_component(histogram, box)
+        split_index = self._get_median_index(histogram.counts[ordered_box])
+
+        return [ordered_box[:split_index], ordered_box[split_index:]]
+
+    @staticmethod
+    def _order_by_widest_component(
+        histogram: ColorHistogram, box: np.ndarray
+    ) -> np.ndarray:
+        """Return the bins of the box ordered by the mean of their widest component"""
+        widest_component = int(np.argmax(np.ptp(histogram.bins[box], axis=0)))
+        means = histogram.sums[box, widest_component] / histogram.counts[box]
+
+        return box[np.argsort(means, kind="stable")]
+
+    @staticmethod
+    def _get_median_index(counts: np.ndarray) -> int:
+        """Return the index splitting the bins at the weighted median, leaving at least
+        one bin at each side"""
+        cumulative_counts = np.cumsum(counts)
+
+        return int(
+            np.clip(
+                np.searchsorted(cumulative_counts, cumulative_counts[-1] / 2) + 1,
+                1,
+                len(counts) - 1,
+            )
+        )
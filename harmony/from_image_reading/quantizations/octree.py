@@ -0,0 +1,144 @@
+from typing import NamedTuple
+
+import numpy as np
+
+from harmony.from_image_reading.quantizations.histograms import (
+    HISTOGRAM_BITS,
+    ColorHistogram,
+    pack_bins,
+    sum_by_label,
+    unpack_bins,
+)
+from harmony.from_image_reading.quantizations.palettes import (
+    ColorQuantization,
+    QuantizedPalette,
+    make_palette,
+)
+
+
+class OctreeQuantization(ColorQuantization):
+    """Octree quantization, which starts from the histogram bins as the leaves and
+    merges the children of the deepest nodes with the fewest pixels into their parents
+    until there are few enough leaves.
+
+    The leaves are never merged into the root, which would leave a single color, so
+    when there are still too many leaves in the first level, the ones with the fewest
+    pixels are merged into the nearest of the others instead
+    """
+
+    def quantize(
+        self, histogram: ColorHistogram, colors_count: int
+    ) -> QuantizedPalette:
+        leaves = _OctreeLeaves(histogram)
+        leaves.reduce(colors_count)
+
+        return leaves.make_palette(colors_count)
+
+
+class _ParentNodes(NamedTuple):
+    """Parents of the deepest leaves of an octree"""
+
+    keys: np.ndarray
+    leaf_parents: np.ndarray
+    children_counts: np.ndarray
+    counts: np.ndarray
+    sums: np.ndarray
+
+    def get_merged(self, excess: int) -> np.ndarray:
+        """Return which parents to merge, the ones with the fewest pixels first, to
+        remove at least `excess` leaves"""
+        order = np.argsort(self.counts, kind="stable")
+        is_merged = np.zeros(len(order), dtype=bool)
+        is_merged[order[: self._get_merged_count(order, excess)]] = True
+
+        return is_merged
+
+    def _get_merged_count(self, order: np.ndarray, excess: int) -> int:
+        leaves_removed = np.cumsum(self.children_counts[order] - 1)
+
+        return min(int(np.searchsorted(leaves_removed, excess)) + 1, len(order))
+
+
+class _OctreeLeaves:
+    """Leaves of an octree, with their nodes, depths, amounts of pixels and sums of
+    the RGB of their pixels"""
+
+    def __init__(self, histogram: ColorHistogram) -> None:
+        self._nodes = histogram.bins
+        self._depths = np.full(len(histogram.bins), HISTOGRAM_BITS)
+        self._counts = histogram.counts
+        self._sums = histogram.sums
+
+    def reduce(self, colors_count: int) -> None:
+        """Merge the deepest leaves into their parents until there are at most
+        `colors_count` of them or they are all in the first level"""
+        while len(self._counts) > colors_count and self._depths.max() > 1:
+            self._merge_deepest_leaves(len(self._counts) - colors_count)
+
+    def make_palette(self, colors_count: int) -> QuantizedPalette:
+        """Make the palette with the mean color of each leaf, merging the ones with
+        the fewest pixels into the nearest of the `colors_count` others"""
+        order = np.argsort(-self._counts, kind="stable")
+        kept = order[:colors_count]
+        self._merge_into_nearest(order[colors_count:], kept)
+
+        return make_palette(self._counts[kept], self._sums[kept])
+
+    def _merge_deepest_leaves(self, excess: int) -> None:
+        is_deepest = self._depths == self._depths.max()
+        parents = self._get_parents(is_deepest)
+        self._replace_leaves(is_deepest, parents, parents.get_merged(excess))
+
+    def _get_parents(self, is_deepest: np.ndarray) -> _ParentNodes:
+        keys, leaf_parents, children_counts = np.unique(
+            pack_bins(self._nodes[is_deepest] >> 1),
+            return_inverse=True,
+            return_counts=True,
+        )
+
+        return _ParentNodes(
+            keys,
+            leaf_parents,
+            children_counts,
+            sum_by_label(leaf_parents, self._counts[is_deepest], len(keys)).astype(
+                np.int64
+            ),
+            sum_by_label(leaf_parents, self._sums[is_deepest], len(keys)),
+        )
+
+    def _replace_leaves(
+        self, is_deepest: np.ndarray, parents: _ParentNodes, is_merged: np.ndarray
+    ) -> None:
+        """Replace the children of the merged parents with the parents"""
+        is_kept = np.ones(len(self._counts), dtype=bool)
+        is_kept[is_deepest] = ~is_merged[parents.leaf_parents]
+
+        self._nodes = np.concatenate(
+            (self._nodes[is_kept], unpack_bins(parents.keys[is_merged]))
+        )
+        self._depths = np.concatenate(
+            (
+                self._depths[is_kept],
+                np.full(int(is_merged.sum()), self._depths.max() - 1),
+            )
+        )
+        self._sums = np.concatenate((self._sums[is_kept], parents.sums[is_merged]))
+        self._counts = np.concatenate(
+            (self._counts[is_kept], parents.counts[is_merged])
+        )
+
+    def _merge_into_nearest(self, leaves: np.ndarray, others: np.ndarray) -> None:
+        nearest = others[self._get_nearest_leaves(leaves, others)]
+        np.add.at(self._counts, nearest, self._counts[leaves])
+        np.add.at(self._sums, nearest, self._sums[leaves])
+
+    def _get_nearest_leaves(self, leaves: np.ndarray, others: np.ndarray) -> np.ndarray:
+        """Return the index in `others` of the leaf nearest to each of `leaves`"""
+        means = self._sums / self._counts[:, np.newaxis]
+
+        return np.argmin(
+            np.sum(
+                (means[leaves, np.newaxis] - means[np.newaxis, others]) ** 2, axis=2
+            ),
+            axis=1,
+        )
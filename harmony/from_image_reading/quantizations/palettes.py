@@ -0,0 +1,75 @@
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+import numpy as np
+
+from harmony import core
+from harmony.from_image_reading.quantizations.histograms import (
+    ColorHistogram,
+    pack_rgb,
+    sum_by_label,
+)
+
+
+class QuantizedPalette(NamedTuple):
+    """Dominant colors of an image and the amount of pixels each one represents, the
+    most frequent first"""
+
+    rgb_array: np.ndarray
+    pixel_counts: np.ndarray
+
+
+def make_palette(counts: np.ndarray, sums: np.ndarray) -> QuantizedPalette:
+    """Make the palette with the mean RGB of each group of pixels, merging the groups
+    whose means round to the same RGB
+
+    Args:
+        counts (np.ndarray): amount of pixels of each group, which are skipped when
+        they have none
+        sums (np.ndarray): sum of the RGB of the pixels of each group
+
+    Returns:
+        QuantizedPalette: the mean colors, the most frequent first
+    """
+    filled = counts > 0
+    means = np.rint(sums[filled] / counts[filled, np.newaxis])
+
+    return _merge_equal_colors(
+        np.clip(means, 0, core.MAXIMUM_RGB_VALUE).astype(np.uint8),
+        counts[filled].astype(np.int64),
+    )
+
+
+def _merge_equal_colors(rgb_array: np.ndarray, counts: np.ndarray) -> QuantizedPalette:
+    unique = np.unique(pack_rgb(rgb_array), return_index=True, return_inverse=True)
+    merged_counts = sum_by_label(unique[2].ravel(), counts, len(unique[1]))
+
+    return _order_by_frequency(
+        rgb_array[unique[1]], merged_counts.astype(np.int64), unique[1]
+    )
+
+
+def _order_by_frequency(
+    rgb_array: np.ndarray, counts: np.ndarray, first_indices: np.ndarray
+) -> QuantizedPalette:
+    order = np.lexsort((first_indices, -counts))
+    return QuantizedPalette(rgb_array[order], counts[order])
+
+
+class ColorQuantization(ABC):
+    """Interface for the algorithms that reduce the colors of an image to the dominant
+    ones"""
+
+    @abstractmethod
+    def quantize(
+        self, histogram: ColorHistogram, colors_count: int
+    ) -> QuantizedPalette:
+        """Find the dominant colors of the image
+
+        Args:
+            histogram (ColorHistogram): histogram of the pixels of the image
+            colors_count (int): maximum amount of colors in the palette
+
+        Returns:
+            QuantizedPalette: the dominant colors, the most frequent first
+        """
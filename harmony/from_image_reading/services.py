@@ -1,127 +1,168 @@
 import logging
-import multiprocessing
 from math import sqrt
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
+import numpy as np
 from PIL import Image
 
-from harmony import convertions, core, data_access
+from harmony import color_factories, core
 from harmony.core import interfaces
+from harmony.from_image_reading.quantizations import (
+    ColorHistogram,
+    ColorQuantization,
+    QuantizedPalette,
+    pack_rgb,
+)
 
 
 class ImageFileReading(interfaces.FileReadingStrategy):
-    """Extract a set of colors from an image file"""
+    """Extract a set of colors from an image file.
 
-    MAXIMUM_PIXELS = 256
+    By default, the image is sampled in a 16x16 grid and every distinct color sampled
+    is extracted. When a quantization is passed, the image is read in its full
+    resolution, unless a sampling resolution is passed, and only its dominant colors are
+    extracted, with the amount of pixels they represent in their descriptions
+    """
 
-    def __init__(self) -> None:
+    MAXIMUM_PIXELS = 256
+    FULL_RESOLUTION = 0
+    HEADER_SIZE = 8
+    SIGNATURES = (
+        b"\x89PNG\r\n\x1a\n",
+        b"\xff\xd8\xff",
+        b"GIF87a",
+        b"GIF89a",
+        b"BM",
+        b"RIFF",
+        b"II*\x00",
+        b"MM\x00*",
+    )
+
+    def __init__(
+        self,
+        deduplication_key: core.DeduplicationKey = core.DeduplicationKey.COLOR,
+        sampling_resolution: Optional[int] = None,
+        quantization: Optional[ColorQuantization] = None,
+        colors_count: int = 8,
+    ) -> None:
         self._logger = logging.getLogger(self.__class__.__name__)
+        self._deduplication_key = deduplication_key
+        self._sampling_resolution = sampling_resolution
+        self._quantization = quantization
+        self._colors_count = colors_count
 
     def read(self, file_path: Path) -> Tuple[core.Color, ...]:
         image = self._get_image_from_file(file_path)
-
-        with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
-            colors: List[core.Color] = pool.map(
-                self._get_color_from_pixel_tuple,
-                self._get_list_of_arguments(image),
-                20,
+        colors = (
+            self._make_colors_from_pixels(image)
+            if self._quantization is None
+            else self._make_colors_from_palette(
+                self._quantization.quantize(
+                    ColorHistogram.from_pixels(self._get_decoded_pixels(image)),
+                    self._colors_count,
+                )
             )
+        )
 
-        return tuple(core.extract_unique_values_from_iterable(colors))
-
-    def _get_list_of_arguments(
-        self, image: Image.Image
-    ) -> List[Tuple[Image.Image, int, int]]:
-        arguments: List[Tuple[Image.Image, int, int]] = []
-
-        for x_coordinate in range(image.size[0]):
-            arguments.extend(self._get_list_of_arguments_for_x(image, x_coordinate))
-
-        return arguments
-
-    def _get_list_of_arguments_for_x(
-        self, image: Image.Image, x_coordinate: int
-    ) -> List[Tuple[Image.Image, int, int]]:
-        arguments: List[Tuple[Image.Image, int, int]] = []
-
-        for y_coordinate in range(image.size[1]):
-            arguments.append((image, x_coordinate, y_coordinate))
-
-        return arguments
-
-    def _get_color_from_pixel_tuple(self, data: tuple):
-        return self._get_color_from_pixel(data[0], data[1], data[2])
+        return tuple(core.extract_unique_colors(colors, self._deduplication_key))
 
-    def _get_color_from_pixel(
-        self, image: Image.Image, x_coordinate: int, y_coordinate: int
-    ) -> core.Color:
-        return core.Color(
-            rgb=self._get_rgb_from_pixel(image, x_coordinate, y_coordinate),
-            hsl=self._get_hsl_from_pixel(image, x_coordinate, y_coordinate),
-            hexcode=self._get_hexcode_from_pixel(image, x_coordinate, y_coordinate),
-            original_format=core.ColorFormat.RGB,
-            description=self._generate_color_name_from_pixel(
-                image, x_coordinate, y_coordinate
-            ),
+    def can_read(self, file_path: Path) -> bool:
+        return file_path.suffix.lower() in Image.registered_extensions() or (
+            core.read_file_header(file_path, self.HEADER_SIZE).startswith(
+                self.SIGNATURES
+            )
         )
 
-    def _get_hexcode_from_pixel(
-        self, image: Image.Image, x_coordinate: int, y_coordinate: int
-    ) -> str:
-        return core.HexcodeUtils.get_hexcode_from_rgb(
-            self._get_rgb_from_pixel(image, x_coordinate, y_coordinate)
+    def get_cache_key(self) -> str:
+        quantization_name = (
+            "none"
+            if self._quantization is None
+            else self._quantization.__class__.__qualname__
         )
 
-    def _generate_color_name_from_pixel(
-        self, image: Image.Image, x_coordinate: int, y_coordinate: int
-    ) -> str:
-        return self._generate_color_name(
-            self._get_rgb_from_pixel(image, x_coordinate, y_coordinate)
+        return (
+            f"{super().get_cache_key()}:{self._deduplication_key.value}:"
+            + f"{self._get_sampling_resolution()}:{quantization_name}:"
+            + f"{self._colors_count}"
         )
 
-    def _get_hsl_from_pixel(
-        self, image: Image.Image, x_coordinate: int, y_coordinate: int
-    ) -> core.HSL:
-        return convertions.RGBToHSLConverter().convert(
-            self._get_rgb_from_pixel(image, x_coordinate, y_coordinate)
+    @classmethod
+    def _make_colors_from_pixels(cls, image: Image.Image) -> List[core.Color]:
+        return color_factories.ColorFactory().make_many_from_rgb_array_with_auto_label(
+            cls._get_unique_rgb_array(cls._get_pixels_array(image))
         )
 
-    def _get_rgb_from_pixel(
-        self, image: Image.Image, x_coordinate: int, y_coordinate: int
-    ) -> core.RGB:
-        return core.RGB(
-            self._get_red_from_pixel(image, x_coordinate, y_coordinate),
-            self._get_green_from_pixel(image, x_coordinate, y_coordinate),
-            self._get_blue_from_pixel(image, x_coordinate, y_coordinate),
+    @staticmethod
+    def _make_colors_from_palette(palette: QuantizedPalette) -> List[core.Color]:
+        colors = (
+            color_factories.ColorFactory().make_many_from_rgb_array_with_auto_label(
+                palette.rgb_array
+            )
         )
 
-    def _get_red_from_pixel(
-        self, image: Image.Image, x_coordinate: int, y_coordinate: int
-    ) -> int:
-        return image.getpixel((x_coordinate, y_coordinate))[0]
+        for color, pixel_count in zip(colors, palette.pixel_counts.tolist()):
+            color.description = f"{color.description} ({pixel_count} pixels)"
 
-    def _get_green_from_pixel(
-        self, image: Image.Image, x_coordinate: int, y_coordinate: int
-    ) -> int:
-        return image.getpixel((x_coordinate, y_coordinate))[1]
+        return colors
 
-    def _get_blue_from_pixel(
-        self, image: Image.Image, x_coordinate: int, y_coordinate: int
-    ) -> int:
-        return image.getpixel((x_coordinate, y_coordinate))[2]
+    @classmethod
+    def _get_pixels_array(cls, image: Image.Image) -> np.ndarray:
+        """Return the RGB of the pixels, column by column, decoding the image once"""
+        return (
+            cls._get_decoded_pixels(image)
+            .reshape(image.height, image.width, 3)
+            .transpose(1, 0, 2)
+            .reshape(-1, 3)
+        )
 
-    def _generate_color_name(self, rgb_values: core.RGB):
-        return data_access.ColorNamesStorage().get_color_name_by_hsl(
-            convertions.RGBToHSLConverter().convert(rgb_values)
+    @staticmethod
+    def _get_decoded_pixels(image: Image.Image) -> np.ndarray:
+        """Return the RGB of the pixels, row by row, as a view of the decoded buffer"""
+        return np.frombuffer(image.convert("RGB").tobytes(), dtype=np.uint8).reshape(
+            -1, 3
         )
 
+    @staticmethod
+    def _get_unique_rgb_array(pixels: np.ndarray) -> np.ndarray:
+        """Return the distinct RGB of the pixels, in the order they first appear.
+
+        Every field of a color read from a pixel is derived from its RGB, so two pixels
+        with the same RGB are duplicated with any deduplication key, and the colors and
+        their names are only made for the distinct ones
+        """
+        first_indices = np.sort(np.unique(pack_rgb(pixels), return_index=True)[1])
+
+        return pixels[first_indices]
+
     def _get_image_from_file(self, file_path: Path) -> Image.Image:
         Image.MAX_IMAGE_PIXELS = None
-        return Image.open(file_path).resize(self._get_size_to_resize(), Image.NEAREST)
+        image = Image.open(file_path)
+
+        if self._get_sampling_resolution() == self.FULL_RESOLUTION:
+            return image
+
+        # JPEGs are decoded at the smallest DCT scale still as big as the grid, and
+        # the other formats ignore it
+        image.draft(core.ImageModesForPIL.RGB_MODE, self._get_size_to_resize())
+
+        return image.resize(self._get_size_to_resize(), Image.NEAREST)
 
     def _get_size_to_resize(self):
-        return (self._image_side_length(),) * 2
+        return (self._get_sampling_resolution(),) * 2
+
+    def _get_sampling_resolution(self) -> int:
+        if self._sampling_resolution is not None:
+            return self._sampling_resolution
+
+        return self._get_default_sampling_resolution()
+
+    def _get_default_sampling_resolution(self) -> int:
+        return (
+            self._image_side_length()
+            if self._quantization is None
+            else self.FULL_RESOLUTION
+        )
 
     def _image_side_length(self) -> int:
         return int(sqrt(self.MAXIMUM_PIXELS))
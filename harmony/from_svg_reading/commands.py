@@ -1,16 +1,26 @@
+# pylint: disable=too-many-arguments,too-many-locals
 from pathlib import Path
 
-from harmony import core
-from harmony.commands import ToTxtCommandUtils
+from harmony import core, core_services
+from harmony.commands import ToTxtCommandUtils, make_extraction_cache
 from harmony.from_svg_reading.service_layer.svg_file_reading import SVGFileReading
 
 
 def svg2txt(
+    *,
     path: Path = core.CommonArguments.file_or_dir_path,
     color_format: core.ColorFormat = core.CommonArguments.color_format,
     recursively: bool = core.CommonArguments.recursively,
+    workers: int = core.CommonArguments.workers,
+    chunk_size: int = core.CommonArguments.chunk_size,
+    jobs: int = core.CommonArguments.jobs,
+    use_cache: bool = core.CommonArguments.use_cache,
+    hash_contents: bool = core.CommonArguments.hash_contents,
 ) -> None:
     """Extract the colors from an SVG file and write them into a plain text file"""
     ToTxtCommandUtils(SVGFileReading(), color_format, recursively).convert_to_txt_file(
-        path
+        path,
+        core_services.DirectoryReadingOptions(
+            workers, chunk_size, jobs, make_extraction_cache(use_cache, hash_contents)
+        ),
     )
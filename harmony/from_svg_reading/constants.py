@@ -1,6 +1,10 @@
 # pylint: disable=too-few-public-methods,too-many-ancestors
 from enum import Enum
 
+# the CSS Color 4 keywords allowed as paint values that do not name a color of their
+# own, so no color is read from them
+CSS_KEYWORDS_WITHOUT_COLOR = ("transparent", "currentcolor")
+
 
 class CSSBasicColorNames(str, Enum):
     """Enumeration of the CSS basic color names"""
@@ -124,6 +128,7 @@ class CSSBasicColorNames(str, Enum):
     PLUM = "#DDA0DD"
     POWDERBLUE = "#B0E0E6"
     PURPLE = "#800080"
+    REBECCAPURPLE = "#663399"
     RED = "#FF0000"
     ROSYBROWN = "#BC8F8F"
     ROYALBLUE = "#4169E1"
@@ -1,9 +1,15 @@
+import copy
+import functools
 import re
-from itertools import dropwhile
+import types
+from typing import Dict, Mapping, Optional
 
 from harmony import color_factories, core, core_services
 from harmony.core import exceptions, interfaces
-from harmony.from_svg_reading.constants import CSSBasicColorNames
+from harmony.from_svg_reading.constants import (
+    CSS_KEYWORDS_WITHOUT_COLOR,
+    CSSBasicColorNames,
+)
 
 
 class HexcodeSVGReading(interfaces.StringReadingStrategy):
@@ -21,29 +27,46 @@ class HexcodeSVGReading(interfaces.StringReadingStrategy):
         return re.match(cls.STRING_PATTERN, property_value) is not None
 
 
+@functools.lru_cache(maxsize=1)
+def get_css_named_colors() -> Mapping[str, Optional[core.Color]]:
+    """Return the colors of the CSS color names by their case-folded names, made and
+    named once per process.
+
+    The CSS keywords without a color of their own, such as `transparent` and
+    `currentColor`, are mapped to `None`. The colors are shared by the whole process,
+    so they must be copied before being handed out, as their description can be
+    changed
+
+    Returns:
+        Mapping[str, Optional[Color]]: the colors, or `None` for the keywords
+    """
+    named_colors: Dict[str, Optional[core.Color]] = {
+        keyword: None for keyword in CSS_KEYWORDS_WITHOUT_COLOR
+    }
+
+    # the members include the aliases, such as "cyan" for the same value of "aqua"
+    for name, color_data in CSSBasicColorNames.__members__.items():
+        named_colors[name.casefold()] = HexcodeSVGReading().do_read(color_data.value)
+
+    return types.MappingProxyType(named_colors)
+
+
 class CSSColorNameReading(interfaces.StringReadingStrategy):
     """Make a color given a string with a CSS basic color name"""
 
     def do_read(self, property_value: str) -> core.Color:
-        for color_data in dropwhile(
-            lambda color_data: color_data.name.lower() != property_value.lower(),
-            CSSBasicColorNames,
-        ):
-            return HexcodeSVGReading().do_read(color_data.value)
-
-        raise exceptions.InvalidColorFormatException(
-            f"'{property_value}' is not a basic color"
-        )
+        color = get_css_named_colors().get(property_value.casefold())
+
+        if color is None:
+            raise exceptions.InvalidColorFormatException(
+                f"'{property_value}' is not a basic color"
+            )
+
+        return copy.copy(color)
 
     @classmethod
     def do_match_pattern(cls, property_value: str) -> bool:
-        for name in filter(
-            lambda name: name.lower() == property_value.lower(),
-            CSSBasicColorNames.__members__.keys(),
-        ):
-            return bool(name)
-
-        return False
+        return get_css_named_colors().get(property_value.casefold()) is not None
 
 
 class RGBSVGReading(interfaces.StringReadingStrategy):
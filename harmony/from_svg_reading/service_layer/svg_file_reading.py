@@ -1,13 +1,16 @@
+import copy
+import functools
+import logging
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional, Tuple, Type
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Type
 from xml.etree import ElementTree
 
 from harmony import core
 from harmony.core import interfaces
 from harmony.from_svg_reading.service_layer.basic_svg_readings import (
-    CSSColorNameReading,
     HexcodeSVGReading,
     RGBSVGReading,
+    get_css_named_colors,
 )
 from harmony.from_svg_reading.service_layer.hsl_svg_readings import HSLSVGReading
 from harmony.from_svg_reading.service_layer.percentage_svg_reading import (
@@ -20,35 +23,95 @@ class SVGFileReading(interfaces.FileReadingStrategy):
 
     The colors are extracted from the attributes `fill` and `stroke` as specified at
     [MDN](https://developer.mozilla.org/en-US/docs/Web/SVG/Content_type#paint), which
-    possible values are specified by [W3](https://www.w3.org/TR/css-color-3/#html4)
+    possible values are specified by [W3](https://www.w3.org/TR/css-color-3/#html4).
+
+    The document is parsed incrementally and each element is dropped once it is
+    closed, so only the open elements are kept in memory, no matter the size of the
+    document. The colors of the paint values are kept in a bounded cache during each
+    read, so each distinct value is parsed and named once. Each element still gets
+    its own copy of the color, so changing one does not change the others
     """
 
+    EXTENSION = ".svg"
+    HEADER_SIZE = 1024
+    PAINT_VALUES_CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        self._logger = logging.getLogger(self.__class__.__name__)
+
     def read(self, file_path: Path) -> Tuple[core.Color, ...]:
-        colors: List[core.Color] = []
+        return tuple(self.iterate(file_path))
+
+    def iterate(self, file_path: Path) -> Iterator[core.Color]:
+        """Lazily yield the colors of the file, in the order of the elements
+
+        Args:
+            file_path (Path): SVG file with the colors
+
+        Returns:
+            Iterator[Color]: the colors, in the same order `read` returns them
+        """
+        get_color = functools.lru_cache(maxsize=self.PAINT_VALUES_CACHE_SIZE)(
+            self.__get_color_if_possible
+        )
 
-        for element in ElementTree.parse(file_path).iter():
-            colors.extend(
-                value
-                for value in self.__iterate_possible_colors(element)
+        for element in self.__iterate_elements(file_path):
+            yield from (
+                copy.copy(value)
+                for value in self.__iterate_possible_colors(element, get_color)
                 if value is not None
             )
 
-        return tuple(colors)
+        cache_info = get_color.cache_info()
+        self._logger.debug(
+            "Paint values of '%(path)s' read with %(hits)d cache hits and %(misses)d "
+            + "misses",
+            {"path": file_path, "hits": cache_info.hits, "misses": cache_info.misses},
+        )
+
+    @staticmethod
+    def __iterate_elements(file_path: Path) -> Iterator[ElementTree.Element]:
+        """Yield the elements as they are opened, which is the document order, and
+        remove them from their parents as they are closed"""
+        open_elements = _OpenElements()
+
+        return (
+            element
+            for event, element in ElementTree.iterparse(file_path, ("start", "end"))
+            if open_elements.track(event, element)
+        )
+
+    def can_read(self, file_path: Path) -> bool:
+        return (
+            file_path.suffix.lower() == self.EXTENSION
+            or b"<svg" in core.read_file_header(file_path, self.HEADER_SIZE)
+        )
 
     def __iterate_possible_colors(
-        self, element: ElementTree.Element
+        self,
+        element: ElementTree.Element,
+        get_color: Callable[[str], Optional[core.Color]],
     ) -> Iterable[Optional[core.Color]]:
         for element_property in filter(
             self.__is_color_property,
             element.keys(),
         ):
-            yield self.__get_color_if_possible(element.get(element_property, ""))
+            yield get_color(element.get(element_property, ""))
 
     @staticmethod
     def __is_color_property(property_name: str) -> bool:
         return property_name in ["fill", "stroke"]
 
     def __get_color_if_possible(self, color_value: str) -> Optional[core.Color]:
+        named_colors = get_css_named_colors()
+
+        return (
+            named_colors[color_value.casefold()]
+            if color_value.casefold() in named_colors
+            else self.__read_color_value(color_value)
+        )
+
+    def __read_color_value(self, color_value: str) -> Optional[core.Color]:
         for factory in filter(
             lambda factory: factory.match_pattern(color_value),
             self.__iter_color_factories(),
@@ -60,8 +123,39 @@ class SVGFileReading(interfaces.FileReadingStrategy):
     def __iter_color_factories(
         self,
     ) -> Iterator[Type[interfaces.StringReadingStrategy]]:
-        yield CSSColorNameReading
         yield HexcodeSVGReading
         yield RGBSVGReading
         yield PercentageRGBReading
         yield HSLSVGReading
+
+
+class _OpenElements:
+    """Elements of a document being parsed which are not closed yet. The closed ones
+    are removed from their parents, so they are not kept in memory"""
+
+    def __init__(self) -> None:
+        # the root gets a parent too, so every element closed has one
+        self._elements = [ElementTree.Element("document")]
+
+    def track(self, event: str, element: ElementTree.Element) -> bool:
+        """Keep the element opened, or remove the element closed, by a parsing event
+
+        Args:
+            event (str): "start" when the element was opened, or "end" when it was
+            closed
+            element (Element): element opened or closed
+
+        Returns:
+            bool: whether the element was opened
+        """
+        if event == "start":
+            self._elements.append(element)
+            return True
+
+        self._close()
+        return False
+
+    def _close(self) -> None:
+        self._elements.pop().clear()
+        # the element closed is always the last child of its parent
+        del self._elements[-1][-1:]
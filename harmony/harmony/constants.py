@@ -1,6 +1,10 @@
 # pylint: disable=too-few-public-methods
+from typing import Optional
+
 import typer
 
+from harmony import convertions, core
+
 
 class MainArguments:
     """Store the core arguments"""
@@ -11,3 +15,27 @@ class MainArguments:
         "-V",
         help="Display the current installed version of the CLI",
     )
+    trace: bool = typer.Option(
+        False,
+        "--trace",
+        help="Show every step of the command in the standard error, including the "
+        + "convertion of each color. It makes the commands much slower",
+    )
+    conversion_cache: Optional[core.ConversionCacheMode] = typer.Option(
+        None,
+        "--conversion-cache",
+        help="How the RGB to HSL convertions are cached: not at all, in a bounded LRU "
+        + "cache or in tables with every color, built in the cache directory on the "
+        + "first use. It can also be set with the HARMONY_CONVERSION_CACHE "
+        + "environment variable  "
+        + f"[default: {convertions.DEFAULT_CONVERSION_CACHE_MODE.value}]",
+        # the default is `None`, so the environment variable is not overridden
+        show_default=False,
+    )
+    stats: bool = typer.Option(
+        False,
+        "--stats",
+        help="Show the hit ratio of the convertion cache in the standard error when "
+        + "the command ends. The convertions done by the worker processes are not "
+        + "counted",
+    )
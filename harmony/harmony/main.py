@@ -1,13 +1,17 @@
 # pylint: disable=too-many-locals,too-many-arguments
 
+from typing import Optional
+
 import rich
 import typer
 
-from harmony import __version__
+from harmony import __version__, convertions, core
+from harmony.color_naming.commands import nametable
 from harmony.color_sorting.commands import sort
 from harmony.from_image_reading.commands import image2txt
 from harmony.from_svg_reading.commands import svg2txt
 from harmony.harmony.adapters import HarmonyTyper
+from harmony.harmony.constants import MainArguments
 from harmony.to_ase_convertion.commands import txt2ase
 from harmony.to_clr_convertion.commands import txt2clr
 from harmony.to_image_convertion.commands import txt2image
@@ -19,6 +23,7 @@ app.command()(txt2clr)
 app.command()(txt2image)
 app.command()(image2txt)
 app.command()(svg2txt)
+app.command()(nametable)
 
 
 def _display_version(context: typer.Context):
@@ -32,9 +37,50 @@ def _display_version(context: typer.Context):
     rich.print(f"Harmony {__version__}")
 
 
+def _display_conversion_statistics() -> None:
+    converter = convertions.get_rgb_to_hsl_converter()
+    statistics = converter.get_statistics()
+    typer.echo(
+        f"Conversion cache ({converter.mode.value}): {statistics.hits:,} hits, "
+        + f"{statistics.misses:,} misses, {statistics.hit_ratio:.1%} hit ratio",
+        err=True,
+    )
+
+
+def _enable_tracing_if_needed(trace: bool) -> None:
+    if trace:
+        core.enable_tracing()
+
+
+def _set_conversion_cache_mode_if_passed(
+    conversion_cache: Optional[core.ConversionCacheMode],
+) -> None:
+    if conversion_cache is not None:
+        convertions.set_conversion_cache_mode(conversion_cache)
+
+
+def _display_conversion_statistics_if_needed(
+    context: typer.Context, stats: bool
+) -> None:
+    if stats:
+        context.call_on_close(_display_conversion_statistics)
+
+
 @app.callback(invoke_without_command=True)
-def main(context: typer.Context, version: bool = False):
+def main(
+    context: typer.Context,
+    version: bool = False,
+    trace: bool = MainArguments.trace,
+    conversion_cache: Optional[core.ConversionCacheMode] = (
+        MainArguments.conversion_cache
+    ),
+    stats: bool = MainArguments.stats,
+):
     """Harmony is a CLI that provides tools for managing colors"""
+    _enable_tracing_if_needed(trace)
+    _set_conversion_cache_mode_if_passed(conversion_cache)
+    _display_conversion_statistics_if_needed(context, stats)
+
     if version:
         _display_version(context)
 
@@ -0,0 +1,62 @@
+from harmony import core
+
+
+class ASEColorChunk:
+    """Bytes of the chunk of a color in an ".ase" file, with its description and its
+    RGB components"""
+
+    FLOAT_BYTE_ORDER = core.ByteOrder.BIG
+
+    def __init__(self, color: core.Color) -> None:
+        self._color = color
+
+    def get_bytes(self) -> bytearray:
+        """Return the whole chunk of the color"""
+        color_bytes = bytearray(b"\x00\x01\x00\x00")
+        color_bytes.extend(self._get_color_chunk_size_bytes())
+        color_bytes.extend(self.get_description_bytes())
+        color_bytes.extend(self.get_rgb_bytes())
+
+        return color_bytes
+
+    def _get_color_chunk_size_bytes(self) -> bytes:
+        return self._get_color_chunk_size().to_bytes(2, "big")
+
+    def _get_color_chunk_size(self) -> int:
+        return len(self.get_description_bytes()) + len(self.get_rgb_bytes())
+
+    def get_description_bytes(self) -> bytearray:
+        """Return the description of the color, preceded by its length"""
+        description_bytes = bytearray(self._get_color_description_count_bytes())
+        description_bytes.extend(self._get_description_array())
+
+        return description_bytes
+
+    def _get_color_description_count_bytes(self) -> bytes:
+        return self._get_color_description_count().to_bytes(2, "big")
+
+    def _get_color_description_count(self) -> int:
+        return int(len(self._get_description_array()) / 2)
+
+    def _get_description_array(self) -> bytearray:
+        description_as_bytes = bytearray(
+            bytes(self._color.description, encoding="utf_16_be")
+        )
+        description_as_bytes.extend(b"\x00\x00\x00\x00")
+
+        return description_as_bytes
+
+    def get_rgb_bytes(self) -> bytearray:
+        """Return the RGB components of the color as percentages"""
+        rgb_bytes = bytearray(b"RGB\x20")
+        rgb_bytes.extend(self._get_component_bytes(self._color.rgb.red_as_percentage))
+        rgb_bytes.extend(self._get_component_bytes(self._color.rgb.green_as_percentage))
+        rgb_bytes.extend(self._get_component_bytes(self._color.rgb.blue_as_percentage))
+        rgb_bytes.extend(b"\x00\x02")
+
+        return rgb_bytes
+
+    def _get_component_bytes(self, component_as_percentage: float) -> bytes:
+        return core.BytesUtils.float_to_bytes(
+            component_as_percentage, self.FLOAT_BYTE_ORDER
+        )
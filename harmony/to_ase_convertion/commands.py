@@ -8,12 +8,15 @@ from harmony.to_ase_convertion.services import ASEWriting
 
 
 def txt2ase(
+    *,
     file_path: Path = core.CommonArguments.file_path,
     palette_name: str = TXT2ASECommandArguments.palette_name,
     generate_names: bool = core.CommonArguments.generate_names,
     suffix: str = core.CommonArguments.suffix,
+    deduplication_key: core.DeduplicationKey = core.CommonArguments.deduplication_key,
+    workers: int = core.CommonArguments.workers,
 ):
     """Command to convert a text file into a ".ase" file"""
     FromTxtCommandUtils(
         ASEWriting(palette_name), suffix, generate_names
-    ).convert_from_txt_file(file_path)
+    ).convert_from_txt_file(file_path, deduplication_key, workers)
@@ -1,8 +1,11 @@
+import contextlib
 import logging
-from typing import Any, Dict, Tuple
+import os
+from typing import Any, BinaryIO, Dict, Iterable, Sequence, Tuple
 
 from harmony import core
 from harmony.core import interfaces
+from harmony.to_ase_convertion.color_chunks import ASEColorChunk
 
 
 class ASEWriting(interfaces.WritingStrategy):
@@ -10,8 +13,6 @@ class ASEWriting(interfaces.WritingStrategy):
 
     EXTENSION = "ase"
 
-    FLOAT_BYTE_ORDER = core.ByteOrder.BIG
-
     def __init__(self, palette_name: str) -> None:
         self.palette_name = palette_name
         self._logger = logging.getLogger(self.__class__.__name__)
@@ -23,24 +24,66 @@ class ASEWriting(interfaces.WritingStrategy):
             colors (Tuple[Color, ...]): colors to be written
             final_file_path (str): path to the file where the colors will be passed
         """
-        with open(final_file_path, "wb") as colors_file:
-            colors_file.write(self._get_file_content(colors))
+        self.write_chunks((colors,), final_file_path)
 
-    def _get_file_content(self, colors: Tuple[core.Color, ...]) -> bytes:
-        file_content = self._get_file_head_bytes(colors)
-        file_content.extend(self._get_palette_name_chunk())
-        file_content.extend(self._get_color_bytes(colors))
-        file_content.extend(self._get_final_chunk())
+    def write_chunks(
+        self, chunks: Iterable[Sequence[core.Color]], final_file_path: str
+    ):
+        """Write colors to a ".ase" file as the chunks arrive. The amount of ASE chunks
+        in the file head is only known at the end, so it is written last.
 
-        return file_content
+        The colors are written to a temporary file next to the final one, which only
+        replaces it when every chunk was written, so an invalid color in the middle
+        of the chunks neither leaves a truncated file nor overwrites an existing one
 
-    def _get_file_head_bytes(self, colors: Tuple[core.Color, ...]) -> bytearray:
-        return self._get_file_head(self._get_amount_of_ase_chunks(colors))
+        Args:
+            chunks (Iterable[Sequence[Color]]): colors to be written, in chunks
+            final_file_path (str): path to the file where the colors will be passed
+        """
+        # the process id tells apart the files of commands writing the same file
+        temporary_file_path = f"{final_file_path}.{os.getpid()}.tmp"
+
+        try:
+            with open(temporary_file_path, "wb") as colors_file:
+                self._write_colors_file(chunks, colors_file)
+
+            os.replace(temporary_file_path, final_file_path)
+
+        except BaseException:
+            self._remove_temporary_file(temporary_file_path)
+            raise
+
+    def _write_colors_file(
+        self, chunks: Iterable[Sequence[core.Color]], colors_file: BinaryIO
+    ) -> None:
+        colors_count = 0
+        colors_file.write(self._get_file_head(self._get_amount_of_ase_chunks(0)))
+        colors_file.write(self._get_palette_name_chunk())
+
+        for chunk in chunks:
+            colors_file.write(self._get_color_bytes(chunk))
+            colors_count += len(chunk)
+
+        colors_file.write(self._get_final_chunk())
+        colors_file.seek(self._get_ase_chunk_count_offset())
+        colors_file.write(
+            self._get_ase_chunk_count_bytes(
+                self._get_amount_of_ase_chunks(colors_count)
+            )
+        )
 
     @staticmethod
-    def _get_amount_of_ase_chunks(colors: Tuple[core.Color, ...]) -> int:
+    def _remove_temporary_file(temporary_file_path: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temporary_file_path)
+
+    @staticmethod
+    def _get_amount_of_ase_chunks(colors_count: int) -> int:
         # The amount of ASE chunks is equal to the sum of the number of colors + one
-        return len(colors) + 2
+        return colors_count + 2
+
+    def _get_ase_chunk_count_offset(self) -> int:
+        return len(self._get_file_signature()) + len(self._get_version_bytes())
 
     @staticmethod
     def _get_final_chunk() -> bytes:
@@ -97,25 +140,33 @@ class ASEWriting(interfaces.WritingStrategy):
     def _get_palette_name_chunk_count(palette_name: bytes) -> int:
         return int(len(palette_name) / 2)
 
-    def _get_color_bytes(self, colors: Tuple[core.Color, ...]) -> bytearray:
+    def _get_color_bytes(self, colors: Iterable[core.Color]) -> bytearray:
         color_bytes = bytearray()
 
         for color in colors:
-            color_bytes.extend(b"\x00\x01\x00\x00")
-
-            self._logger.info(
-                self._get_description_converted_log_message(),
-                self._get_description_converted_log_data(color),
-            )
+            color_chunk = ASEColorChunk(color)
 
-            self._log_rgb_converted(color, self._convert_rgb_to_bytes(color.rgb))
-
-            color_bytes.extend(self._get_color_chunk_size_bytes(color))
-            color_bytes.extend(self._get_description_bytes(color.description))
-            color_bytes.extend(self._convert_rgb_to_bytes(color.rgb))
+            self._log_color_converted(color, color_chunk)
+            color_bytes.extend(color_chunk.get_bytes())
 
         return color_bytes
 
+    def _log_color_converted(
+        self, color: core.Color, color_chunk: ASEColorChunk
+    ) -> None:
+        core.log_lazily(
+            self._logger,
+            logging.INFO,
+            self._get_description_converted_log_message(),
+            lambda: self._get_description_converted_log_data(color, color_chunk),
+        )
+        core.log_lazily(
+            self._logger,
+            logging.INFO,
+            "RGB components %(rgb)s converted to %(rgb_bytes)s",
+            lambda: self._get_rgb_converted_log_data(color, color_chunk),
+        )
+
     @staticmethod
     def _get_description_converted_log_message() -> str:
         return (
@@ -123,80 +174,20 @@ class ASEWriting(interfaces.WritingStrategy):
             + "%(description_bytes)s"
         )
 
-    def _get_description_converted_log_data(self, color: core.Color) -> Dict[str, Any]:
+    @staticmethod
+    def _get_description_converted_log_data(
+        color: core.Color, color_chunk: ASEColorChunk
+    ) -> Dict[str, Any]:
         return {
             "description": color.description,
-            "description_bytes": self._get_description_bytes(color.description),
+            "description_bytes": color_chunk.get_description_bytes(),
         }
 
-    def _log_rgb_converted(self, color: core.Color, rgb_bytes: bytes) -> None:
-        self._logger.info(
-            "RGB components %(rgb)s converted to %(rgb_bytes)s",
-            self._get_rgb_converted_log_data(color, rgb_bytes),
-        )
-
+    @staticmethod
     def _get_rgb_converted_log_data(
-        self, color: core.Color, rgb_bytes: bytes
+        color: core.Color, color_chunk: ASEColorChunk
     ) -> Dict[str, Any]:
         return {
             "rgb": str(color.rgb),
-            "rgb_bytes": rgb_bytes,
+            "rgb_bytes": color_chunk.get_rgb_bytes(),
         }
-
-    def _get_color_chunk_size_bytes(self, color: core.Color) -> bytes:
-        return self._get_color_chunk_size(color).to_bytes(2, "big")
-
-    def _get_color_chunk_size(self, color: core.Color) -> int:
-        return self._get_description_bytes_length(
-            color.description
-        ) + self._get_rgb_as_bytes_length(color.rgb)
-
-    def _get_description_bytes_length(self, description: str) -> int:
-        return len(self._get_description_bytes(description))
-
-    def _get_rgb_as_bytes_length(self, rgb: core.RGB) -> int:
-        return len(self._convert_rgb_to_bytes(rgb))
-
-    def _get_description_bytes(self, description: str) -> bytearray:
-        description_bytes = bytearray(
-            self._get_color_description_count_bytes(description)
-        )
-        description_bytes.extend(self._get_description_array(description))
-
-        return description_bytes
-
-    def _get_color_description_count_bytes(self, description: str) -> bytes:
-        return self._get_color_description_count(description).to_bytes(2, "big")
-
-    def _get_color_description_count(self, description: str) -> int:
-        return int(self._get_description_array_length(description) / 2)
-
-    def _get_description_array_length(self, description: str) -> int:
-        return len(self._get_description_array(description))
-
-    @staticmethod
-    def _get_description_array(description: str) -> bytearray:
-        description_as_bytes = bytearray(bytes(description, encoding="utf_16_be"))
-        description_as_bytes.extend(b"\x00\x00\x00\x00")
-
-        return description_as_bytes
-
-    def _convert_rgb_to_bytes(self, rgb: core.RGB) -> bytearray:
-        rgb_bytes = bytearray(b"RGB\x20")
-        rgb_bytes.extend(
-            core.BytesUtils.float_to_bytes(rgb.red_as_percentage, self.FLOAT_BYTE_ORDER)
-        )
-        rgb_bytes.extend(
-            core.BytesUtils.float_to_bytes(
-                rgb.green_as_percentage, self.FLOAT_BYTE_ORDER
-            )
-        )
-        rgb_bytes.extend(
-            core.BytesUtils.float_to_bytes(
-                rgb.blue_as_percentage, self.FLOAT_BYTE_ORDER
-            )
-        )
-
-        rgb_bytes.extend(b"\x00\x02")
-
-        return rgb_bytes
@@ -7,11 +7,14 @@ from harmony.to_clr_convertion.services import CLRWriting
 
 
 def txt2clr(
+    *,
     file_path: Path = core.CommonArguments.file_path,
     generate_names: bool = core.CommonArguments.generate_names,
     suffix: str = core.CommonArguments.suffix,
+    deduplication_key: core.DeduplicationKey = core.CommonArguments.deduplication_key,
+    workers: int = core.CommonArguments.workers,
 ):
     """Command to convert a text file into a ".clr" file"""
     FromTxtCommandUtils(CLRWriting(), suffix, generate_names).convert_from_txt_file(
-        file_path
+        file_path, deduplication_key, workers
     )
@@ -1,5 +1,7 @@
 import logging
-from typing import Any, Dict, List, Tuple
+import shutil
+import tempfile
+from typing import IO, Any, Dict, Iterable, Sequence, Tuple
 
 from harmony import core
 from harmony.core import exceptions, interfaces
@@ -9,6 +11,7 @@ from harmony.to_clr_convertion.utils import (
     is_clr_color_component_near_one,
     is_clr_color_component_near_zero,
     is_clr_color_count_invalid,
+    is_first_colors_chunk,
 )
 
 
@@ -17,6 +20,7 @@ class CLRWriting(interfaces.WritingStrategy):
 
     EXTENSION = "clr"
     BYTE_ORDER = core.ByteOrder.LITTLE
+    MAXIMUM_SPOOLED_SIZE = 1 << 24
 
     def __init__(self) -> None:
         self._logger = logging.getLogger(self.__class__.__name__)
@@ -32,42 +36,62 @@ class CLRWriting(interfaces.WritingStrategy):
             InvalidFileException: when a CLR file is tried to be written with less
             then 1 color
         """
-        self._check_color_amount(colors)
+        self.write_chunks((colors,), final_file_path)
 
-        with open(final_file_path, "wb") as final_file:
-            final_file.write(self._get_file_content(colors))
+    def write_chunks(
+        self, chunks: Iterable[Sequence[core.Color]], final_file_path: str
+    ):
+        """Write colors to a ".clr" file as the chunks arrive. The color count comes
+        before the colors and its size varies, so the colors bytes are spooled to a
+        temporary file, which is only kept in memory while it is small
 
-    def _check_color_amount(self, colors: Tuple[core.Color, ...]) -> None:
-        if is_clr_color_count_invalid(len(colors)):
+        Args:
+            chunks (Iterable[Sequence[Color]]): colors to be written, in chunks
+            final_file_path (str): path to the file where the colors will be passed
+
+        Raises:
+            InvalidFileException: when a CLR file is tried to be written with less
+            then 1 color
+        """
+        with tempfile.SpooledTemporaryFile(self.MAXIMUM_SPOOLED_SIZE) as colors_bytes:
+            colors_count = self._write_colors_bytes(chunks, colors_bytes)
+            self._check_color_amount(colors_count)
+            self._write_file(colors_bytes, colors_count, final_file_path)
+
+    def _write_file(self, colors_bytes: IO[bytes], count: int, file_path: str) -> None:
+        with open(file_path, "wb") as final_file:
+            final_file.write(CLRSpecialBytes.get_file_start())
+            final_file.write(self._get_color_count_chunk(count))
+            colors_bytes.seek(0)
+            shutil.copyfileobj(colors_bytes, final_file)
+
+    def _check_color_amount(self, colors_count: int) -> None:
+        if is_clr_color_count_invalid(colors_count):
             raise exceptions.InvalidFileException(
-                f"CLR files must have at least one color, but {len(colors)} was passed"
+                f"CLR files must have at least one color, but {colors_count} was passed"
             )
 
-    def _get_file_content(self, colors: Tuple[core.Color, ...]) -> bytes:
-        file_content = bytearray()
+    def _write_colors_bytes(
+        self, chunks: Iterable[Sequence[core.Color]], colors_file: IO[bytes]
+    ) -> int:
+        colors_count = 0
 
-        for item in self._get_bytes_to_add_to_the_file(colors):
-            file_content.extend(item)
+        for chunk in chunks:
+            colors_file.write(self._get_chunk_bytes(chunk, colors_count))
+            colors_count += len(chunk)
 
-        return file_content
+        return colors_count
 
-    def _get_bytes_to_add_to_the_file(
-        self, colors: Tuple[core.Color, ...]
-    ) -> Tuple[bytes, ...]:
-        colors_list = list(colors)
-        first_color_bytes = self._get_first_color_bytes(colors_list.pop(0))
+    def _get_chunk_bytes(
+        self, chunk: Sequence[core.Color], colors_written: int
+    ) -> bytearray:
+        if not is_first_colors_chunk(colors_written, len(chunk)):
+            return self._get_colors_bytes(chunk)
 
-        return (
-            CLRSpecialBytes.get_file_start(),
-            self._get_color_count_chunk_from_collection(colors),
-            first_color_bytes,
-            self._get_colors_bytes(colors_list),
-        )
+        chunk_bytes = self._get_first_color_bytes(chunk[0])
+        chunk_bytes.extend(self._get_colors_bytes(chunk[1:]))
 
-    def _get_color_count_chunk_from_collection(
-        self, colors: Tuple[core.Color, ...]
-    ) -> bytes:
-        return self._get_color_count_chunk(len(colors))
+        return chunk_bytes
 
     def _get_color_count_chunk(self, color_count: int) -> bytearray:
         color_chunk = bytearray(CLRSpecialBytes.COLOR_COUNT_CHUNK_START)
@@ -117,7 +141,7 @@ class CLRWriting(interfaces.WritingStrategy):
 
         return class_declaration_bytes
 
-    def _get_colors_bytes(self, colors: List[core.Color]) -> bytearray:
+    def _get_colors_bytes(self, colors: Iterable[core.Color]) -> bytearray:
         colors_chunk_bytes = bytearray()
 
         for color in colors:
@@ -137,9 +161,11 @@ class CLRWriting(interfaces.WritingStrategy):
         rgba_bytes.extend(self._get_alpha_bytes())
         rgba_bytes.extend(CLRSpecialBytes.END_OF_DATA_BYTE)
 
-        self._logger.info(
+        core.log_lazily(
+            self._logger,
+            logging.INFO,
             "RGB components %(rgb)s converted to %(rgba_bytes)s",
-            self._get_rgb_converted_log_data(rgb, rgba_bytes),
+            lambda: self._get_rgb_converted_log_data(rgb, rgba_bytes),
         )
 
         return rgba_bytes
@@ -6,6 +6,12 @@ def is_clr_color_count_invalid(color_count: int) -> bool:
     return color_count <= 0
 
 
+def is_first_colors_chunk(colors_written: int, chunk_size: int) -> bool:
+    """Return `True` if the chunk has the first color, which also declares the types
+    of the color map"""
+    return colors_written == 0 and chunk_size > 0
+
+
 def is_8_bit_signed_integer(integer_to_check: int) -> bool:
     """Return `True` if the value is between -127 and 127 including the bounds"""
     return (
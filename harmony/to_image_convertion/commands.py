@@ -8,9 +8,14 @@ from harmony.to_image_convertion.services import PNGWritting
 
 
 def txt2image(
+    *,
     file_path: Path = TXT2ImageCommandArguments.file_path,
     suffix: str = core.CommonArguments.suffix,
+    deduplication_key: core.DeduplicationKey = core.CommonArguments.deduplication_key,
+    workers: int = core.CommonArguments.workers,
 ):
     """Command to generate a color palette with the visual representation of the colors
     especified in the passed file"""
-    FromTxtCommandUtils(PNGWritting(), suffix).convert_from_txt_file(file_path)
+    FromTxtCommandUtils(PNGWritting(), suffix).convert_from_txt_file(
+        file_path, deduplication_key, workers
+    )
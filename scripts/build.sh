@@ -0,0 +1,3 @@
+#! /bin/bash
+
+./venv/bin/python -m harmony.data_access
\ No newline at end of file
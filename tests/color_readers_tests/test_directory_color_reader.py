@@ -1,9 +1,9 @@
 import pathlib
-from typing import Callable, Tuple
+from typing import Callable, List, Tuple
 
 import pytest
 
-from harmony import core, core_services
+from harmony import core, core_services, data_access
 from harmony.core import exceptions
 from tests.helpers import (
     ColorReadingArrangement,
@@ -13,6 +13,21 @@ from tests.helpers import (
 )
 
 
+class TextFilesOnlyReadingStrategy(FakeFileReadingStrategy):
+    """Fake strategy that only reads text files and records the files it read"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.read_paths: List[pathlib.Path] = []
+
+    def read(self, file_path: pathlib.Path) -> Tuple[core.Color, ...]:
+        self.read_paths.append(file_path)
+        return super().read(file_path)
+
+    def can_read(self, file_path: pathlib.Path) -> bool:
+        return file_path.suffix == ".txt"
+
+
 class TestDirectoryColorReader:
     """Tests for the color reader for directories"""
 
@@ -62,6 +77,138 @@ class TestDirectoryColorReader:
         for color in result:
             assert color in FakeFileReadingStrategy.colors_queue
 
+    def test_reading_directory_in_parallel(self) -> None:
+        """Test reading the files of a directory recursively in a pool of processes,
+        getting the colors in the same order as reading them one by one"""
+        with temporary_directory_context() as directory:
+            arrangement = self._given_directory_with_text_files(directory)
+            result = self._when_directory_readed_in_parallel(arrangement)
+            expected = self._when_directory_readed(arrangement, True)
+
+        self._then_should_get_same_colors(result, expected)
+
+    def _given_directory_with_text_files(
+        self, directory: pathlib.Path
+    ) -> ColorReadingArrangement:
+        get_directory_to_read(directory)
+
+        return ColorReadingArrangement(directory, core_services.PlainTextFileReading())
+
+    def _when_directory_readed_in_parallel(
+        self, arrangement: ColorReadingArrangement
+    ) -> Tuple[core.Color, ...]:
+        return core_services.DirectoryColorReader(
+            arrangement.strategy,
+            True,
+            core_services.DirectoryReadingOptions(workers=2, chunk_size=2),
+        ).extract_colors(arrangement.path)
+
+    def _then_should_get_same_colors(
+        self, result: Tuple[core.Color, ...], expected: Tuple[core.Color, ...]
+    ) -> None:
+        assert len(result) == 3
+        assert result == expected
+
+    def test_skipping_files_that_cannot_be_read(self) -> None:
+        """Test reading with threads only the files that look readable by the
+        strategy"""
+        with temporary_directory_context() as directory:
+            arrangement = self._given_directory_with_unreadable_files(directory)
+            result = core_services.DirectoryColorReader(
+                arrangement.strategy,
+                True,
+                core_services.DirectoryReadingOptions(jobs=4),
+            ).extract_colors(arrangement.path)
+
+        self._then_should_read_only_readable_files(result, arrangement)
+
+    def _given_directory_with_unreadable_files(
+        self, directory: pathlib.Path
+    ) -> ColorReadingArrangement:
+        get_directory_to_read(directory)
+        directory.joinpath("image.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+
+        return ColorReadingArrangement(directory, TextFilesOnlyReadingStrategy())
+
+    def _then_should_read_only_readable_files(
+        self, result: Tuple[core.Color, ...], arrangement: ColorReadingArrangement
+    ) -> None:
+        assert isinstance(arrangement.strategy, TextFilesOnlyReadingStrategy)
+        assert sorted(path.name for path in arrangement.strategy.read_paths) == [
+            "fake-file1.txt",
+            "fake-file2.txt",
+            "fake-file3.txt",
+        ]
+        assert len(result) == 3
+
+    def test_reading_only_changed_files_with_cache(self) -> None:
+        """Test reading again only the files changed since the last scan"""
+        with temporary_directory_context() as directory:
+            arrangement = self._given_directory_read_with_cache(directory)
+            arrangement.path.joinpath("fake-file2.txt").write_text("#ffffff White")
+            result = self._when_directory_readed_with_cache(arrangement)
+
+        self._then_should_read_only_changed_file(result, arrangement)
+
+    def test_reading_again_when_color_names_change(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test reading again the files cached before the color names resource, which
+        the descriptions are generated from, changed"""
+        with temporary_directory_context() as directory:
+            arrangement = self._given_directory_read_with_cache(directory)
+            monkeypatch.setattr(
+                data_access.ColorNamesStorage,
+                "get_resource_digest",
+                lambda _: b"\x01" * 32,
+            )
+
+            # the fake strategy has no colors left for the files read again
+            with pytest.raises(exceptions.NoColorsFoundException):
+                self._when_directory_readed_with_cache(arrangement)
+
+        assert isinstance(arrangement.strategy, TextFilesOnlyReadingStrategy)
+        assert len(arrangement.strategy.read_paths) == 6
+
+    def _given_directory_read_with_cache(
+        self, directory: pathlib.Path
+    ) -> ColorReadingArrangement:
+        files_directory = directory.joinpath("files")
+        files_directory.mkdir()
+        get_directory_to_read(files_directory)
+        arrangement = ColorReadingArrangement(
+            files_directory, TextFilesOnlyReadingStrategy()
+        )
+        self._when_directory_readed_with_cache(arrangement)
+
+        return arrangement
+
+    def _when_directory_readed_with_cache(
+        self, arrangement: ColorReadingArrangement
+    ) -> Tuple[core.Color, ...]:
+        return core_services.DirectoryColorReader(
+            arrangement.strategy,
+            True,
+            core_services.DirectoryReadingOptions(
+                extraction_cache=core_services.ExtractionCache(
+                    arrangement.path.parent.joinpath("cache.sqlite3")
+                )
+            ),
+        ).extract_colors(arrangement.path)
+
+    def _then_should_read_only_changed_file(
+        self, result: Tuple[core.Color, ...], arrangement: ColorReadingArrangement
+    ) -> None:
+        assert isinstance(arrangement.strategy, TextFilesOnlyReadingStrategy)
+        assert [path.name for path in arrangement.strategy.read_paths] == [
+            "fake-file1.txt",
+            "fake-file2.txt",
+            "fake-file3.txt",
+            "fake-file2.txt",
+        ]
+        # the fake strategy has no colors left for the changed file
+        assert [color.description for color in result] == ["Magenta", "Orange"]
+
     def _when_directory_readed(
         self, arrangement: ColorReadingArrangement, should_be_recursively: bool = False
     ) -> Tuple[core.Color, ...]:
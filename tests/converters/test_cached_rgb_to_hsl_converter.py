@@ -0,0 +1,70 @@
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from harmony import convertions, core
+from tests.helpers import temporary_directory_context
+
+RGBS = [
+    core.RGB(212, 104, 4),
+    core.RGB(0, 0, 0),
+    core.RGB(255, 255, 255),
+    core.RGB(212, 104, 4),
+    core.RGB(12, 132, 255),
+]
+
+
+class TestCachedRGBToHSLConverter:
+    """Tests for the RGB to HSL converter that caches the conversions"""
+
+    @pytest.mark.parametrize(
+        "mode,expected_statistics",
+        [
+            (core.ConversionCacheMode.OFF, convertions.ConversionCacheStatistics(0, 5)),
+            (core.ConversionCacheMode.LRU, convertions.ConversionCacheStatistics(1, 4)),
+        ],
+    )
+    def test_converting_in_memory(
+        self,
+        mode: core.ConversionCacheMode,
+        expected_statistics: convertions.ConversionCacheStatistics,
+    ) -> None:
+        """Test converting the same as the uncached converter and counting the
+        conversions found in the cache"""
+        converter = convertions.CachedRGBToHSLConverter(mode)
+        result = self._when_converted(converter)
+
+        self._then_should_match_uncached_converter(result)
+        assert converter.get_statistics() == expected_statistics
+
+    def test_converting_with_lookup_table(self) -> None:
+        """Test building the lookup table on the first use and converting with it"""
+        with temporary_directory_context() as directory:
+            converter = convertions.CachedRGBToHSLConverter(
+                core.ConversionCacheMode.TABLE,
+                lookup_table=convertions.RGBToHSLLookupTable(
+                    directory.joinpath("rgb-to-hsl.lut")
+                ),
+            )
+            result = self._when_converted(converter)
+
+        self._then_should_match_uncached_converter(result)
+        assert converter.mode == core.ConversionCacheMode.TABLE
+        assert converter.get_statistics().hit_ratio == 1.0
+
+    def test_opening_missing_lookup_table(self) -> None:
+        """Test opening a lookup table that does not exist"""
+        result = convertions.RGBToHSLLookupTable(Path("not-a-table.lut")).open()
+
+        assert result is False
+
+    @staticmethod
+    def _when_converted(
+        converter: convertions.CachedRGBToHSLConverter,
+    ) -> List[core.HSL]:
+        return [converter.convert(rgb) for rgb in RGBS]
+
+    @staticmethod
+    def _then_should_match_uncached_converter(result: List[core.HSL]) -> None:
+        assert result == [convertions.RGB_TO_HSL_CONVERTER.convert(rgb) for rgb in RGBS]
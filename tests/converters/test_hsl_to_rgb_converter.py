@@ -1,5 +1,6 @@
-from typing import Callable
+from typing import Callable, List
 
+import numpy as np
 import pytest
 
 from harmony import convertions, core
@@ -21,6 +22,25 @@ class TestHSLToRGBConverter:
     def _then_should_get_rgb(self, result: core.RGB) -> None:
         assert result == core.RGB(50, 169, 82)
 
+    @pytest.mark.parametrize(
+        "hue,expected_rgb",
+        [
+            (0, core.RGB(255, 0, 0)),
+            (60, core.RGB(255, 255, 0)),
+            (120, core.RGB(0, 255, 0)),
+            (180, core.RGB(0, 255, 255)),
+            (240, core.RGB(0, 0, 255)),
+            (300, core.RGB(255, 0, 255)),
+        ],
+    )
+    def test_converting_hue_sector_borders(
+        self, hue: int, expected_rgb: core.RGB
+    ) -> None:
+        """Test converting the hues where each sector of 60 degrees starts"""
+        result = self._when_converted(core.HSL(hue, 1.0, 0.5))
+
+        assert result == expected_rgb
+
     def test_invalid_hue(self) -> None:
         """Test converting an invalid HSL object"""
         arrangement = self._given_invalid_hsl()
@@ -39,3 +59,47 @@ class TestHSLToRGBConverter:
 
     def _when_converted(self, arrangement: core.HSL) -> core.RGB:
         return convertions.HSLToRGBConverter().convert(arrangement)
+
+
+class TestHSLArrayToRGBConverter:
+    """Tests for the vectorized HSL to RGB converter"""
+
+    def test_converting_hsl_arrays(self) -> None:
+        """Test the RGB values are the same got converting the colors one by one,
+        including the components rounded half to even"""
+        arrangement = self._given_hsls()
+        result = self._when_converted(arrangement)
+        self._then_should_match_scalar_convertion(arrangement, result)
+
+    def test_invalid_hue(self) -> None:
+        """Test converting arrays with an invalid hue"""
+        with pytest.raises(exceptions.InvalidColorFormatException):
+            self._when_converted([core.HSL(0, 0.5, 0.5), core.HSL(360, 0.5, 0.5)])
+
+    @staticmethod
+    def _given_hsls() -> List[core.HSL]:
+        return [
+            core.HSL(hue, saturation / 10, luminosity / 10)
+            for hue in range(0, 360, 7)
+            for saturation in range(11)
+            for luminosity in range(11)
+        ]
+
+    @staticmethod
+    def _when_converted(arrangement: List[core.HSL]) -> np.ndarray:
+        return convertions.HSLArrayToRGBConverter().convert(
+            convertions.HSLArrays(
+                np.array([hsl.hue for hsl in arrangement]),
+                np.array([hsl.saturation for hsl in arrangement]),
+                np.array([hsl.luminosity for hsl in arrangement]),
+            )
+        )
+
+    @staticmethod
+    def _then_should_match_scalar_convertion(
+        arrangement: List[core.HSL], result: np.ndarray
+    ) -> None:
+        for hsl, (red, green, blue) in zip(arrangement, result.tolist()):
+            assert convertions.HSL_TO_RGB_CONVERTER.convert(hsl) == core.RGB(
+                red, green, blue
+            )
@@ -0,0 +1,71 @@
+from typing import List
+
+import numpy as np
+
+from harmony import convertions, core
+from harmony.color_sorting.service_layer.converters import (
+    RGBtoHSVConverter,
+    RGBToLuminosityConverter,
+)
+
+
+def make_rgbs() -> List[core.RGB]:
+    """Return random RGBs along with the black, white and magenta corners"""
+    random_generator = np.random.default_rng(0)
+    return [
+        core.RGB(*components)
+        for components in random_generator.integers(0, 256, (2000, 3)).tolist()
+    ] + [core.RGB(0, 0, 0), core.RGB(255, 255, 255), core.RGB(255, 0, 255)]
+
+
+class TestRGBArrayToHSLConverter:
+    """Tests for the vectorized RGB to HSL converter"""
+
+    def test_converting_rgb_array(self) -> None:
+        """Test the HSL values are the same got converting the colors one by one"""
+        arrangement = self._given_rgbs()
+        result = self._when_converted(arrangement)
+        self._then_should_match_scalar_convertion(arrangement, result)
+
+    def _given_rgbs(self) -> List[core.RGB]:
+        return make_rgbs()
+
+    def _when_converted(self, arrangement: List[core.RGB]) -> convertions.HSLArrays:
+        return convertions.RGBArrayToHSLConverter().convert(
+            np.array([[rgb.red, rgb.green, rgb.blue] for rgb in arrangement])
+        )
+
+    def _then_should_match_scalar_convertion(
+        self, arrangement: List[core.RGB], result: convertions.HSLArrays
+    ) -> None:
+        for index, rgb in enumerate(arrangement):
+            expected = convertions.RGBToHSLConverter().convert(rgb)
+            assert result.hue[index] == expected.hue
+            assert result.saturation[index] == expected.saturation
+            assert result.luminosity[index] == expected.luminosity
+
+
+class TestRGBArrayConverter:
+    """Tests for the vectorized converter of RGB to HSL, HSV and perceived luminosity"""
+
+    def test_converting_rgb_array(self) -> None:
+        """Test the values are the same got converting the colors one by one"""
+        arrangement = make_rgbs()
+        result = convertions.RGBArrayConverter().convert(
+            np.array([[rgb.red, rgb.green, rgb.blue] for rgb in arrangement])
+        )
+        self._then_should_match_scalar_convertion(arrangement, result)
+
+    @staticmethod
+    def _then_should_match_scalar_convertion(
+        arrangement: List[core.RGB], result: convertions.ColorArrays
+    ) -> None:
+        for index, rgb in enumerate(arrangement):
+            expected_hsv = RGBtoHSVConverter().convert(rgb)
+            assert result.hsv.hue[index] == expected_hsv.hue
+            assert result.hsv.saturation[index] == expected_hsv.saturation
+            assert result.hsv.value[index] == expected_hsv.value
+            assert (
+                result.luminosity[index]
+                == RGBToLuminosityConverter().convert(rgb).value
+            )
@@ -0,0 +1,17 @@
+import pytest
+
+from harmony import convertions, core
+
+
+class TestRGBToHSLConverter:
+    """Tests for the RGB to HSL converter"""
+
+    def test_converting_with_deprecated_alias(self) -> None:
+        """Test the deprecated alias declared on the class warns and converts as the
+        shared converter does"""
+        rgb = core.RGB(red=212, green=104, blue=4)
+
+        with pytest.deprecated_call():
+            result = convertions.RGBToHSLConverter().make_hsl_from_rgb(rgb)
+
+        assert result == convertions.RGB_TO_HSL_CONVERTER.convert(rgb)
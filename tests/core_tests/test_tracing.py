@@ -0,0 +1,49 @@
+import logging
+from typing import Any, Dict, List
+
+import pytest
+
+from harmony import core
+
+
+class TestTracing:
+    """Tests for logging the hot paths lazily"""
+
+    def test_skipping_data_when_level_is_disabled(self) -> None:
+        """Test not calculating the data of a message that is not logged"""
+        calls: List[str] = []
+        logger = self._given_logger(logging.WARNING)
+
+        core.log_lazily(
+            logger, logging.INFO, "%(value)s", lambda: self._get_data(calls)
+        )
+
+        assert not calls
+
+    def test_logging_data_when_level_is_enabled(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test calculating the data of a message that is logged"""
+        calls: List[str] = []
+        logger = self._given_logger(logging.INFO)
+
+        with caplog.at_level(logging.INFO, logger.name):
+            core.log_lazily(
+                logger, logging.INFO, "%(value)s", lambda: self._get_data(calls)
+            )
+
+        assert calls == ["called"]
+        assert caplog.messages == ["traced"]
+
+    @staticmethod
+    def _given_logger(level: int) -> logging.Logger:
+        logger = logging.getLogger("TestTracing")
+        logger.setLevel(level)
+
+        return logger
+
+    @staticmethod
+    def _get_data(calls: List[str]) -> Dict[str, Any]:
+        calls.append("called")
+
+        return {"value": "traced"}
@@ -0,0 +1,70 @@
+from typing import List
+
+from harmony import core
+
+
+class TestUniqueValues:
+    """Tests for removing the duplicated values keeping the order"""
+
+    def test_extracting_unique_values(self) -> None:
+        """Test the first occurrence of each value is kept in order"""
+        result = core.extract_unique_values_from_iterable([3, 1, 3, 2, 1])
+
+        assert result == [3, 1, 2]
+
+    def test_extracting_unique_colors(self) -> None:
+        """Test deduplicating colors with each deduplication key"""
+        arrangement = self._given_colors()
+
+        assert self._when_deduplicated(arrangement, core.DeduplicationKey.COLOR) == [
+            "red",
+            "blue",
+        ]
+        assert self._when_deduplicated(arrangement, core.DeduplicationKey.RGB) == [
+            "red",
+            "blue",
+        ]
+        assert self._when_deduplicated(
+            arrangement, core.DeduplicationKey.RGB_DESCRIPTION
+        ) == ["red", "scarlet", "blue"]
+        assert self._when_deduplicated(arrangement, core.DeduplicationKey.EXACT) == [
+            "red",
+            "scarlet",
+            "red",
+            "blue",
+        ]
+
+    @staticmethod
+    def _when_deduplicated(
+        arrangement: List[core.Color], deduplication_key: core.DeduplicationKey
+    ) -> List[str]:
+        return [
+            color.description
+            for color in core.extract_unique_colors(arrangement, deduplication_key)
+        ]
+
+    @staticmethod
+    def _given_colors() -> List[core.Color]:
+        return [
+            core.Color(
+                rgb=core.RGB(255, 0, 0),
+                hsl=core.HSL(0, 1.0, 0.5),
+                hexcode=hexcode,
+                original_format=original_format,
+                description=description,
+            )
+            for hexcode, original_format, description in (
+                ("#ff0000", core.ColorFormat.HEXCODE, "red"),
+                ("#ff0000", core.ColorFormat.HEXCODE, "scarlet"),
+                ("#FF0000", core.ColorFormat.RGB, "red"),
+                ("#ff0000", core.ColorFormat.HEXCODE, "red"),
+            )
+        ] + [
+            core.Color(
+                rgb=core.RGB(0, 0, 255),
+                hsl=core.HSL(240, 1.0, 0.5),
+                hexcode="#0000ff",
+                original_format=core.ColorFormat.HEXCODE,
+                description="blue",
+            )
+        ]
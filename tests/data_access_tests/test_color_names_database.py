@@ -0,0 +1,57 @@
+from pathlib import Path
+from typing import List, Optional
+
+from harmony import core, data_access
+from harmony.data_access.color_names_database import ColorNamesDatabase
+from tests.helpers import temporary_file_context
+
+
+class TestColorNamesDatabase:
+    """Tests for the binary database of color names"""
+
+    DIGEST = b"\x01" * 32
+
+    def test_reading_database(self) -> None:
+        """Test the color names read from the database are the ones written"""
+        with temporary_file_context() as database_path:
+            arrangement = self._given_database(database_path)
+            result = ColorNamesDatabase(database_path).read(self.DIGEST)
+
+        self._then_should_get_color_names(arrangement, result)
+
+    def _then_should_get_color_names(
+        self,
+        arrangement: List[core.ColorName],
+        result: Optional[List[core.ColorName]],
+    ) -> None:
+        assert result is not None
+        assert [color_name.name for color_name in result] == [
+            color_name.name for color_name in arrangement
+        ]
+        assert [color_name.hsl.get_field_values() for color_name in result] == [
+            color_name.hsl.get_field_values() for color_name in arrangement
+        ]
+
+    def test_reading_stale_database(self) -> None:
+        """Test a database built from another resource is not used"""
+        with temporary_file_context() as database_path:
+            self._given_database(database_path)
+            result = ColorNamesDatabase(database_path).read(b"\x02" * 32)
+
+        assert result is None
+
+    def test_reading_missing_database(self) -> None:
+        """Test reading a database that does not exist"""
+        result = ColorNamesDatabase(Path("not-a-database.bin")).read(self.DIGEST)
+
+        assert result is None
+
+    def _given_database(self, database_path: Path) -> List[core.ColorName]:
+        color_names = data_access.ColorNamesStorage().get_color_names_from_json()[:50]
+        ColorNamesDatabase(database_path).write(
+            color_names,
+            [core.RGB(0, 0, 0) for _ in color_names],
+            self.DIGEST,
+        )
+
+        return color_names
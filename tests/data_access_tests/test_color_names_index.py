@@ -0,0 +1,78 @@
+import random
+from typing import List, Sequence
+
+from harmony import core, data_access
+
+
+class TestColorNamesIndex:
+    """Tests for the spatial index of the color names"""
+
+    def test_finding_nearest_name(self) -> None:
+        """Test the index finds the same names a full sorting of the database would"""
+        arrangement = self._given_hsl_values()
+        result = self._when_names_are_searched(arrangement)
+        self._then_should_match_full_sorting(arrangement, result)
+
+    def _given_hsl_values(self) -> List[core.HSL]:
+        generator = random.Random(42)
+
+        return [
+            core.HSL(
+                generator.randint(0, 359),
+                generator.random(),
+                generator.random(),
+            )
+            for _ in range(500)
+        ] + [color_name.hsl for color_name in self._get_color_names()[:100]]
+
+    def _when_names_are_searched(self, arrangement: List[core.HSL]) -> List[str]:
+        return [
+            data_access.ColorNamesStorage().get_color_name_by_hsl(hsl)
+            for hsl in arrangement
+        ]
+
+    def _then_should_match_full_sorting(
+        self, arrangement: List[core.HSL], result: List[str]
+    ) -> None:
+        color_names = self._get_color_names()
+
+        for hsl, actual_name in zip(arrangement, result):
+            assert self._get_nearest_name_by_sorting(color_names, hsl) == actual_name
+
+    def test_breaking_ties(self) -> None:
+        """Test the first color name stored wins when two are equally near"""
+        arrangement = self._given_index_with_tie()
+        result = arrangement.find_nearest_name(core.HSL(100, 0.5, 0.5))
+        self._then_should_get_first_name(result)
+
+    def _given_index_with_tie(self) -> data_access.ColorNamesIndex:
+        return data_access.ColorNamesIndex(
+            [
+                core.ColorName("Far", core.HSL(300, 0.1, 0.9)),
+                core.ColorName("First", core.HSL(100, 0.4, 0.5)),
+                core.ColorName("Second", core.HSL(100, 0.6, 0.5)),
+                core.ColorName("Third", core.HSL(100, 0.5, 0.4)),
+            ]
+        )
+
+    def _then_should_get_first_name(self, result: str) -> None:
+        assert result == "First"
+
+    @staticmethod
+    def _get_color_names() -> List[core.ColorName]:
+        return data_access.ColorNamesStorage().get_color_names()
+
+    @staticmethod
+    def _get_nearest_name_by_sorting(
+        color_names: Sequence[core.ColorName], hsl: core.HSL
+    ) -> str:
+        return min(
+            color_names,
+            key=lambda color_name: sum(
+                [
+                    abs(hsl.hue - color_name.hsl.hue) / core.MAXIMUM_HUE_VALUE * 3,
+                    abs(hsl.saturation - color_name.hsl.saturation),
+                    abs(hsl.luminosity - color_name.hsl.luminosity),
+                ]
+            ),
+        ).name
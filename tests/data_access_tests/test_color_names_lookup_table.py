@@ -0,0 +1,106 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from harmony import convertions, core, data_access
+from harmony.core.constants import CACHE_DIRECTORY_ENVIRONMENT_VARIABLE
+from tests.helpers import temporary_file_context
+
+
+class TestNearestColorNameFinder:
+    """Tests for the vectorized search used for building the lookup table"""
+
+    def test_finding_nearest_indices(self) -> None:
+        """Test the names found are the same found by the color names index"""
+        arrangement = self._given_rgb_array()
+        result = data_access.NearestColorNameFinder(
+            data_access.ColorNamesStorage().get_color_names()
+        ).find_nearest_indices(
+            convertions.RGBArrayToHSLConverter().convert(arrangement)
+        )
+
+        self._then_should_match_index(arrangement, result.tolist())
+
+    @staticmethod
+    def _given_rgb_array():
+        # every 97th color of a slice of the cube, so many colors share each hue
+        return convertions.make_rgb_cube_slice(120, 122)[::97]
+
+    @staticmethod
+    def _then_should_match_index(rgb_array, result) -> None:
+        for (red, green, blue), name_index in zip(rgb_array.tolist(), result):
+            assert name_index == data_access.get_color_names_index().find_nearest_index(
+                convertions.RGBToHSLConverter().convert(core.RGB(red, green, blue))
+            )
+
+
+class TestColorNamesLookupTable:
+    """Tests for the lookup table with the names of all the RGB colors"""
+
+    def test_opening_missing_table(self) -> None:
+        """Test opening a table that does not exist"""
+        result = data_access.ColorNamesLookupTable(Path("not-a-table.lut")).open(
+            b"\x01" * 32
+        )
+
+        assert result is False
+
+    def test_opening_stale_table(self) -> None:
+        """Test a table built from another resource is not used"""
+        with temporary_file_context() as table_path:
+            self._given_table_file(table_path, b"\x02" * 32)
+            result = data_access.ColorNamesLookupTable(table_path).open(b"\x01" * 32)
+
+        assert result is False
+
+    def test_getting_name_index(self) -> None:
+        """Test getting the name index of a color from an opened table"""
+        with temporary_file_context() as table_path:
+            self._given_table_file(table_path, b"\x01" * 32)
+            lookup_table = data_access.ColorNamesLookupTable(table_path)
+            lookup_table.open(b"\x01" * 32)
+            result = lookup_table.get_name_index(core.RGB(1, 2, 3))
+
+        assert result == (1 << 16 | 2 << 8 | 3) % 1000
+
+    def test_naming_with_unwritable_cache_directory(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the colors are named with the index when the cache directory cannot
+        be created, and building the table fails without creating it"""
+        with temporary_file_context() as file_path:
+            self._given_cache_directory_inside_file(monkeypatch, file_path)
+
+            try:
+                result = data_access.ColorNamesStorage().get_color_name_by_rgb(
+                    core.RGB(255, 0, 0)
+                )
+
+                assert data_access.get_color_names_lookup_table() is None
+                assert result == data_access.get_color_names_index().find_nearest_name(
+                    convertions.RGBToHSLConverter().convert(core.RGB(255, 0, 0))
+                )
+                with pytest.raises(OSError):
+                    data_access.ColorNamesStorage().build_lookup_table()
+
+            finally:
+                data_access.get_color_names_lookup_table.cache_clear()
+
+    @staticmethod
+    def _given_cache_directory_inside_file(
+        monkeypatch: pytest.MonkeyPatch, file_path: Path
+    ) -> None:
+        # a directory cannot be created inside a regular file, not even by root
+        monkeypatch.setenv(
+            CACHE_DIRECTORY_ENVIRONMENT_VARIABLE, str(file_path / "harmony")
+        )
+        data_access.get_color_names_lookup_table.cache_clear()
+
+    @staticmethod
+    def _given_table_file(table_path: Path, digest: bytes) -> None:
+        table = data_access.ColorNamesLookupTable
+        table_path.write_bytes(
+            table.HEADER.pack(table.MAGIC, table.FORMAT_VERSION, digest)
+            + (np.arange(table.COLORS_COUNT) % 1000).astype(table.ITEM_TYPE).tobytes()
+        )
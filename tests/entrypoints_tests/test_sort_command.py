@@ -1,9 +1,12 @@
 import os
+from typing import Iterator
 
 import pytest
 from click.testing import Result
 from typer.testing import CliRunner
 
+from harmony import convertions
+from harmony.core.constants import CONVERSION_CACHE_ENVIRONMENT_VARIABLE
 from harmony.harmony.main import app
 from tests.helpers import get_temporary_file_path
 
@@ -39,6 +42,66 @@ class TestSortCommand:
         assert expected_message in actual_message
         assert expected_exit_code == actual_exit_code
 
+    def test_passing_file_with_workers(self, runner: CliRunner) -> None:
+        """Test reading the file with many processes"""
+        arrangements = self._given_file_with_colors()
+
+        try:
+            results = runner.invoke(app, ["sort", arrangements, "--workers", "2"])
+            self._then_should_show_success_message(results)
+
+        finally:
+            os.remove(arrangements)
+
+    def test_passing_file_with_stats(self, runner: CliRunner) -> None:
+        """Test showing the hit ratio of the conversion cache when the command ends"""
+        arrangements = self._given_file_with_colors()
+
+        try:
+            results = runner.invoke(app, ["--stats", "sort", arrangements])
+            self._then_should_show_success_message(results)
+
+        finally:
+            os.remove(arrangements)
+
+        assert "Conversion cache (" in results.output
+        assert "hit ratio" in results.output
+
+    @pytest.fixture
+    def restored_conversion_cache(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[None]:
+        # the option sets the environment variable for the worker processes
+        monkeypatch.delenv(CONVERSION_CACHE_ENVIRONMENT_VARIABLE, raising=False)
+        yield
+        monkeypatch.undo()
+        convertions.get_rgb_to_hsl_converter.cache_clear()
+
+    @pytest.mark.usefixtures("restored_conversion_cache")
+    def test_passing_file_with_conversion_cache(self, runner: CliRunner) -> None:
+        """Test choosing how the conversions are cached"""
+        arrangements = self._given_file_with_colors()
+
+        try:
+            results = runner.invoke(
+                app, ["--conversion-cache", "off", "--stats", "sort", arrangements]
+            )
+            self._then_should_show_success_message(results)
+
+        finally:
+            os.remove(arrangements)
+
+        assert os.environ[CONVERSION_CACHE_ENVIRONMENT_VARIABLE] == "off"
+        assert "Conversion cache (off): 0 hits" in results.output
+
+    def _given_file_with_colors(self) -> str:
+        temporary_file_path = get_temporary_file_path()
+
+        with open(temporary_file_path, "w", encoding="utf8") as file:
+            file.write("#ff0000 Red\nrgb(12, 132, 0) Green\nhsl(240, 100%, 50%) Blue")
+
+        return temporary_file_path
+
     def test_passing_invalid_file(self, runner: CliRunner):
         """Test passing invalid file to CLI"""
         arrangements = "not-a-file"
@@ -0,0 +1,74 @@
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+
+from harmony.from_image_reading.quantizations import (
+    ColorHistogram,
+    ColorQuantization,
+    KMeansQuantization,
+    MedianCutQuantization,
+    OctreeQuantization,
+    QuantizedPalette,
+)
+from harmony.from_image_reading.quantizations.palettes import make_palette
+
+
+class TestColorQuantizations:
+    """Tests for the algorithms that find the dominant colors of an image"""
+
+    @pytest.mark.parametrize(
+        "quantization",
+        [MedianCutQuantization(), KMeansQuantization(), OctreeQuantization()],
+    )
+    def test_quantizing_image_with_four_colors(
+        self, quantization: ColorQuantization
+    ) -> None:
+        """Test getting the four colors of an image, the most frequent first"""
+        arrangement = self._given_pixels_of_four_colors()
+        result = quantization.quantize(ColorHistogram.from_pixels(arrangement), 4)
+        self._then_should_get_the_four_colors(result)
+
+    def _given_pixels_of_four_colors(self) -> np.ndarray:
+        colors_and_counts: List[Tuple[Tuple[int, int, int], int]] = [
+            ((200, 30, 30), 400),
+            ((20, 120, 220), 300),
+            ((240, 240, 240), 200),
+            ((30, 160, 60), 100),
+        ]
+
+        return np.array(
+            [color for color, count in colors_and_counts for _ in range(count)],
+            dtype=np.uint8,
+        )
+
+    def _then_should_get_the_four_colors(self, result: QuantizedPalette) -> None:
+        assert [
+            [200, 30, 30],
+            [20, 120, 220],
+            [240, 240, 240],
+            [30, 160, 60],
+        ] == result.rgb_array.tolist()
+        assert [400, 300, 200, 100] == result.pixel_counts.tolist()
+
+    def test_making_histogram(self) -> None:
+        """Test grouping the pixels by the most significant bits of the components"""
+        arrangement = np.array([[0, 0, 0], [7, 7, 7], [8, 0, 255]], dtype=np.uint8)
+        result = ColorHistogram.from_pixels(arrangement)
+        self._then_should_group_pixels_in_bins(result)
+
+    def _then_should_group_pixels_in_bins(self, result: ColorHistogram) -> None:
+        assert [[0, 0, 0], [1, 0, 31]] == result.bins.tolist()
+        assert [2, 1] == result.counts.tolist()
+        assert [[7, 7, 7], [8, 0, 255]] == result.sums.tolist()
+
+    def test_merging_groups_with_the_same_mean(self) -> None:
+        """Test adding up the pixels of the groups whose means round to the same RGB"""
+        counts = np.array([100, 300, 0, 250])
+        sums = np.array([[1000, 0, 0], [0, 3000, 0], [0, 0, 0], [2510, 0, 0]])
+        result = make_palette(counts, sums)
+        self._then_should_merge_the_groups(result)
+
+    def _then_should_merge_the_groups(self, result: QuantizedPalette) -> None:
+        assert [[10, 0, 0], [0, 10, 0]] == result.rgb_array.tolist()
+        assert [350, 300] == result.pixel_counts.tolist()
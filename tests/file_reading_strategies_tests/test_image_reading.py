@@ -4,9 +4,12 @@ import tempfile
 from pathlib import Path
 from typing import List, Tuple
 
+from PIL import Image
+
 from harmony import core
+from harmony.from_image_reading.quantizations import MedianCutQuantization
 from harmony.from_image_reading.services import ImageFileReading
-from tests.helpers import TestResourceUtils
+from tests.helpers import TestResourceUtils, temporary_directory_context
 
 
 class TestImageReading:
@@ -24,6 +27,97 @@ class TestImageReading:
         finally:
             shutil.rmtree(temporary_directory_path)
 
+    def test_extract_unique_colors_from_image(self) -> None:
+        """Test extracting each distinct color once, in the order they first appear
+        column by column"""
+        temporary_directory_path = Path(tempfile.mkdtemp())
+
+        try:
+            arrangement = self._given_image_with_repeated_colors(
+                temporary_directory_path
+            )
+            result = self._when_image_is_passed(arrangement)
+            self._then_should_extract_each_color_once(list(result))
+
+        finally:
+            shutil.rmtree(temporary_directory_path)
+
+    def _given_image_with_repeated_colors(self, directory_path: Path) -> Path:
+        image_path = directory_path.joinpath("stripes.png")
+        image = Image.new(core.ImageModesForPIL.RGB_MODE, (16, 16), (0, 0, 255))
+        image.paste((255, 0, 0), (0, 0, 16, 12))
+
+        image.save(image_path)
+
+        return image_path
+
+    def _then_should_extract_each_color_once(self, result: List[core.Color]) -> None:
+        assert [core.RGB(255, 0, 0), core.RGB(0, 0, 255)] == [
+            color.rgb for color in result
+        ]
+
+    def test_extract_dominant_colors_from_image(self) -> None:
+        """Test extracting the dominant colors of an image in its full resolution"""
+        temporary_directory_path = Path(tempfile.mkdtemp())
+
+        try:
+            arrangement = self._given_image_with_repeated_colors(
+                temporary_directory_path
+            )
+            result = ImageFileReading(
+                quantization=MedianCutQuantization(), colors_count=4
+            ).read(arrangement)
+            self._then_should_extract_colors_with_pixel_counts(list(result))
+
+        finally:
+            shutil.rmtree(temporary_directory_path)
+
+    def _then_should_extract_colors_with_pixel_counts(
+        self, result: List[core.Color]
+    ) -> None:
+        assert [core.RGB(255, 0, 0), core.RGB(0, 0, 255)] == [
+            color.rgb for color in result
+        ]
+        assert result[0].description.endswith("(192 pixels)")
+        assert result[1].description.endswith("(64 pixels)")
+
+    def test_extract_from_big_jpeg(self) -> None:
+        """Test extracting the colors of a JPEG decoded in a smaller scale"""
+        temporary_directory_path = Path(tempfile.mkdtemp())
+
+        try:
+            arrangement = temporary_directory_path.joinpath("solid.jpg")
+            Image.new(core.ImageModesForPIL.RGB_MODE, (2048, 1024), (200, 30, 30)).save(
+                arrangement, quality=95
+            )
+            result = ImageFileReading().read(arrangement)
+            self._then_should_extract_the_solid_color(list(result))
+
+        finally:
+            shutil.rmtree(temporary_directory_path)
+
+    def _then_should_extract_the_solid_color(self, result: List[core.Color]) -> None:
+        assert len(result) == 1
+        assert abs(result[0].rgb_red - 200) <= 2
+        assert abs(result[0].rgb_green - 30) <= 2
+        assert abs(result[0].rgb_blue - 30) <= 2
+
+    def test_checking_readable_files(self) -> None:
+        """Test telling images apart from other files by their extension or their
+        first bytes"""
+        with temporary_directory_context() as directory:
+            directory.joinpath("image.jpeg").write_bytes(b"")
+            directory.joinpath("image-without-extension").write_bytes(
+                b"\x89PNG\r\n\x1a\n"
+            )
+            directory.joinpath("colors.txt").write_text("#ffffff White")
+            result = [
+                ImageFileReading().can_read(directory.joinpath(name))
+                for name in ("image.jpeg", "image-without-extension", "colors.txt")
+            ]
+
+        assert result == [True, True, False]
+
     def _get_image(self, temporary_directory_path: Path) -> Path:
         self._get_image_copy_path(temporary_directory_path).write_bytes(
             self._get_test_image_path().read_bytes()
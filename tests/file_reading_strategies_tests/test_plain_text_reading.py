@@ -9,6 +9,10 @@ from harmony.core import exceptions
 from tests.helpers import get_temporary_file_path
 
 
+class SmallChunksPlainTextFileReading(core_services.PlainTextFileReading):
+    PARALLEL_CHUNK_SIZE = 16
+
+
 class TestPlainTextFileReading:
     """Tests for the plain text file reading strategy"""
 
@@ -92,6 +96,93 @@ class TestPlainTextFileReading:
         for expected_name in expected_color_names:
             assert expected_name in actual_color_names
 
+    def test_iterating_file_in_chunks(self) -> None:
+        """Test reading the colors of a file lazily, in chunks"""
+        arrangement = self._given_file_with_duplicated_colors()
+
+        try:
+            result = self._when_file_is_iterated_in_chunks(arrangement)
+            self._then_should_yield_unique_colors_in_chunks(result)
+
+        finally:
+            os.remove(arrangement)
+
+    def _given_file_with_duplicated_colors(self) -> str:
+        temporary_file_path = get_temporary_file_path()
+
+        with open(temporary_file_path, "w", encoding="utf8") as colors_file:
+            colors_file.write(
+                "#ff0000 Red\n#00ff00 Green\n#ff0000 Red\n#0000ff Blue\n#000000 Black"
+            )
+
+        return temporary_file_path
+
+    def _when_file_is_iterated_in_chunks(
+        self, file_path: str
+    ) -> List[List[core.Color]]:
+        strategy = core_services.PlainTextFileReading(False)
+        return list(strategy.iterate_chunks(Path(file_path), chunk_size=3))
+
+    def _then_should_yield_unique_colors_in_chunks(
+        self, result: List[List[core.Color]]
+    ) -> None:
+        expected_descriptions = [["Red", "Green", "Blue"], ["Black"]]
+        actual_descriptions = [
+            [color.description for color in chunk] for chunk in result
+        ]
+
+        assert expected_descriptions == actual_descriptions
+
+    def test_reading_file_in_parallel(self) -> None:
+        """Test reading a file split into chunks by many processes"""
+        arrangement = self._given_file_with_duplicated_colors()
+
+        try:
+            result = self._when_file_is_read_in_parallel(arrangement)
+            self._then_should_read_the_same_colors(arrangement, result)
+
+        finally:
+            os.remove(arrangement)
+
+    def _when_file_is_read_in_parallel(self, file_path: str) -> Tuple[core.Color, ...]:
+        strategy = SmallChunksPlainTextFileReading(False, workers=2)
+        return strategy.read(Path(file_path))
+
+    def _then_should_read_the_same_colors(
+        self, file_path: str, result: Tuple[core.Color, ...]
+    ) -> None:
+        expected_colors = core_services.PlainTextFileReading(False).read(
+            Path(file_path)
+        )
+
+        assert [color.dict() for color in expected_colors] == [
+            color.dict() for color in result
+        ]
+
+    def test_splitting_file_into_chunks(self) -> None:
+        """Test splitting a file into chunks of whole lines"""
+        arrangement = self._given_file_with_duplicated_colors()
+
+        try:
+            result = core_services.split_text_file_into_chunks(Path(arrangement), 10)
+            self._then_should_split_after_line_breaks(result)
+
+        finally:
+            os.remove(arrangement)
+
+    def _then_should_split_after_line_breaks(
+        self, result: List[core_services.TextChunk]
+    ) -> None:
+        expected_lines = [
+            ["#ff0000 Red\n"],
+            ["#00ff00 Green\n"],
+            ["#ff0000 Red\n"],
+            ["#0000ff Blue\n"],
+            ["#000000 Black"],
+        ]
+
+        assert expected_lines == [list(chunk.read_lines()) for chunk in result]
+
     def _when_file_is_passed(self, file_path: str) -> Tuple[core.Color, ...]:
         strategy = core_services.PlainTextFileReading(True)
         return strategy.read(Path(file_path))
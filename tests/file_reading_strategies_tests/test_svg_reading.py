@@ -3,7 +3,7 @@ from typing import List, Tuple
 
 from harmony import core
 from harmony.from_svg_reading.service_layer.svg_file_reading import SVGFileReading
-from tests.helpers import TestResourceUtils
+from tests.helpers import TestResourceUtils, temporary_file_context
 
 
 class TestSVGReading:
@@ -15,6 +15,50 @@ class TestSVGReading:
         result = self._when_readed(arrangement)
         self._then_should_extract_its_colors(result)
 
+    def test_reading_nested_elements_in_document_order(self) -> None:
+        """Test reading the colors of nested elements in the order they are opened"""
+        with temporary_file_context() as file_path:
+            arrangement = self._given_svg_with_nested_elements(file_path)
+            result = self._when_readed(arrangement)
+
+        self._then_should_extract_colors_in_document_order(result)
+
+    def _given_svg_with_nested_elements(self, file_path: Path) -> Path:
+        file_path.write_text(
+            '<svg xmlns="http://www.w3.org/2000/svg" fill="#ff0000">'
+            + '<g stroke="#00ff00"><rect fill="#0000ff"/><g fill="#ffff00">'
+            + '<circle stroke="#00ffff"/></g></g><rect fill="#ff00ff"/></svg>'
+        )
+
+        return file_path
+
+    def _then_should_extract_colors_in_document_order(
+        self, result: Tuple[core.Color, ...]
+    ) -> None:
+        assert [color.hexcode.lower() for color in result] == [
+            "#ff0000",
+            "#00ff00",
+            "#0000ff",
+            "#ffff00",
+            "#00ffff",
+            "#ff00ff",
+        ]
+
+    def test_reading_repeated_paint_values_once(self) -> None:
+        """Test the elements with the same paint value get equal colors which are not
+        shared, so changing one does not change the others"""
+        with temporary_file_context() as file_path:
+            file_path.write_text(
+                '<svg xmlns="http://www.w3.org/2000/svg">'
+                + '<rect fill="#ff0000"/>' * 3
+                + '<rect fill="none" stroke="#ff0000"/></svg>'
+            )
+            result = self._when_readed(file_path)
+
+        assert len(result) == 4
+        assert all(color.dict() == result[0].dict() for color in result)
+        assert len({id(color) for color in result}) == 4
+
     def _given_valid_svg_file(self) -> Path:
         return Path(TestResourceUtils.get_resource("svg-to-read.svg"))
 
@@ -0,0 +1,58 @@
+import pydantic
+import pytest
+
+from harmony import core
+
+
+class TestColor:
+    """Tests for the color record"""
+
+    def test_getting_components(self) -> None:
+        """Test the components of the color are reachable from the color itself"""
+        result = self._given_color()
+
+        assert (result.rgb_red, result.rgb_green, result.rgb_blue) == (235, 61, 52)
+        assert (result.hsl_hue, result.hsl_saturation, result.hsl_luminosity) == (
+            2,
+            0.78,
+            0.56,
+        )
+        assert not hasattr(result, "__dict__")
+
+    def test_parsing_untrusted_data(self) -> None:
+        """Test making a color from untrusted data validates and converts it"""
+        result = core.Color.parse_obj(
+            {
+                "rgb": {"red": "235", "green": 61, "blue": 52},
+                "hsl": core.HSL(2, 0.78, 0.56),
+                "hexcode": "#eb3d34",
+                "original_format": "hexcode",
+                "description": "red",
+            }
+        )
+
+        assert result == self._given_color()
+        assert result.original_format == core.ColorFormat.HEXCODE
+
+    def test_parsing_invalid_data(self) -> None:
+        """Test making a color from invalid data"""
+        with pytest.raises(pydantic.ValidationError):
+            core.Color.parse_obj(
+                {
+                    "rgb": {"red": "red", "green": 61, "blue": 52},
+                    "hsl": core.HSL(2, 0.78, 0.56),
+                    "hexcode": "#eb3d34",
+                    "original_format": "hexcode",
+                    "description": "red",
+                }
+            )
+
+    @staticmethod
+    def _given_color() -> core.Color:
+        return core.Color(
+            rgb=core.RGB(235, 61, 52),
+            hsl=core.HSL(2, 0.78, 0.56),
+            hexcode="#eb3d34",
+            original_format=core.ColorFormat.HEXCODE,
+            description="red",
+        )
@@ -0,0 +1,36 @@
+import dataclasses
+import pickle
+
+import pytest
+
+from harmony import core
+
+
+class TestColorFormatModels:
+    """Tests for the frozen color format models"""
+
+    def test_comparing_models(self) -> None:
+        """Test the models are compared by their integer fields first and then by
+        their float fields as integers"""
+        arrangement = [core.HSL(3, 0.1, 0.2), core.HSL(1, 0.9, 0.2)]
+        result = sorted(arrangement)
+
+        assert result == [core.HSL(1, 0.9, 0.2), core.HSL(3, 0.1, 0.2)]
+        assert core.HSL(1, 0.901, 0.2) == core.HSL(1, 0.9, 0.2)
+        assert result[0].get_field_values() == (1, 90, 20)
+
+    def test_changing_frozen_model(self) -> None:
+        """Test the models can not be changed after made"""
+        arrangement = core.RGB(1, 2, 3)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            arrangement.red = 4  # type: ignore[misc]
+
+    def test_pickling_model(self) -> None:
+        """Test the models keep their comparison key after pickled"""
+        arrangement = core.HSV(10, 0.5, 0.25)
+        result = pickle.loads(pickle.dumps(arrangement))
+
+        assert result == arrangement
+        assert hash(result) == hash(arrangement)
+        assert not hasattr(result, "__dict__")
@@ -0,0 +1,142 @@
+import os
+import pathlib
+from typing import Dict, List, Tuple
+
+import pytest
+
+from harmony import core, core_services
+from harmony.core_services import extraction_records
+from tests.helpers import FakeFileReadingStrategy, temporary_directory_context
+
+READER_KEY = "FakeFileReadingStrategy:1"
+
+
+class TestExtractionCache:
+    """Tests for the on-disk cache of the colors extracted from files"""
+
+    def test_loading_colors_of_unchanged_files(self) -> None:
+        """Test loading the stored colors with all their fields while the files do not
+        change"""
+        with temporary_directory_context() as directory:
+            cache, file_path = self._given_cache_with_stored_file(directory)
+            result = self._when_loaded(cache, file_path)
+
+        self._then_should_load_stored_colors(result, file_path)
+
+    def _then_should_load_stored_colors(
+        self, result: Dict[str, Tuple[core.Color, ...]], file_path: str
+    ) -> None:
+        expected = FakeFileReadingStrategy.colors_queue[0]
+
+        assert list(result) == [file_path]
+        assert result[file_path][0].dict() == expected.dict()
+
+    def test_ignoring_changed_files(self) -> None:
+        """Test not loading the colors of a file whose size or modification time
+        changed"""
+        with temporary_directory_context() as directory:
+            cache, file_path = self._given_cache_with_stored_file(directory)
+            pathlib.Path(file_path).write_text("#ffffff White")
+            os.utime(file_path, ns=(0, 0))
+            result = self._when_loaded(cache, file_path)
+
+        assert not result
+
+    def test_loading_touched_files_by_their_contents(self) -> None:
+        """Test loading the colors of a file only touched when hashing the contents"""
+        with temporary_directory_context() as directory:
+            cache, file_path = self._given_cache_with_stored_file(directory, True)
+            os.utime(file_path, ns=(0, 0))
+            result = self._when_loaded(cache, file_path)
+
+        assert list(result) == [file_path]
+
+    def test_not_hashing_files_with_unchanged_modification_time(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the files with the cached modification time are loaded without hashing
+        their contents"""
+        with temporary_directory_context() as directory:
+            cache, file_path = self._given_cache_with_stored_file(directory, True)
+            hashed_paths = self._given_hashing_spy(monkeypatch)
+            result = self._when_loaded(cache, file_path)
+
+        assert list(result) == [file_path]
+        assert not hashed_paths
+
+    def test_keeping_modification_time_of_touched_files(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a file only touched is hashed once, since its new modification time is
+        kept after its contents match"""
+        with temporary_directory_context() as directory:
+            cache, file_path = self._given_cache_with_stored_file(directory, True)
+            os.utime(file_path, ns=(0, 0))
+            hashed_paths = self._given_hashing_spy(monkeypatch)
+            self._when_loaded(cache, file_path)
+            result = self._when_loaded(cache, file_path)
+
+        assert list(result) == [file_path]
+        assert hashed_paths == [file_path]
+
+    @staticmethod
+    def _given_hashing_spy(monkeypatch: pytest.MonkeyPatch) -> List[str]:
+        hashed_paths: List[str] = []
+        hash_file = extraction_records._hash_file
+
+        def spy(path: str) -> bytes:
+            hashed_paths.append(path)
+            return hash_file(path)
+
+        monkeypatch.setattr(extraction_records, "_hash_file", spy)
+
+        return hashed_paths
+
+    def test_pruning_deleted_files(self) -> None:
+        """Test removing the entries of the files no longer in the directory"""
+        with temporary_directory_context() as directory:
+            cache, file_path = self._given_cache_with_stored_file(directory)
+            cache.prune(
+                READER_KEY, core_services.DirectoryScan(str(directory), False, [])
+            )
+            result = self._when_loaded(cache, file_path)
+
+        assert not result
+
+    def test_keeping_subdirectory_files_when_not_recursive(self) -> None:
+        """Test a scan that is not recursive does not remove the entries of the files
+        in the subdirectories, which it does not find"""
+        with temporary_directory_context() as directory:
+            cache, file_path = self._given_cache_with_stored_file(
+                directory.joinpath("subdirectory")
+            )
+            cache.prune(
+                READER_KEY, core_services.DirectoryScan(str(directory), False, [])
+            )
+            result = self._when_loaded(cache, file_path)
+
+        assert list(result) == [file_path]
+
+    def _given_cache_with_stored_file(
+        self, directory: pathlib.Path, should_hash_contents: bool = False
+    ) -> Tuple[core_services.ExtractionCache, str]:
+        cache = core_services.ExtractionCache(
+            directory.joinpath("cache.sqlite3"), should_hash_contents
+        )
+        directory.mkdir(exist_ok=True)
+        file_path = str(directory.joinpath("colors.txt"))
+        pathlib.Path(file_path).write_text("#d46804 Orange")
+        cache.store(
+            READER_KEY,
+            {file_path: core_services.FileSignature.from_path(file_path)},
+            {file_path: (FakeFileReadingStrategy.colors_queue[0],)},
+        )
+
+        return cache, file_path
+
+    def _when_loaded(
+        self, cache: core_services.ExtractionCache, file_path: str
+    ) -> Dict[str, Tuple[core.Color, ...]]:
+        return cache.load(
+            READER_KEY, {file_path: core_services.FileSignature.from_path(file_path)}
+        )
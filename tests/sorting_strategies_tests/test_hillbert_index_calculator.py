@@ -0,0 +1,36 @@
+import numpy as np
+
+from harmony import core
+from harmony.color_sorting.service_layer.calculators import HillbertIndexCalculator
+
+
+class TestHillbertIndexCalculator:
+    """Tests for the Hillbert Curve index calculator"""
+
+    def test_calculating_many_indices(self) -> None:
+        """Test the indices calculated in batch are the same calculated one by one,
+        sampling the whole 8-bit cube at random"""
+        arrangement = self._given_rgb_array()
+        result = HillbertIndexCalculator().calculate_many(arrangement)
+        self._then_should_match_calculating_one_by_one(arrangement, result)
+
+    @staticmethod
+    def _given_rgb_array() -> np.ndarray:
+        corners = [
+            [red, green, blue]
+            for red in (0, 255)
+            for green in (0, 255)
+            for blue in (0, 255)
+        ]
+        return np.vstack(
+            [np.random.default_rng(0).integers(0, 256, (5000, 3)), corners]
+        )
+
+    @staticmethod
+    def _then_should_match_calculating_one_by_one(
+        arrangement: np.ndarray, result: np.ndarray
+    ) -> None:
+        assert result.tolist() == [
+            HillbertIndexCalculator().calculate(core.RGB(*components))
+            for components in arrangement.tolist()
+        ]
@@ -0,0 +1,70 @@
+import random
+from typing import Any, Callable, List, Tuple
+
+from harmony import color_factories, convertions, core
+from harmony.color_sorting.service_layer import sorting_strategies
+from harmony.color_sorting.service_layer.calculators import HillbertIndexCalculator
+from harmony.color_sorting.service_layer.converters import (
+    RGBtoHSVConverter,
+    RGBToLuminosityConverter,
+    RGBToSteppedHueValueAndSteppedLuminosity,
+)
+
+
+def _get_step_key(rgb: core.RGB) -> Tuple[Any, ...]:
+    hsv = RGBtoHSVConverter().convert(rgb)
+
+    return (
+        round(hsv.hue / core.MAXIMUM_HUE_VALUE * 8),
+        RGBToLuminosityConverter().convert(rgb).value,
+        round(hsv.value * 8),
+    )
+
+
+class TestKeyArraysSorting:
+    """Tests for sorting colors by the key arrays of the strategies"""
+
+    STRATEGIES_AND_KEYS: Tuple[
+        Tuple[sorting_strategies.SortingStrategy, Callable[[core.RGB], Any]], ...
+    ] = (
+        (sorting_strategies.RGBSorting(), lambda rgb: (rgb.red, rgb.green, rgb.blue)),
+        (sorting_strategies.HSVSorting(), RGBtoHSVConverter().convert),
+        (sorting_strategies.HSLSorting(), convertions.RGBToHSLConverter().convert),
+        (
+            sorting_strategies.LuminositySorting(),
+            lambda rgb: RGBToLuminosityConverter().convert(rgb).value,
+        ),
+        (sorting_strategies.StepSorting(), _get_step_key),
+        (
+            sorting_strategies.AlternatedStepSorting(),
+            RGBToSteppedHueValueAndSteppedLuminosity(8).convert,
+        ),
+        (sorting_strategies.HillbertSorting(), HillbertIndexCalculator().calculate),
+    )
+
+    def test_sorting_by_key_arrays(self) -> None:
+        """Test the colors are sorted the same way they are by the per-color keys"""
+        arrangement = self._given_colors()
+
+        for strategy, get_key in self.STRATEGIES_AND_KEYS:
+            result = strategy.sort(arrangement)  # type: ignore[arg-type]
+            self._then_should_match_sorting_by_key(get_key, arrangement, result)
+
+    @staticmethod
+    def _given_colors() -> List[core.Color]:
+        random_generator = random.Random(0)
+        return [
+            color_factories.ColorFactory().make_from_rgb(
+                core.RGB(*(random_generator.randint(0, 255) for _ in range(3))), ""
+            )
+            for _ in range(500)
+        ]
+
+    @staticmethod
+    def _then_should_match_sorting_by_key(
+        get_key: Callable[[core.RGB], Any],
+        arrangement: List[core.Color],
+        result: Tuple[core.Color, ...],
+    ) -> None:
+        expected = sorted(arrangement, key=lambda color: get_key(color.rgb))
+        assert [color.rgb for color in result] == [color.rgb for color in expected]
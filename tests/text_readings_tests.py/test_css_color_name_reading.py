@@ -0,0 +1,40 @@
+import pytest
+
+from harmony import core
+from harmony.core import exceptions
+from harmony.from_svg_reading.service_layer.basic_svg_readings import (
+    CSSColorNameReading,
+)
+
+
+class TestCSSColorNameReading:
+    """Tests for the CSS color names reading strategy"""
+
+    @pytest.mark.parametrize(
+        "color_name,expected_rgb",
+        [
+            ("RebeccaPurple", core.RGB(red=102, green=51, blue=153)),
+            ("cyan", core.RGB(red=0, green=255, blue=255)),
+            ("DARKSLATEGREY", core.RGB(red=47, green=79, blue=79)),
+        ],
+    )
+    def test_reading_color_name(self, color_name: str, expected_rgb: core.RGB) -> None:
+        """Test reading CSS color names in any case, including the aliases"""
+        assert CSSColorNameReading.match_pattern(color_name)
+        assert CSSColorNameReading().read(color_name).rgb == expected_rgb
+
+    def test_reading_color_name_not_shared(self) -> None:
+        """Test changing a color read does not change the next ones read"""
+        color = CSSColorNameReading().read("red")
+        color.description = "changed"
+        result = CSSColorNameReading().read("red")
+
+        assert result.description != "changed"
+
+    @pytest.mark.parametrize("keyword", ["transparent", "currentColor", "none"])
+    def test_reading_keyword_without_color(self, keyword: str) -> None:
+        """Test not reading a color from the keywords that do not name one"""
+        assert not CSSColorNameReading.match_pattern(keyword)
+
+        with pytest.raises(exceptions.InvalidColorFormatException):
+            CSSColorNameReading().read(keyword)
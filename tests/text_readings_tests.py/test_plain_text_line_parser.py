@@ -0,0 +1,61 @@
+from typing import Callable, List
+
+import pytest
+
+from harmony import core, core_services
+from harmony.core import exceptions
+
+
+class TestPlainTextLineParser:
+    """Tests for the parser of the lines in any of the plain text formats"""
+
+    def test_parsing_lines_in_every_format(self) -> None:
+        """Test parsing lines with hexcodes, RGB and HSL, with and without description"""
+        arrangement = self._given_lines_in_every_format()
+        result = self._when_parsed(arrangement)
+        self._then_should_get_the_same_colors_as_the_reading_strategies(
+            arrangement, result
+        )
+
+    def _given_lines_in_every_format(self) -> List[str]:
+        return [
+            "#6690ce Danube",
+            "#69c",
+            "rgb(102,144,206) Danube",
+            "RGB( 102 , 144 , 206 )",
+            "hsl(216, 52%, 60%) Danube",
+            "HSL(216,52%,60%)",
+        ]
+
+    def _when_parsed(self, arrangement: List[str]) -> List[core.Color]:
+        parser = core_services.PlainTextLineParser()
+        return [parser.parse(line) for line in arrangement]
+
+    def _then_should_get_the_same_colors_as_the_reading_strategies(
+        self, arrangement: List[str], result: List[core.Color]
+    ) -> None:
+        expected_colors = [
+            core_services.HexcodeTextReading().do_read(arrangement[0]),
+            core_services.HexcodeTextReading().do_read(arrangement[1]),
+            core_services.RGBTextReading().do_read(arrangement[2]),
+            core_services.RGBTextReading().do_read(arrangement[3]),
+            core_services.HSLTextReading().do_read(arrangement[4]),
+            core_services.HSLTextReading().do_read(arrangement[5]),
+        ]
+
+        assert [color.dict() for color in expected_colors] == [
+            color.dict() for color in result
+        ]
+
+    def test_parsing_invalid_line(self) -> None:
+        """Test parsing a line that does not match any format"""
+        arrangement = "rgb(722,323,-23)"
+
+        def result() -> None:
+            core_services.PlainTextLineParser().parse(arrangement)
+
+        self._then_should_raise_invalid_color(result)
+
+    def _then_should_raise_invalid_color(self, result: Callable[[], None]) -> None:
+        with pytest.raises(exceptions.InvalidColorException):
+            result()
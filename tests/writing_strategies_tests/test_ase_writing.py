@@ -1,10 +1,17 @@
 import os
 from pathlib import Path
-from typing import Tuple
+from typing import Iterator, Tuple
+
+import pytest
 
 from harmony import core
+from harmony.core import exceptions
 from harmony.to_ase_convertion.services import ASEWriting
-from tests.helpers import TestResourceUtils, get_temporary_file_path
+from tests.helpers import (
+    TestResourceUtils,
+    get_temporary_file_path,
+    temporary_file_context,
+)
 
 
 class TestASEWriting:
@@ -38,6 +45,50 @@ class TestASEWriting:
             result == Path(TestResourceUtils.get_resource("correct.ase")).read_bytes()
         )
 
+    def test_write_in_chunks(self) -> None:
+        """Test writting ".ase" file chunk by chunk"""
+        arrangement = self._given_colors()
+        result = self._when_colors_are_passed_in_chunks(arrangement)
+        self._then_should_write_to_ase_file(result)
+
+    def _when_colors_are_passed_in_chunks(
+        self, arrangement: Tuple[core.Color, ...]
+    ) -> bytes:
+        temporary_file = get_temporary_file_path(suffix=".ase")
+
+        ASEWriting("test").write_chunks(
+            [arrangement[:2], (), arrangement[2:]], temporary_file
+        )
+
+        colors_file_content = Path(temporary_file).read_bytes()
+        os.remove(temporary_file)
+
+        return colors_file_content
+
+    def test_write_in_chunks_with_invalid_color(self) -> None:
+        """Test an invalid color in the middle of the chunks keeps the file that
+        existed and leaves no temporary file behind"""
+        arrangement = self._given_colors()
+
+        with temporary_file_context() as final_file_path:
+            final_file_path.write_bytes(b"previous palette")
+
+            with pytest.raises(exceptions.InvalidColorException):
+                ASEWriting("test").write_chunks(
+                    self._get_chunks_with_invalid_color(arrangement),
+                    str(final_file_path),
+                )
+
+            assert final_file_path.read_bytes() == b"previous palette"
+            assert list(final_file_path.parent.glob(f"{final_file_path.name}.*")) == []
+
+    @staticmethod
+    def _get_chunks_with_invalid_color(
+        arrangement: Tuple[core.Color, ...],
+    ) -> Iterator[Tuple[core.Color, ...]]:
+        yield arrangement[:2]
+        raise exceptions.InvalidColorException("notacolor is not a valid color")
+
     def _given_colors(self) -> Tuple[core.Color, ...]:
         return (
             core.Color(
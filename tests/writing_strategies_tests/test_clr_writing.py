@@ -34,6 +34,33 @@ class TestCLRWriting:
 
         self._then_should_raise_invalid_file(result)
 
+    def test_writing_in_chunks(self) -> None:
+        """Test writing the colors chunk by chunk results in the same file"""
+        arrangement = self._given_colors()
+        result = self._when_colors_are_passed_in_chunks(arrangement)
+        self._then_should_write_the_same_file(arrangement, result)
+
+    def _when_colors_are_passed_in_chunks(
+        self, arrangement: Tuple[core.Color, ...]
+    ) -> bytes:
+        temporary_file = get_temporary_file_path(suffix=".clr")
+
+        CLRWriting().write_chunks(
+            [arrangement[:1], (), arrangement[1:]], temporary_file
+        )
+
+        with open(temporary_file, "rb") as colors_file:
+            colors_file_content = colors_file.read()
+
+        os.remove(temporary_file)
+
+        return colors_file_content
+
+    def _then_should_write_the_same_file(
+        self, arrangement: Tuple[core.Color, ...], result: bytes
+    ) -> None:
+        assert self._when_colors_are_passed_writing_as_clr(arrangement) == result
+
     def _given_zero_colors(self) -> Tuple[core.Color, ...]:
         return ()
 